@@ -0,0 +1,9 @@
+# Shared ranking core used by every CFP entry point (CLI, simulation, batch, incremental, benchmark)
+from .bracket import populate_con_champs_and_top_teams, print_bracket
+from .config import CONFERENCE_CHAMPS
+from .engines import DEFAULT_ENGINE, ENGINES, ScoringEngine, rank_teams
+from .fetch import FETCH_BACKENDS, fixture_backend
+from .output import OUTPUT_BACKENDS
+from .report import REPORT_WRITERS, write_report
+from .season import SeasonData, SeasonGraph, SeasonStats, load_season_data
+from .trace import TRACE_FORMATS, NullTracer, Tracer, get_tracer, set_tracer, tracing
@@ -0,0 +1,5 @@
+from .cli import main
+
+# Main
+if __name__ == "__main__":
+    main()
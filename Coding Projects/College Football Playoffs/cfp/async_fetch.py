@@ -0,0 +1,128 @@
+import asyncio
+import json
+import random
+import time
+
+import aiohttp
+
+from .cache import cache_lookup, conditional_headers, endpoint_name, store_entry, touch_entry
+from .trace import get_tracer
+
+API_BASE_URL = "https://api.collegefootballdata.com"
+
+MAX_CONCURRENT_REQUESTS = 8  # Cap on in-flight requests sharing one keep-alive session
+MAX_RETRIES = 4
+BACKOFF_BASE_SECONDS = 0.5
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+REQUEST_TIMEOUT_SECONDS = 60
+
+# /games is fetched one week at a time so the large season payload downloads in parallel
+REGULAR_SEASON_WEEKS = range(1, 17)
+
+
+#######################################################
+#                                                     #
+#                    Async Client                     #
+#                                                     #
+#######################################################
+# Function to wait before the next retry, honouring Retry-After when the API sends it
+async def backoff(attempt, retry_after=None):
+    if retry_after is not None:
+        try:
+            await asyncio.sleep(float(retry_after))
+            return
+        except ValueError:
+            pass  # HTTP-date form: fall back to exponential backoff
+    await asyncio.sleep(BACKOFF_BASE_SECONDS * (2 ** attempt) * (1 + random.random()))
+
+# Function to GET one endpoint through the on-disk cache with bounded concurrency and retries.
+# Cache reads and writes are blocking SQLite calls (with a busy timeout), so they run on a
+# worker thread and a locked cache never stalls the other requests on the event loop
+async def fetch_json(session, semaphore, path, params, headers):
+    url = API_BASE_URL + path
+    key, entry, data = await asyncio.to_thread(cache_lookup, url, params)
+    if data is not None:
+        return data
+
+    tracer = get_tracer()
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            async with semaphore:
+                started = time.perf_counter()
+                async with session.get(url, params=params, headers=conditional_headers(headers, entry)) as response:
+                    if response.status == 304 and entry is not None:
+                        tracer.request(path, response.status, time.perf_counter() - started)
+                        await asyncio.to_thread(touch_entry, key)
+                        return json.loads(entry[0])
+                    if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                        tracer.request(path, response.status, time.perf_counter() - started)
+                        retry_after = response.headers.get("Retry-After")
+                    else:
+                        response.raise_for_status()
+                        raw = await response.read()
+                        tracer.request(path, response.status, time.perf_counter() - started, len(raw))
+                        body = raw.decode(response.get_encoding())
+                        await asyncio.to_thread(
+                            store_entry, key, body, response.headers.get("ETag"), response.headers.get("Last-Modified")
+                        )
+                        return json.loads(body)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            tracer.request(path, "error", time.perf_counter() - started)
+            if attempt == MAX_RETRIES:
+                if entry is not None:
+                    tracer.cache(endpoint_name(url), "stale_fallback")
+                    return json.loads(entry[0])  # Serve stale data rather than failing the run
+                raise
+            retry_after = None
+        await backoff(attempt, retry_after)
+
+# Function to fetch the season's games week by week and merge them back into one list
+async def fetch_games(session, semaphore, year, headers):
+    week_requests = [
+        fetch_json(session, semaphore, "/games", {"year": year, "week": week, "seasonType": "regular"}, headers)
+        for week in REGULAR_SEASON_WEEKS
+    ]
+    games = []
+    seen = set()
+    for week_games in await asyncio.gather(*week_requests):
+        for game in week_games:
+            if game.get("id") not in seen:
+                seen.add(game.get("id"))
+                games.append(game)
+    return games
+
+# Function to fetch records, offense PPA, defense PPA and games for one season over a shared session
+async def fetch_season(session, semaphore, year, headers):
+    return await asyncio.gather(
+        fetch_json(session, semaphore, "/records", {"year": year}, headers),
+        fetch_json(session, semaphore, "/ppa/teams", {"year": year, "type": "offense"}, headers),
+        fetch_json(session, semaphore, "/ppa/teams", {"year": year, "type": "defense"}, headers),
+        fetch_games(session, semaphore, year, headers)
+    )
+
+# Function to open the keep-alive session every request of a run shares
+def client_session():
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+async def fetch_seasons_async(years, headers):
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    async with client_session() as session:
+        return await asyncio.gather(*(fetch_season(session, semaphore, year, headers) for year in years))
+
+async def fetch_games_async(year, headers):
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    async with client_session() as session:
+        return await fetch_games(session, semaphore, year, headers)
+
+# Blocking entry point for the ranking scripts: raw (records, offense, defense, games) JSON per year
+def fetch_seasons_concurrently(years, headers):
+    return asyncio.run(fetch_seasons_async(list(years), headers))
+
+def fetch_season_concurrently(year, headers):
+    return fetch_seasons_concurrently([year], headers)[0]
+
+# Blocking entry point for a season's games alone (e.g. the weekly incremental update)
+def fetch_games_concurrently(year, headers):
+    return asyncio.run(fetch_games_async(year, headers))
@@ -0,0 +1,104 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+from .config import CONFERENCE_CHAMPS
+from .engines import rank_teams
+from .incremental import game_result
+from .report import write_report
+from .season import load_season_data
+
+# Conference champions per season; seasons not listed take the winners of their
+# conference championship games in the fetched /games data
+CONFERENCE_CHAMPS_BY_YEAR = {
+    2024: CONFERENCE_CHAMPS
+}
+
+FETCH_WORKERS = 8  # Seasons downloaded at the same time (each season fetches its 4 endpoints concurrently)
+
+
+#######################################################
+#                                                     #
+#                 Multi-Season Batch                  #
+#                                                     #
+#######################################################
+# Function to find a season's conference champions: winners of the games between two teams
+# of the same conference whose notes mark them as a championship game (e.g. "SEC Championship")
+def conference_champions(schedules):
+    champs = []
+    for game in schedules:
+        conference = game.get("home_conference")
+        if not conference or conference != game.get("away_conference"):
+            continue
+        if "championship" not in (game.get("notes") or "").lower():
+            continue
+        result = game_result(game)
+        if result and result[0] not in champs:
+            champs.append(result[0])
+    return champs
+
+# Function to pick the champion list for a season, warning when neither the
+# hardcoded lists nor the season's games name any champions
+def season_champions(season):
+    champs = CONFERENCE_CHAMPS_BY_YEAR.get(season.year) or conference_champions(season.schedules)
+    if not champs:
+        print(f"Warning: no conference champions found for {season.year}; ranking without the champ bonus")
+    return champs
+
+# Worker entry point: rank one already-fetched season
+def rank_season(season, conference_champs, top_n):
+    df = rank_teams(
+        season.year,
+        season=season,
+        conference_champs=conference_champs,
+        top_n=top_n
+    )
+    df.insert(0, "Rank", range(1, len(df) + 1))
+    df.insert(0, "Year", season.year)
+    return df
+
+# Function to rank a range of seasons: fetch every year concurrently and
+# hand each season to a scoring worker as soon as its data arrives
+def rank_seasons(years, workers=None, top_n=None):
+    years = list(years)
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(years))) as fetch_pool, \
+            ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as score_pool:
+        fetches = [fetch_pool.submit(load_season_data, year) for year in years]
+        scoring = {}
+        for fetch in as_completed(fetches):
+            season = fetch.result()
+            scoring[score_pool.submit(rank_season, season, season_champions(season), top_n)] = season.year
+        for future in as_completed(scoring):
+            results[scoring[future]] = future.result()
+
+    # Combined table in season order
+    return pd.concat([results[year] for year in years], ignore_index=True)
+
+# Function to write the combined table; the format follows the extension (.csv, .txt, .html, .json or .xlsx)
+def write_results(df, path):
+    if path.endswith(".xlsx"):
+        df.to_excel(path, index=False)
+    else:
+        write_report(df, path)
+    print(f"Results saved to: {os.path.abspath(path)}")
+
+
+# Main
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rank a range of seasons in parallel")
+    parser.add_argument("--start", type=int, default=2014, help="First season to rank")
+    parser.add_argument("--end", type=int, default=2024, help="Last season to rank (inclusive)")
+    parser.add_argument("--workers", type=int, default=None, help="Scoring processes (default: CPU count)")
+    parser.add_argument("--top", type=int, default=None, help="Keep only the top N teams per season")
+    parser.add_argument("--output", default=None, help="Output file (default: cfp_rankings_<start>_<end>.csv)")
+    args = parser.parse_args()
+
+    try:
+        rankings = rank_seasons(range(args.start, args.end + 1), args.workers, args.top)
+        print(f"Ranked {rankings['Year'].nunique()} seasons, {len(rankings)} team-seasons")
+        write_results(rankings, args.output or f"cfp_rankings_{args.start}_{args.end}.csv")
+    except Exception as e:
+        print(f"An error occurred: {e}")
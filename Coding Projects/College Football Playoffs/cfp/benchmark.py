@@ -0,0 +1,209 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from .bracket import populate_con_champs_and_top_teams, print_bracket
+from .config import CONFERENCE_CHAMPS, CONFERENCE_POINTS
+from .engines import ENGINES
+from .fetch import fetch_async, fixture_backend, write_fixture
+from .scoring import add_points_for_conference_champs
+from .season import load_season_data
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures")
+
+# Synthetic season shape at scale 1 (roughly FBS + FCS)
+SYNTHETIC_TEAMS = 260
+SYNTHETIC_GAMES_PER_TEAM = 12
+SYNTHETIC_WEEKS = 15
+
+STAGES = ["fetch", "base", "sos", "best_win", "lowest_loss", "sort", "bracket"]
+
+
+#######################################################
+#                                                     #
+#                      Fixtures                       #
+#                                                     #
+#######################################################
+# Function to record a live season (raw API JSON) as a replayable fixture
+def record_fixture(year, directory=FIXTURES_DIR):
+    return write_fixture(os.path.join(directory, str(year)), fetch_async(year))
+
+# Function to write a deterministic synthetic season in the same raw API shape,
+# scaled to `scale` times the teams and games of a real season
+def write_synthetic_fixture(path, scale=1, seed=0):
+    rng = random.Random(seed)
+    conferences = list(CONFERENCE_POINTS) + ["FCS"]
+    teams = list(CONFERENCE_CHAMPS) + [f"Team {i}" for i in range(SYNTHETIC_TEAMS * scale - len(CONFERENCE_CHAMPS))]
+    team_conference = {team: rng.choice(conferences) for team in teams}
+
+    games = []
+    records = {team: {"wins": 0, "losses": 0, "ties": 0} for team in teams}
+    for game_id in range(len(teams) * SYNTHETIC_GAMES_PER_TEAM // 2):
+        home_team, away_team = rng.sample(teams, 2)
+        home_points, away_points = rng.randint(0, 56), rng.randint(0, 56)
+        if home_points == away_points:
+            home_points += 3
+        winner, loser = (home_team, away_team) if home_points > away_points else (away_team, home_team)
+        records[winner]["wins"] += 1
+        records[loser]["losses"] += 1
+        games.append({
+            "id": game_id,
+            "season": 2024,
+            "week": game_id % SYNTHETIC_WEEKS + 1,
+            "season_type": "regular",
+            "home_team": home_team,
+            "home_conference": team_conference[home_team],
+            "home_points": home_points,
+            "away_team": away_team,
+            "away_conference": team_conference[away_team],
+            "away_points": away_points
+        })
+
+    payloads = {
+        "records": [
+            {"year": 2024, "team": team, "conference": team_conference[team],
+             "total": dict(records[team], games=sum(records[team].values()))}
+            for team in teams
+        ],
+        "offense": [
+            {"team": team, "conference": team_conference[team], "offense": {"overall": rng.uniform(-0.2, 0.6)}}
+            for team in teams
+        ],
+        "defense": [
+            {"team": team, "conference": team_conference[team], "defense": {"overall": rng.uniform(-0.1, 0.4)}}
+            for team in teams
+        ],
+        "games": games
+    }
+    return write_fixture(path, [payloads[name] for name in ("records", "offense", "defense", "games")])
+
+# Function to replay a fixture directory into a SeasonData (the "fetch" stage)
+def load_fixture(path, year=2024):
+    return load_season_data(year, fixture_backend(path))
+
+
+#######################################################
+#                                                     #
+#                   Benchmark Runner                  #
+#                                                     #
+#######################################################
+# Function to run the full pipeline once, calling `measure(stage, func)` around every stage;
+# the engines are the same ones rank_teams uses (cfp.engines.ENGINES)
+def run_pipeline(path, engine, measure):
+    season = measure("fetch", lambda: load_fixture(path))
+    team_scores = measure(
+        "base", lambda: add_points_for_conference_champs(
+            season.teams.ids_for(CONFERENCE_CHAMPS), engine.score_teams(season)
+        )
+    )
+    measure("sos", lambda: engine.strength_of_schedule(season, team_scores))
+    measure("best_win", lambda: engine.best_win(season, team_scores))
+    measure("lowest_loss", lambda: engine.lowest_loss(season, team_scores))
+    df = measure("sort", lambda: pd.DataFrame(team_scores).sort_values(by="Total Points", ascending=False).head(50))
+
+    def bracket():
+        final_12_teams = populate_con_champs_and_top_teams(season.teams.ids_for(CONFERENCE_CHAMPS), df.to_dict("records"))
+        with contextlib.redirect_stdout(io.StringIO()):
+            print_bracket(final_12_teams)
+    measure("bracket", bracket)
+    return season
+
+# Function to time each stage (best of `repeat`) and record its peak traced memory
+def benchmark(path, engine_name, repeat=3):
+    engine = ENGINES[engine_name]
+    timings = {stage: float("inf") for stage in STAGES}
+
+    def timed(stage, func):
+        start = time.perf_counter()
+        result = func()
+        timings[stage] = min(timings[stage], time.perf_counter() - start)
+        return result
+
+    for _ in range(repeat):
+        season = run_pipeline(path, engine, timed)
+
+    # Separate pass for memory so tracing overhead does not skew the timings
+    # (worker processes of the process-pool engine are not traced)
+    peaks = {}
+
+    def traced(stage, func):
+        tracemalloc.reset_peak()
+        result = func()
+        peaks[stage] = tracemalloc.get_traced_memory()[1]
+        return result
+
+    tracemalloc.start()
+    try:
+        run_pipeline(path, engine, traced)
+    finally:
+        tracemalloc.stop()
+
+    num_teams = len(season.records)
+    num_games = len(season.schedules)
+    rows = []
+    for stage in STAGES:
+        items, unit = (num_games, "games") if stage in ("fetch", "sos", "best_win", "lowest_loss") else (num_teams, "teams")
+        rows.append({
+            "Engine": engine_name,
+            "Stage": stage,
+            "Seconds": timings[stage],
+            "Throughput": items / timings[stage] if timings[stage] > 0 else float("inf"),
+            "Unit": f"{unit}/s",
+            "Peak MB": peaks[stage] / 1e6
+        })
+    return rows, num_teams, num_games
+
+# Print one dataset's results as a stage-by-engine table
+def print_results(dataset, num_teams, num_games, rows):
+    print(f"\n{dataset}: {num_teams:,} teams, {num_games:,} games")
+    for row in rows:
+        print(
+            f"  {row['Engine']:<16} {row['Stage']:<12} | "
+            f"{row['Seconds'] * 1000:10.2f} ms | "
+            f"{row['Throughput']:14,.0f} {row['Unit']:<8} | "
+            f"peak {row['Peak MB']:8.2f} MB"
+        )
+
+
+# Main
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the ranking pipeline on replayed fixtures")
+    parser.add_argument("--record", type=int, metavar="YEAR", help="Record a live season into fixtures/ and exit")
+    parser.add_argument("--fixture", action="append", default=[], help="Recorded fixture directory to replay")
+    parser.add_argument("--scales", default="1,10,100", help="Synthetic season scales to generate (empty for none)")
+    parser.add_argument("--engines", default=",".join(ENGINES), help="Engines to compare")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage (best is reported)")
+    parser.add_argument("--json", help="Also write all results to this JSON file")
+    args = parser.parse_args()
+
+    if args.record:
+        print(f"Fixture recorded to: {record_fixture(args.record)}")
+        raise SystemExit
+
+    with tempfile.TemporaryDirectory() as synthetic_dir:
+        datasets = [(os.path.basename(os.path.normpath(path)), path) for path in args.fixture]
+        for scale in filter(None, args.scales.split(",")):
+            path = write_synthetic_fixture(os.path.join(synthetic_dir, f"x{scale}"), int(scale))
+            datasets.append((f"synthetic x{scale}", path))
+
+        all_rows = []
+        for dataset, path in datasets:
+            dataset_rows = []
+            for engine_name in args.engines.split(","):
+                rows, num_teams, num_games = benchmark(path, engine_name, args.repeat)
+                dataset_rows.extend(dict(row, Dataset=dataset) for row in rows)
+            print_results(dataset, num_teams, num_games, dataset_rows)
+            all_rows.extend(dataset_rows)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(all_rows, f, indent=2)
+        print(f"\nResults saved to: {os.path.abspath(args.json)}")
@@ -0,0 +1,36 @@
+import sys
+
+import pandas as pd
+
+from .report import bracket_lines, write_lines
+
+
+#######################################################
+#                                                     #
+#                  Playoff Selection                  #
+#                                                     #
+#######################################################
+# New function to combine hardcoded teams with top teams and resort
+# `hardcoded_ids` are team IDs (TeamRegistry.ids_for); auto-bid teams are flagged in "Auto Bid"
+def populate_con_champs_and_top_teams(hardcoded_ids, team_scores, num_spots=12):
+    # Convert hardcoded teams to DataFrame
+    hardcoded_df = pd.DataFrame(
+        [dict(team, **{"Auto Bid": True}) for team in team_scores if team["Team ID"] in hardcoded_ids]
+    )
+    remaining_spots = num_spots - len(hardcoded_df)
+    
+    # Select top-scoring teams not in the hardcoded list
+    filtered_scores = [dict(team, **{"Auto Bid": False}) for team in team_scores if team["Team ID"] not in hardcoded_ids]
+    remaining_df = pd.DataFrame(filtered_scores).sort_values(by="Total Points", ascending=False).head(remaining_spots)
+    
+    # Combine hardcoded and remaining teams
+    final_teams_df = pd.concat([hardcoded_df, remaining_df], ignore_index=True)
+    
+    # Resort the combined DataFrame based on total points
+    final_teams_df = final_teams_df.sort_values(by="Total Points", ascending=False)
+    
+    return final_teams_df
+
+# Create and print the tournament bracket
+def print_bracket(final_teams_df):
+    write_lines(sys.stdout, bracket_lines(final_teams_df))
@@ -0,0 +1,164 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from urllib.parse import urlsplit
+
+import requests
+
+from .trace import get_tracer
+
+# Cache location and behaviour (override with environment variables)
+CACHE_PATH = os.getenv(
+    "CFP_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "cfp", "http_cache.sqlite")
+)
+OFFLINE = os.getenv("CFP_OFFLINE", "0") == "1"  # Serve only from the cache, never hit the API
+
+# Time-to-live in seconds
+COMPLETED_SEASON_TTL = 30 * 24 * 60 * 60  # Finished seasons rarely change
+CURRENT_SEASON_TTL = {
+    "/games": 15 * 60,  # Scores change every weekend
+    "/records": 60 * 60,
+    "/ppa/teams": 6 * 60 * 60
+}
+DEFAULT_CURRENT_SEASON_TTL = 60 * 60
+
+# A season (fall of `year`) is complete once the bowls are over
+SEASON_END_MONTH = 2
+
+
+#######################################################
+#                                                     #
+#                    Cache Storage                    #
+#                                                     #
+#######################################################
+# Function to open the cache database (creating it on first use) for one transaction;
+# the connection is committed or rolled back, then always closed
+@contextmanager
+def connect():
+    directory = os.path.dirname(CACHE_PATH)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(CACHE_PATH, timeout=30)
+    try:
+        with conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    body TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+            yield conn
+    finally:
+        conn.close()
+
+# Function to build a stable key from the endpoint and its query parameters
+def cache_key(url, params):
+    return url + "?" + json.dumps(params or {}, sort_keys=True)
+
+# Function to name an endpoint for tracing (the URL path, e.g. "/games")
+def endpoint_name(url):
+    return urlsplit(url).path or url
+
+def load_entry(key):
+    with connect() as conn:
+        return conn.execute(
+            "SELECT body, etag, last_modified, fetched_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+def store_entry(key, body, etag, last_modified):
+    with connect() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, body, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?)",
+            (key, body, etag, last_modified, time.time())
+        )
+
+def touch_entry(key):
+    with connect() as conn:
+        conn.execute("UPDATE responses SET fetched_at = ? WHERE key = ?", (time.time(), key))
+
+# Function to drop every cached response (or only those for one endpoint)
+def clear_cache(url=None):
+    with connect() as conn:
+        if url is None:
+            conn.execute("DELETE FROM responses")
+        else:
+            conn.execute("DELETE FROM responses WHERE key LIKE ?", (url + "?%",))
+
+
+#######################################################
+#                                                     #
+#                    Cached Fetch                     #
+#                                                     #
+#######################################################
+# Function to pick a TTL: long for finished seasons, short for the current one
+def get_ttl(url, params):
+    year = (params or {}).get("year")
+    if year is not None and datetime.now() >= datetime(int(year) + 1, SEASON_END_MONTH, 1):
+        return COMPLETED_SEASON_TTL
+
+    for endpoint, ttl in CURRENT_SEASON_TTL.items():
+        if url.endswith(endpoint):
+            return ttl
+    return DEFAULT_CURRENT_SEASON_TTL
+
+# Function to look up a cached response; returns (key, entry, data) where data is
+# only set when the entry can be served without contacting the API
+def cache_lookup(url, params):
+    key = cache_key(url, params)
+    entry = load_entry(key)
+
+    if entry is not None:
+        body, etag, last_modified, fetched_at = entry
+        if OFFLINE or time.time() - fetched_at < get_ttl(url, params):
+            get_tracer().cache(endpoint_name(url), "hit")
+            return key, entry, json.loads(body)
+    elif OFFLINE:
+        raise RuntimeError(f"Offline mode: no cached response for {key}")
+    get_tracer().cache(endpoint_name(url), "miss" if entry is None else "expired")
+    return key, entry, None
+
+# Function to add revalidation headers for a stale entry instead of downloading it again
+def conditional_headers(headers, entry):
+    request_headers = dict(headers)
+    if entry is not None:
+        _, etag, last_modified, _ = entry
+        if etag:
+            request_headers["If-None-Match"] = etag
+        if last_modified:
+            request_headers["If-Modified-Since"] = last_modified
+    return request_headers
+
+# Function to GET a JSON endpoint through the on-disk cache
+def cached_get_json(url, headers, params=None):
+    key, entry, data = cache_lookup(url, params)
+    if data is not None:
+        return data
+
+    tracer = get_tracer()
+    started = time.perf_counter()
+    try:
+        response = requests.get(url, headers=conditional_headers(headers, entry), params=params)
+    except requests.RequestException:
+        tracer.request(endpoint_name(url), "error", time.perf_counter() - started)
+        if entry is not None:
+            tracer.cache(endpoint_name(url), "stale_fallback")
+            return json.loads(entry[0])  # Serve stale data rather than failing the run
+        raise
+    tracer.request(endpoint_name(url), response.status_code, time.perf_counter() - started, len(response.content))
+
+    if response.status_code == 304 and entry is not None:
+        touch_entry(key)
+        return json.loads(entry[0])
+
+    response.raise_for_status()
+    store_entry(key, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return response.json()
@@ -0,0 +1,73 @@
+import argparse
+
+from .bracket import populate_con_champs_and_top_teams
+from .config import CONFERENCE_CHAMPS
+from .engines import DEFAULT_ENGINE, ENGINES, rank_teams
+from .fetch import FETCH_BACKENDS, fixture_backend
+from .output import OUTPUT_BACKENDS
+from .ratings import DEFAULT_SOS, SOS_SCORERS, engine_with_sos
+from .season import load_season_data
+from .snapshot import load_snapshot
+from .trace import TRACE_FORMATS, Tracer, tracing, write_trace
+
+
+#######################################################
+#                                                     #
+#                 Command Line Runner                 #
+#                                                     #
+#######################################################
+# Function to build the parser; the old scripts only differ in the defaults they pass in
+def build_parser(**defaults):
+    parser = argparse.ArgumentParser(description="Rank college football teams and build the 12-team playoff")
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--engine", choices=ENGINES, default=DEFAULT_ENGINE, help="Scoring engine")
+    parser.add_argument("--sos", choices=SOS_SCORERS, default=DEFAULT_SOS,
+                        help="SoS from the schedule's points (one pass, or iterative until opponents' SoS converges), "
+                             "from opponents' Massey/Colley/Elo ratings, or (<system>-rating) the team's own rating")
+    parser.add_argument("--fetch", choices=FETCH_BACKENDS, default="async", help="How the API data is loaded")
+    parser.add_argument("--fixture", metavar="DIR", help="Replay a recorded fixture directory instead of calling the API")
+    parser.add_argument("--snapshot", metavar="DIR", help="Load the season from a columnar snapshot directory (see cfp.snapshot)")
+    parser.add_argument("--output", choices=OUTPUT_BACKENDS, default="text", help="Output format")
+    parser.add_argument("--output-file", default=None, help="Write the output here instead of stdout")
+    parser.add_argument("--top", type=int, default=50, help="Number of ranked teams to keep")
+    parser.add_argument("--no-champ-bonus", action="store_true", help="Skip the conference champion bonus")
+    parser.add_argument("--playoffs", action=argparse.BooleanOptionalAction, default=True,
+                        help="Select the final 12 teams and print the bracket")
+    parser.add_argument("--trace", choices=TRACE_FORMATS, default=None,
+                        help="Record stage timings, API requests, cache hits and counts in this format")
+    parser.add_argument("--trace-file", default=None, help="Write the trace here instead of stderr")
+    parser.set_defaults(**defaults)
+    return parser
+
+def main(argv=None, **defaults):
+    args = build_parser(**defaults).parse_args(argv)
+    with tracing(Tracer() if args.trace else None) as tracer:
+        try:
+            if args.snapshot:
+                season = load_snapshot(args.year, args.snapshot)
+            else:
+                season = load_season_data(args.year, fixture_backend(args.fixture) if args.fixture else args.fetch)
+            top_teams = rank_teams(
+                args.year,
+                season=season,
+                engine=engine_with_sos(args.engine, args.sos),
+                conference_champs=[] if args.no_champ_bonus else CONFERENCE_CHAMPS,
+                top_n=args.top
+            )
+
+            # Populate final list of 12 teams
+            final_12_teams = None
+            if args.playoffs:
+                with tracer.stage("selection"):
+                    final_12_teams = populate_con_champs_and_top_teams(
+                        season.teams.ids_for(CONFERENCE_CHAMPS), top_teams.to_dict("records")
+                    )
+
+            with tracer.stage("output"):
+                OUTPUT_BACKENDS[args.output](top_teams, final_12_teams, CONFERENCE_CHAMPS, args.output_file)
+        except Exception as e:
+            tracer.error(e)  # Keeps the stage it failed in when a traced stage raised it
+            print(f"An error occurred: {e}")
+
+        if args.trace:
+            write_trace(tracer, args.trace, args.trace_file)
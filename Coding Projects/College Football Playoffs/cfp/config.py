@@ -0,0 +1,51 @@
+# API key and headers
+API_KEY = "ooPM1hAjKzJwNeXBEpSo/KicAdjVFIUGxp1UygoZd+qGL8aCVDvs2C+ML79bx8tY"
+HEADERS = {"Authorization": f"Bearer {API_KEY}"}
+
+# Conference data
+POWER_CONFERENCES = ["SEC", "Big Ten", "Big 12", "ACC"]
+GROUP_OF_REST = ["American Athletic", "Mountain West", "MAC", "Conference USA", "AAC", "Sun Belt"]
+PAC_12 = ["Pac-12"]
+FBS_INDEPENDENT = ["FBS Independents"]
+
+ALL_CONFERENCES = POWER_CONFERENCES + GROUP_OF_REST + PAC_12 + FBS_INDEPENDENT
+
+CONFERENCE_POINTS = {
+    "SEC": 20,
+    "Big Ten": 18,
+    "Big 12": 16,
+    "ACC": 14,
+    "FBS Independents": 0,
+    "Pac-12": 13,
+    "Mountain West": 13,
+    "Sun Belt": 12,
+    "MAC": 11,
+    "Conference USA": 11,
+    "American Athletic": 10
+}
+
+# Conference champions, Auto Bid
+CONFERENCE_CHAMPS = ["Georgia", "Oregon", "Clemson", "Arizona State", "Boise State"]
+
+# Other spellings of team names (config, older API responses) -> collegefootballdata.com name
+TEAM_ALIASES = {
+    "Miami (FL)": "Miami",
+    "Miami (Ohio)": "Miami (OH)",
+    "Hawaii": "Hawai'i",
+    "San Jose State": "San José State",
+    "Connecticut": "UConn",
+    "Massachusetts": "UMass",
+    "Appalachian State": "App State",
+    "Louisiana-Monroe": "UL Monroe",
+    "Southern Mississippi": "Southern Miss"
+}
+
+# Define maximum points
+MAX_RECORD_POINTS = 45  # Maximum points for the Record category
+MAX_SOS_POINTS = 30  # Maximum points for SoS category
+MAX_OFFENSE_POINTS = 15  # Maximum points for Offense category
+MAX_DEFENSE_POINTS = 10  # Maximum points for Defense category
+MAX_BEST_WIN = 15 # Maximum points for Best Win category
+MAX_LOWEST_LOSS = 10 # Maximum points for Worst Loss category
+MAX_FBS_IND_CON_POINTS = 20  # Maximum points for SOS->CON for FBS
+CONFERENCE_CHAMP_BONUS = 3  # Maximum points for conference champions
@@ -0,0 +1,97 @@
+from multiprocessing import Pool
+
+import pandas as pd
+
+from .config import CONFERENCE_CHAMPS
+from .scoring import (
+    add_points_for_conference_champs, calculate_best_win, calculate_lowest_loss,
+    calculate_strength_of_schedule, calculate_team_scores
+)
+from .season import load_season_data
+from .trace import get_tracer
+from .vectorized import (
+    calculate_best_win_sparse, calculate_lowest_loss_sparse, calculate_strength_of_schedule_sparse,
+    calculate_team_scores_vectorized
+)
+
+POOL_PROCESSES = 4  # Adjust the number of processes as needed
+
+
+#######################################################
+#                                                     #
+#                   Scoring Engines                   #
+#                                                     #
+#######################################################
+# The four scoring stages an engine provides; every engine returns the same team_scores dicts
+class ScoringEngine:
+    def __init__(self, score_teams, strength_of_schedule, best_win, lowest_loss):
+        self.score_teams = score_teams
+        self.strength_of_schedule = strength_of_schedule
+        self.best_win = best_win
+        self.lowest_loss = lowest_loss
+
+# Serial Team Scoring
+def score_teams_serial(season):
+    return [
+        calculate_team_scores(team, season.stats, team_id) for team, team_id in zip(season.records, season.record_ids)
+    ]
+
+# Parallel Team Scoring
+def score_teams_process_pool(season):
+    with Pool(processes=POOL_PROCESSES) as pool:
+        return pool.starmap(
+            calculate_team_scores,
+            [(team, season.stats, team_id) for team, team_id in zip(season.records, season.record_ids)]
+        )
+
+ENGINES = {
+    "serial": ScoringEngine(
+        score_teams_serial, calculate_strength_of_schedule, calculate_best_win, calculate_lowest_loss
+    ),
+    "process-pool": ScoringEngine(
+        score_teams_process_pool, calculate_strength_of_schedule, calculate_best_win, calculate_lowest_loss
+    ),
+    "vectorized": ScoringEngine(
+        calculate_team_scores_vectorized, calculate_strength_of_schedule_sparse,
+        calculate_best_win_sparse, calculate_lowest_loss_sparse
+    )
+}
+DEFAULT_ENGINE = "vectorized"
+
+
+#######################################################
+#                                                     #
+#                   Rank The Teams                    #
+#                                                     #
+#######################################################
+def rank_teams(year, season=None, engine=DEFAULT_ENGINE, conference_champs=CONFERENCE_CHAMPS, top_n=50, fetch="async"):
+    # Load every endpoint once unless the caller already has the season's data
+    if season is None:
+        season = load_season_data(year, fetch)
+    engine = ENGINES[engine] if isinstance(engine, str) else engine
+    tracer = get_tracer()
+
+    with tracer.stage("score"):
+        team_scores = engine.score_teams(season)
+
+    # Add points for conference champions
+    with tracer.stage("champ_bonus"):
+        add_points_for_conference_champs(season.teams.ids_for(conference_champs), team_scores)
+
+    with tracer.stage("sos"):
+        engine.strength_of_schedule(season, team_scores)
+    with tracer.stage("best_win"):
+        engine.best_win(season, team_scores)
+    with tracer.stage("lowest_loss"):
+        engine.lowest_loss(season, team_scores)
+
+    tracer.gauge("teams", len(season.teams))
+    tracer.gauge("ranked_teams", len(team_scores))
+    tracer.gauge("games", len(season.graph.home))
+    tracer.gauge("played_games", len(season.graph.winners))
+
+    # Convert to DataFrame and sort by total points
+    with tracer.stage("sort"):
+        df = pd.DataFrame(team_scores)
+        df = df.sort_values(by="Total Points", ascending=False)
+    return df.head(top_n) if top_n else df
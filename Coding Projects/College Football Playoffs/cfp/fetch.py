@@ -0,0 +1,115 @@
+import json
+import os
+
+from .async_fetch import fetch_season_concurrently
+from .cache import cached_get_json
+from .config import HEADERS
+
+FIXTURE_FILES = ["records", "offense", "defense", "games"]
+
+
+#######################################################
+#                                                     #
+#                    Get API Data                     #
+#                                                     #
+#######################################################
+# Function to fetch team records
+def fetch_team_records(year):
+    url = "https://api.collegefootballdata.com/records"
+    params = {"year": year}
+    return cached_get_json(url, HEADERS, params)
+
+# Function to fetch team offense overall
+def fetch_team_offense(year):
+    url = "https://api.collegefootballdata.com/ppa/teams"
+    params = {
+        "year": year,
+        "type": "offense"  # Ensure the API fetches offense-specific data
+    }
+    return parse_team_offense(cached_get_json(url, HEADERS, params))
+
+# Function to parse and structure the offense data
+def parse_team_offense(data):
+    offense_data = []
+    for item in data:
+        overall = item["offense"]["overall"] if "offense" in item and "overall" in item["offense"] else 0
+        offense_data.append({
+            "team": item["team"],
+            "conference": item.get("conference", ""),
+            "overall": float(overall)  # Ensure 'overall' is a float
+        })
+    return offense_data
+
+# Function to fetch team defense overall
+def fetch_team_defense(year):
+    url = "https://api.collegefootballdata.com/ppa/teams"
+    params = {
+        "year": year,
+        "type": "defense"  # Ensure the API fetches defense-specific data
+    }
+    return parse_team_defense(cached_get_json(url, HEADERS, params))
+
+# Function to parse and structure the defense data
+def parse_team_defense(data):
+    defense_data = []
+    for item in data:
+        overall = item["defense"]["overall"] if "defense" in item and "overall" in item["defense"] else 0
+        defense_data.append({
+            "team": item["team"],
+            "conference": item.get("conference", ""),
+            "overall": float(overall)  # Ensure 'overall' is a float
+        })
+    return defense_data
+
+# Function to fetch schedules for all teams
+def fetch_team_schedules(year):
+    url = "https://api.collegefootballdata.com/games"
+    params = {"year": year}
+    return cached_get_json(url, HEADERS, params)
+
+
+#######################################################
+#                                                     #
+#                   Fetch Backends                    #
+#                                                     #
+#######################################################
+# Each backend returns the raw (records, offense PPA, defense PPA, games) JSON for a season
+
+# All four endpoints (games fanned out per week) share one async session
+def fetch_async(year):
+    return fetch_season_concurrently(year, HEADERS)
+
+# One cached request after another, no event loop
+def fetch_sync(year):
+    url = "https://api.collegefootballdata.com/ppa/teams"
+    return (
+        fetch_team_records(year),
+        cached_get_json(url, HEADERS, {"year": year, "type": "offense"}),
+        cached_get_json(url, HEADERS, {"year": year, "type": "defense"}),
+        fetch_team_schedules(year)
+    )
+
+# Function to read a recorded fixture directory (records/offense/defense/games.json)
+def read_fixture(path):
+    payloads = []
+    for name in FIXTURE_FILES:
+        with open(os.path.join(path, f"{name}.json")) as f:
+            payloads.append(json.load(f))
+    return tuple(payloads)
+
+# Function to write raw season payloads as a fixture directory
+def write_fixture(path, payloads):
+    os.makedirs(path, exist_ok=True)
+    for name, payload in zip(FIXTURE_FILES, payloads):
+        with open(os.path.join(path, f"{name}.json"), "w") as f:
+            json.dump(payload, f)
+    return path
+
+# Function to build a backend that replays a fixture directory instead of calling the API
+def fixture_backend(path):
+    return lambda year: read_fixture(path)
+
+FETCH_BACKENDS = {
+    "async": fetch_async,
+    "sync": fetch_sync
+}
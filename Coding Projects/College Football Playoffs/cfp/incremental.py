@@ -0,0 +1,315 @@
+import argparse
+import os
+import pickle
+import sys
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from .async_fetch import fetch_games_concurrently
+from .config import (
+    CONFERENCE_CHAMP_BONUS, CONFERENCE_CHAMPS, FBS_INDEPENDENT, HEADERS, MAX_BEST_WIN, MAX_FBS_IND_CON_POINTS,
+    MAX_LOWEST_LOSS, MAX_SOS_POINTS
+)
+from .ratings import iterative_sos
+from .report import SUMMARY_FIELDS, ranking_lines, write_lines
+from .scoring import (
+    calculate_conference_points, calculate_defense_points, calculate_offense_points, calculate_record_points
+)
+from .season import load_season_data
+from .teams import display_label
+
+DEFAULT_STATE_PATH = "cfp_incremental_state.pkl"
+
+
+#######################################################
+#                                                     #
+#                 Incremental Ranker                  #
+#                                                     #
+#######################################################
+# Function to split a completed game into (winner, loser); ties go to the away team, as in rank_teams
+def game_result(game):
+    home_points = game.get("home_points")
+    away_points = game.get("away_points")
+    if home_points is None or away_points is None:
+        return None
+    if home_points > away_points:
+        return game.get("home_team"), game.get("away_team")
+    return game.get("away_team"), game.get("home_team")
+
+# Keeps last week's per-team state so new results only touch the teams they involve
+# With `iterative_sos` the SoS category uses the iterative SoS (cfp.ratings), warm-started from
+# the strengths this ranker converged to last time (saved with the weekly state, and kept
+# between refreshes by the live server)
+class IncrementalRanker:
+    def __init__(self, season, conference_champs=CONFERENCE_CHAMPS, iterative_sos=False):
+        self.year = season.year
+        self.iterative_sos = iterative_sos
+        self.sos_strength = {}
+        self.stats = season.stats
+        self.registry = season.teams
+        self.conference_champs = self.registry.ids_for(conference_champs)
+
+        # Per-team inputs for the base categories, keyed on team ID like every other stage
+        self.teams = {}
+        for team_id, team in zip(season.record_ids, season.records):
+            total = team.get("total", {})
+            self.teams[team_id] = {
+                "team": team["team"],
+                "conference": team.get("conference"),
+                "total": {
+                    "wins": total.get("wins", 0),
+                    "losses": total.get("losses", 0),
+                    "ties": total.get("ties", 0)
+                }
+            }
+
+        # Game store and per-team adjacency (game ids in schedule order)
+        self.games = {}
+        self.team_games = {}
+        for index, game in enumerate(season.schedules):
+            self.add_game(game.get("id", f"game-{index}"), game)
+
+        self.base_points = {}
+        self.pre_result_points = {}
+        for team_id in self.teams:
+            self.update_base_points(team_id)
+
+        # Raw (un-normalized) result categories for every team that appears in the schedule
+        self.sos_raw = {}
+        self.best_win_raw = {}
+        self.lowest_loss_raw = {}
+        for team_id in self.team_games:
+            self.update_result_categories(team_id)
+
+    # Function to resolve a game's (home, away) teams to IDs; any spelling in TEAM_ALIASES maps to the same team
+    def game_teams(self, game):
+        return self.registry.add(game.get("home_team")), self.registry.add(game.get("away_team"))
+
+    # Function to split a completed game into (winner ID, loser ID)
+    def result_ids(self, game):
+        result = game_result(game)
+        return None if result is None else tuple(map(self.registry.add, result))
+
+    def add_game(self, game_id, game):
+        self.games[game_id] = game
+        for team_id in self.game_teams(game):
+            self.team_games.setdefault(team_id, []).append(game_id)
+
+    def remove_game(self, game_id):
+        game = self.games.pop(game_id)
+        for team_id in self.game_teams(game):
+            self.team_games[team_id].remove(game_id)
+
+    # Function to add (+1) or remove (-1) a completed game from the teams' records
+    def apply_record(self, game, sign):
+        result = self.result_ids(game)
+        if result is None:
+            return
+        if game.get("home_points") == game.get("away_points"):
+            for team_id in result:
+                if team_id in self.teams:
+                    self.teams[team_id]["total"]["ties"] += sign
+            return
+        winner, loser = result
+        if winner in self.teams:
+            self.teams[winner]["total"]["wins"] += sign
+        if loser in self.teams:
+            self.teams[loser]["total"]["losses"] += sign
+
+    # Function to recompute a team's record/offense/defense/conference points
+    def update_base_points(self, team_id):
+        team = self.teams[team_id]
+        base = (
+            calculate_record_points(team)
+            + calculate_offense_points(team_id, self.stats)
+            - calculate_defense_points(team_id, self.stats)
+            + calculate_conference_points(team["conference"])
+        )
+        self.base_points[team_id] = base
+        bonus = CONFERENCE_CHAMP_BONUS if team_id in self.conference_champs else 0
+        self.pre_result_points[team_id] = base + bonus  # Total Points the SoS stage sees
+
+    # Function to recompute SoS sum, best win and lowest loss for one team from its own games
+    def update_result_categories(self, team_id):
+        sos = 0
+        best_win = None
+        lowest_loss = None
+        for game_id in self.team_games.get(team_id, []):
+            game = self.games[game_id]
+            home_team, away_team = self.game_teams(game)
+            opponent = away_team if home_team == team_id else home_team
+            sos += self.pre_result_points.get(opponent, 0)
+
+            result = self.result_ids(game)
+            if result is None:
+                continue
+            winner, loser = result
+            if winner == team_id:
+                value = self.base_points.get(loser, 0)
+                if best_win is None:
+                    best_win = (0, "")
+                if value > best_win[0]:
+                    best_win = (value, self.registry.names[loser])
+            elif loser == team_id:
+                value = self.base_points.get(winner, float('inf'))
+                if lowest_loss is None:
+                    lowest_loss = (float('inf'), "")
+                if value < lowest_loss[0]:
+                    lowest_loss = (value, self.registry.names[winner])
+
+        if team_id in self.team_games:
+            self.sos_raw[team_id] = sos
+        for store, value in ((self.best_win_raw, best_win), (self.lowest_loss_raw, lowest_loss)):
+            if value is None:
+                store.pop(team_id, None)
+            else:
+                store[team_id] = value
+
+    # Function to fold new or corrected games into the state; returns the IDs of the teams that were recomputed
+    def apply_games(self, games):
+        changed = set()
+        for index, game in enumerate(games):
+            game_id = game.get("id", f"new-game-{len(self.games)}-{index}")
+            old_game = self.games.get(game_id)
+            if old_game is not None:
+                if all(old_game.get(key) == game.get(key) for key in ("home_team", "away_team", "home_points", "away_points")):
+                    continue
+                self.apply_record(old_game, -1)
+                changed.update(self.game_teams(old_game))
+                if self.game_teams(old_game) == self.game_teams(game):
+                    self.games[game_id] = game  # Same matchup: keep its place in schedule order
+                else:
+                    self.remove_game(game_id)
+                    self.add_game(game_id, game)
+            else:
+                self.add_game(game_id, game)
+            self.apply_record(game, +1)
+            changed.update(self.game_teams(game))
+
+        for team_id in changed:
+            if team_id in self.teams:
+                self.update_base_points(team_id)
+
+        # A changed team's points feed every opponent's SoS, best win and lowest loss
+        affected = set(changed)
+        for team_id in changed:
+            for game_id in self.team_games.get(team_id, []):
+                affected.update(self.game_teams(self.games[game_id]))
+        for team_id in affected:
+            self.update_result_categories(team_id)
+        return affected
+
+    # Function to run the iterative SoS over every stored game, starting from last run's strengths;
+    # returns each scheduled team's SoS share (1 for the strongest schedule)
+    def iterative_sos_shares(self):
+        team_ids = list(self.team_games)
+        index = {team_id: i for i, team_id in enumerate(team_ids)}
+        matchups = [self.game_teams(game) for game in self.games.values()]
+        home = [index[home_team] for home_team, _ in matchups]
+        away = [index[away_team] for _, away_team in matchups]
+        pairs = sp.coo_matrix((np.ones(len(home)), (home, away)), shape=(len(team_ids), len(team_ids)))
+        opponents = (pairs + pairs.T).tocsr()
+
+        base = np.array([self.pre_result_points.get(team_id, 0) for team_id in team_ids], dtype=float)
+        weights = np.array([
+            MAX_SOS_POINTS + (MAX_FBS_IND_CON_POINTS if team_id in self.teams and self.teams[team_id]["conference"] in FBS_INDEPENDENT else 0)
+            for team_id in team_ids
+        ], dtype=float)
+        start = None
+        if self.sos_strength:
+            start = np.array([self.sos_strength.get(team_id, value) for team_id, value in zip(team_ids, base.tolist())])
+
+        shares, strength, _ = iterative_sos(opponents, base, weights, start)
+        self.sos_strength = dict(zip(team_ids, strength.tolist()))
+        return dict(zip(team_ids, shares.tolist()))
+
+    # Function to renormalize the raw categories and build the ranking table
+    def rankings(self, top_n=50):
+        sos_shares = self.iterative_sos_shares() if self.iterative_sos else None
+        max_sos = max(self.sos_raw.values()) if self.sos_raw else 1
+        max_best_win = max(value for value, _ in self.best_win_raw.values()) if self.best_win_raw else 1
+        min_lowest_loss = min(value for value, _ in self.lowest_loss_raw.values()) if self.lowest_loss_raw else 1
+        max_sos = max_sos or 1  # Avoid division by zero
+        max_best_win = max_best_win or 1
+
+        team_scores = []
+        for team_id, team in self.teams.items():
+            conference = team["conference"]
+            is_champ = team_id in self.conference_champs
+            conference_points = calculate_conference_points(conference)
+
+            if sos_shares is not None:
+                sos_points = sos_shares.get(team_id, 0) * MAX_SOS_POINTS
+            else:
+                sos_points = (self.sos_raw[team_id] / max_sos) * MAX_SOS_POINTS if team_id in self.sos_raw else 0
+            total_points = self.pre_result_points[team_id]
+            if conference in FBS_INDEPENDENT:
+                conference_points = (sos_points / MAX_SOS_POINTS) * MAX_FBS_IND_CON_POINTS
+                total_points += conference_points
+            total_points += sos_points
+
+            best_win_value, best_win_team = self.best_win_raw.get(team_id, (None, ""))
+            best_win_points = (best_win_value / max_best_win) * MAX_BEST_WIN if best_win_value is not None else 0
+            total_points += best_win_points
+
+            lowest_loss_value, lowest_loss_team = self.lowest_loss_raw.get(team_id, (None, ""))
+            lowest_loss_points = (min_lowest_loss / lowest_loss_value) * MAX_LOWEST_LOSS if lowest_loss_value is not None else 0
+            total_points -= lowest_loss_points
+
+            team_scores.append({
+                "Team": display_label(team["team"], *(team["total"][key] for key in ("wins", "losses", "ties"))),
+                "Team ID": team_id,
+                "Conference": conference,
+                "Record Points": calculate_record_points(team),
+                "Offense Points": calculate_offense_points(team_id, self.stats),
+                "Defense Points": calculate_defense_points(team_id, self.stats),
+                "Conference Points": conference_points,
+                "Total Points": total_points,
+                "Base Non-Result Points": self.base_points[team_id],
+                "Conference Champ Bonus": CONFERENCE_CHAMP_BONUS if is_champ else 0,
+                "SoS Points": sos_points,
+                "Best Win Points": best_win_points,
+                "Best Win Team": best_win_team,
+                "Lowest Loss Points": lowest_loss_points,
+                "Lowest Loss Team": lowest_loss_team
+            })
+
+        df = pd.DataFrame(team_scores).sort_values(by="Total Points", ascending=False)
+        return df.head(top_n) if top_n else df
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path):
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+# Main
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-rank using only the games that changed since the last run")
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--state", default=DEFAULT_STATE_PATH, help="Where last week's state is kept")
+    parser.add_argument("--iterative-sos", action="store_true", help="Use the iterative SoS, warm-started from last week")
+    args = parser.parse_args()
+
+    try:
+        if os.path.exists(args.state):
+            ranker = IncrementalRanker.load(args.state)
+            ranker.iterative_sos = args.iterative_sos
+            affected = ranker.apply_games(fetch_games_concurrently(args.year, HEADERS))
+            print(f"Recomputed {len(affected)} teams affected by new results")
+        else:
+            ranker = IncrementalRanker(load_season_data(args.year), iterative_sos=args.iterative_sos)
+            print("No saved state found, built the full season state")
+
+        top_25 = ranker.rankings(top_n=25)
+        ranker.save(args.state)  # After ranking, so the iterative SoS strengths are saved too
+        print("Top 25 Teams Based on Overall Rankings:")
+        write_lines(sys.stdout, ranking_lines(top_25, SUMMARY_FIELDS, end=""))
+    except Exception as e:
+        print(f"An error occurred: {e}")
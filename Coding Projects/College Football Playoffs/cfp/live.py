@@ -0,0 +1,299 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+
+import aiohttp
+from aiohttp import web
+
+from .async_fetch import API_BASE_URL, REQUEST_TIMEOUT_SECONDS
+from .config import CONFERENCE_CHAMPS, HEADERS
+from .fetch import FETCH_BACKENDS, fixture_backend
+from .incremental import IncrementalRanker
+from .season import load_season_data
+from .snapshot import load_snapshot
+
+LIVE_TOP_N = 25
+DEFAULT_PORT = 8765
+FEED_POLL_SECONDS = 0.1  # A local feed file only costs a stat() per check
+SCOREBOARD_POLL_SECONDS = 30  # Be polite to the API on game days
+HEARTBEAT_SECONDS = 15  # Keeps idle SSE connections open through proxies
+
+GAME_KEYS = ("home_team", "away_team", "home_points", "away_points")
+
+
+#######################################################
+#                                                     #
+#                    Score Sources                    #
+#                                                     #
+#######################################################
+# Function to bring a scoreboard or /games entry into the /games shape the ranker uses. Only
+# final scores count unless `project_live` is set, in which case in-progress games are ranked
+# as if they ended with the current score.
+def live_game(item, project_live=False):
+    if "homeTeam" in item:
+        home = item.get("homeTeam") or {}
+        away = item.get("awayTeam") or {}
+        status = item.get("status")
+        game = {
+            "id": item.get("id"),
+            "home_team": home.get("name"),
+            "away_team": away.get("name"),
+            "home_points": home.get("points"),
+            "away_points": away.get("points")
+        }
+        counted = status == "completed" or (project_live and status == "in_progress")
+    else:
+        game = {key: item.get(key) for key in ("id",) + GAME_KEYS}
+        counted = item.get("completed", True) or project_live  # Recorded fixtures have no flag
+    if game["id"] is None:
+        game["id"] = f"{game['home_team']}-{game['away_team']}"
+    if not counted:
+        game["home_points"] = game["away_points"] = None
+    return game
+
+# Function to build the (teams, score) key a game was last applied with
+def game_key(game):
+    return tuple(game.get(key) for key in GAME_KEYS)
+
+# Stand-in for the API: a JSON list of games (scoreboard or /games shape) that is re-read
+# whenever it changes on disk
+class FeedFile:
+    def __init__(self, path):
+        self.path = path
+        self.version = None
+
+    async def read(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        version = (stat.st_mtime_ns, stat.st_size)
+        if version == self.version:
+            return None
+        try:
+            with open(self.path) as f:
+                games = json.load(f)
+        except json.JSONDecodeError:
+            return None  # Caught the file mid-write; read it again on the next check
+        self.version = version
+        return games
+
+    async def close(self):
+        pass
+
+# Polls the live scoreboard endpoint over one keep-alive session (bypasses the on-disk cache,
+# which would hold scores for 15 minutes)
+class Scoreboard:
+    def __init__(self, params=None):
+        self.params = params or {"classification": "fbs"}
+        self.session = None
+
+    async def read(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                headers=HEADERS, timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+            )
+        async with self.session.get(API_BASE_URL + "/scoreboard", params=self.params) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+
+
+#######################################################
+#                                                     #
+#                  Live Rankings State                #
+#                                                     #
+#######################################################
+# Function to key a ranking table by team ID: (rank, label, total points)
+def ranked_rows(table):
+    return {
+        int(team_id): (rank, label, float(total_points))
+        for rank, (team_id, label, total_points) in enumerate(
+            zip(table["Team ID"].tolist(), table["Team"].tolist(), table["Total Points"].tolist()), start=1
+        )
+    }
+
+# Function to list the teams whose rank or record changed, including teams entering or leaving the top N
+def rank_moves(old_table, new_table):
+    old = ranked_rows(old_table)
+    new = ranked_rows(new_table)
+    moves = []
+    for team_id in new.keys() | old.keys():
+        old_rank, old_label, _ = old.get(team_id, (None, None, None))
+        new_rank, new_label, total_points = new.get(team_id, (None, old_label, None))
+        if old_rank != new_rank or old_label != new_label:
+            moves.append({
+                "team_id": team_id,
+                "team": new_label,
+                "old_rank": old_rank,
+                "new_rank": new_rank,
+                "total_points": total_points
+            })
+    return sorted(moves, key=lambda move: (move["new_rank"] is None, move["new_rank"] or 0, move["old_rank"] or 0))
+
+# Holds the incremental ranker, the last score seen for every game and the SSE subscribers
+class LiveRankings:
+    def __init__(self, ranker, top_n=LIVE_TOP_N, project_live=False):
+        self.ranker = ranker
+        self.top_n = top_n
+        self.project_live = project_live
+        self.seen = {game_id: game_key(game) for game_id, game in ranker.games.items()}
+        self.subscribers = set()
+        self.version = 0
+        self.table = ranker.rankings(top_n=top_n)
+
+    # Function to keep only the games whose teams or score differ from what was last applied
+    def changed_games(self, games):
+        changed = []
+        for game in (live_game(item, self.project_live) for item in games):
+            if self.seen.get(game["id"]) != game_key(game):
+                changed.append(game)
+        return changed
+
+    # Function to apply a fresh read of the scores; publishes and returns the update, or None if nothing changed
+    def update(self, games):
+        started = time.perf_counter()
+        changed = self.changed_games(games)
+        if not changed:
+            return None
+        affected = self.ranker.apply_games(changed)
+        old_table = self.table
+        self.table = self.ranker.rankings(top_n=self.top_n)
+        # Only mark the games as seen once they are ranked, so a failed update is retried on the next poll
+        for game in changed:
+            self.seen[game["id"]] = game_key(game)
+        self.version += 1
+        event = {
+            "version": self.version,
+            "games": changed,
+            "recomputed_teams": len(affected),
+            "moves": rank_moves(old_table, self.table),
+            "elapsed_ms": (time.perf_counter() - started) * 1000
+        }
+        self.publish("update", event)
+        return event
+
+    def snapshot(self):
+        return {
+            "version": self.version,
+            "rankings": [
+                {"rank": rank, "team_id": team_id, "team": label, "total_points": total_points}
+                for team_id, (rank, label, total_points) in ranked_rows(self.table).items()
+            ]
+        }
+
+    def subscribe(self):
+        queue = asyncio.Queue()
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.discard(queue)
+
+    def publish(self, event_type, data):
+        for queue in self.subscribers:
+            queue.put_nowait((event_type, data))
+
+
+#######################################################
+#                                                     #
+#                   SSE Push Server                   #
+#                                                     #
+#######################################################
+# Function to format one server-sent event
+def sse_message(event_type, data):
+    return f"id: {data['version']}\nevent: {event_type}\ndata: {json.dumps(data)}\n\n".encode()
+
+# GET /events: the current top N as a "snapshot" event, then an "update" event per change
+async def stream_events(request):
+    service = request.app["service"]
+    response = web.StreamResponse(headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"})
+    await response.prepare(request)
+    queue = service.subscribe()
+    try:
+        await response.write(sse_message("snapshot", service.snapshot()))
+        while True:
+            try:
+                event_type, data = await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                await response.write(b": keep-alive\n\n")
+                continue
+            await response.write(sse_message(event_type, data))
+    except ConnectionResetError:
+        pass  # Subscriber went away
+    finally:
+        service.unsubscribe(queue)
+    return response
+
+# GET /rankings: the current top N as JSON
+async def current_rankings(request):
+    return web.json_response(request.app["service"].snapshot())
+
+# Function to re-read the source on a schedule and push every change
+async def poll_scores(service, source, interval):
+    while True:
+        try:
+            games = await source.read()
+            event = service.update(games) if games is not None else None
+            if event:
+                print(
+                    f"Update {event['version']}: {len(event['games'])} games changed, "
+                    f"{event['recomputed_teams']} teams recomputed, {len(event['moves'])} rank moves "
+                    f"in {event['elapsed_ms']:.1f} ms"
+                )
+        except Exception as e:
+            print(f"An error occurred: {e}")  # Keep serving the last rankings and try again
+        await asyncio.sleep(interval)
+
+def build_app(service, source, interval):
+    app = web.Application()
+    app["service"] = service
+    app.router.add_get("/events", stream_events)
+    app.router.add_get("/rankings", current_rankings)
+
+    async def polling(app):
+        task = asyncio.create_task(poll_scores(service, source, interval))
+        yield
+        task.cancel()
+        await source.close()
+
+    app.cleanup_ctx.append(polling)
+    return app
+
+
+# Main
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve live ranking updates over server-sent events")
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--fetch", choices=FETCH_BACKENDS, default="async", help="How the starting season is loaded")
+    parser.add_argument("--fixture", metavar="DIR", help="Start from a recorded fixture directory")
+    parser.add_argument("--snapshot", metavar="DIR", help="Start from a columnar snapshot directory")
+    parser.add_argument("--feed", metavar="FILE", help="Watch this JSON file of games instead of polling the scoreboard")
+    parser.add_argument("--interval", type=float, default=None, help="Seconds between checks for new scores")
+    parser.add_argument("--project-live", action="store_true", help="Rank in-progress games at their current score")
+    parser.add_argument("--iterative-sos", action="store_true", help="Use the iterative SoS, warm-started from the last refresh")
+    parser.add_argument("--top", type=int, default=LIVE_TOP_N, help="Number of ranked teams to push")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    try:
+        if args.snapshot:
+            season = load_snapshot(args.year, args.snapshot)
+        else:
+            season = load_season_data(args.year, fixture_backend(args.fixture) if args.fixture else args.fetch)
+        ranker = IncrementalRanker(season, CONFERENCE_CHAMPS, iterative_sos=args.iterative_sos)
+        service = LiveRankings(ranker, args.top, args.project_live)
+        if args.feed:
+            source, interval = FeedFile(args.feed), args.interval or FEED_POLL_SECONDS
+        else:
+            source, interval = Scoreboard(), args.interval or SCOREBOARD_POLL_SECONDS
+        print(f"Serving live rankings at http://{args.host}:{args.port}/events")
+        web.run_app(build_app(service, source, interval), host=args.host, port=args.port, print=None)
+    except Exception as e:
+        print(f"An error occurred: {e}")
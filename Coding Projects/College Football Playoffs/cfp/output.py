@@ -0,0 +1,50 @@
+import os
+import sys
+
+from .report import open_report, results_lines, stream_csv, stream_html, stream_json, write_lines
+
+
+#######################################################
+#                                                     #
+#                   Output Backends                   #
+#                                                     #
+#######################################################
+# Each backend takes the ranking table, the final playoff teams (or None) and the
+# conference champions, and writes to `path` (stdout when no path is given)
+
+# Function to tag each ranked team with its playoff seed (blank when not selected)
+def with_playoff_seeds(rankings, final_teams):
+    rankings = rankings.copy()
+    seeds = {} if final_teams is None else {team_id: seed for seed, team_id in enumerate(final_teams["Team ID"], start=1)}
+    rankings["Playoff Seed"] = rankings["Team ID"].map(seeds).astype("Int64")
+    return rankings
+
+# Function to print the ranking table, final playoff field and bracket
+def print_results(rankings, final_teams, conference_champs):
+    write_lines(sys.stdout, results_lines(rankings, final_teams, conference_champs))
+
+def write_text(rankings, final_teams, conference_champs, path=None):
+    with open_report(path) as f:
+        write_lines(f, results_lines(rankings, final_teams, conference_champs))
+    if path:
+        print(f"Results saved to: {os.path.abspath(path)}")
+
+# Function to build the table writers; CSV, HTML and JSON all write the ranking table with a Playoff Seed column
+def table_backend(stream):
+    def write(rankings, final_teams, conference_champs, path=None):
+        with open_report(path) as f:
+            stream(with_playoff_seeds(rankings, final_teams), f)
+        if path:
+            print(f"Results saved to: {os.path.abspath(path)}")
+    return write
+
+write_csv = table_backend(stream_csv)
+write_html = table_backend(stream_html)
+write_json = table_backend(stream_json)
+
+OUTPUT_BACKENDS = {
+    "text": write_text,
+    "csv": write_csv,
+    "html": write_html,
+    "json": write_json
+}
@@ -0,0 +1,275 @@
+import argparse
+import sys
+import time
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+from scipy.sparse.csgraph import connected_components
+
+from .config import FBS_INDEPENDENT, MAX_FBS_IND_CON_POINTS, MAX_SOS_POINTS
+from .engines import ENGINES, ScoringEngine
+from .fetch import FETCH_BACKENDS, fixture_backend
+from .report import CONFERENCE_WIDTH, TEAM_WIDTH, column_values, format_rows, text_values, write_lines
+from .season import load_season_data
+from .snapshot import load_snapshot
+
+# Massey and Colley systems are symmetric positive (semi-)definite and very sparse, so they are
+# solved with Jacobi-preconditioned conjugate gradients (a direct factorization fills in badly)
+SOLVER_TOLERANCE = 1e-10
+
+ELO_START = 1500
+ELO_K = 30
+ELO_HOME_ADVANTAGE = 55  # Rating points; neutral-site games are not marked in the game graph
+ELO_PASSES = 1  # Extra passes replay the season starting from the previous pass's ratings
+
+ITERATIVE_SOS_TOLERANCE = 1e-9  # Stop once no team's strength moves by more than this many points
+ITERATIVE_SOS_MAX_ITERATIONS = 500
+
+
+#######################################################
+#                                                     #
+#                   Rating Systems                    #
+#                                                     #
+#######################################################
+# Every system takes the season's game graph and returns one rating per team ID
+# (higher is better); only completed games count
+
+# Function to pull the completed games out of the graph: home IDs, away IDs and home margin
+def played_games(graph):
+    played = ~(np.isnan(graph.home_points) | np.isnan(graph.away_points))
+    margin = graph.home_points[played] - graph.away_points[played]
+    return graph.home[played], graph.away[played], margin
+
+# Function to build the games-played Laplacian: games on the diagonal, -games between each pair
+def game_laplacian(num_teams, home, away):
+    pairs = sp.coo_matrix((np.ones(len(home)), (home, away)), shape=(num_teams, num_teams))
+    pairs = (pairs + pairs.T).tocsr()
+    return sp.diags(np.asarray(pairs.sum(axis=1)).ravel()) - pairs
+
+# Function to solve a symmetric positive (semi-)definite system with Jacobi-preconditioned CG
+def solve_spd(system, rhs):
+    diagonal = system.diagonal()
+    preconditioner = sp.diags(1 / np.where(diagonal > 0, diagonal, 1))
+    solution, info = spla.cg(system, rhs, rtol=SOLVER_TOLERANCE, atol=0, M=preconditioner, maxiter=10 * len(rhs))
+    if info > 0:
+        raise RuntimeError(f"Rating solver did not converge in {info} iterations")
+    return solution
+
+# Massey: least-squares ratings whose differences best match every game's point margin. Ratings are
+# only defined up to a constant per connected group of teams, so each group is centred on 0
+def massey_ratings(graph):
+    home, away, margin = played_games(graph)
+    laplacian = game_laplacian(graph.num_teams, home, away).tocsr()
+    differential = np.bincount(home, margin, graph.num_teams) - np.bincount(away, margin, graph.num_teams)
+    ratings = solve_spd(laplacian, differential)
+    _, groups = connected_components(laplacian, directed=False)
+    return ratings - (np.bincount(groups, ratings) / np.bincount(groups))[groups]
+
+# Colley: win/loss-only ratings centred on 0.5 (ties count as half a win and half a loss)
+def colley_ratings(graph):
+    home, away, margin = played_games(graph)
+    result = np.sign(margin)
+    wins_minus_losses = np.bincount(home, result, graph.num_teams) - np.bincount(away, result, graph.num_teams)
+    system = (2 * sp.identity(graph.num_teams) + game_laplacian(graph.num_teams, home, away)).tocsr()
+    return solve_spd(system, 1 + wins_minus_losses / 2)
+
+# Function to group games into rounds in which no team plays twice, keeping each team's games
+# in schedule order, so a whole round of Elo updates can be applied at once
+def game_rounds(num_teams, home, away):
+    last_round = np.full(num_teams, -1)
+    rounds = np.empty(len(home), dtype=np.int64)
+    for game, (home_team, away_team) in enumerate(zip(home.tolist(), away.tolist())):
+        rounds[game] = max(last_round[home_team], last_round[away_team]) + 1
+        last_round[home_team] = last_round[away_team] = rounds[game]
+    return rounds
+
+# Elo: every game moves both teams by K times the surprise of the result, in schedule order
+def elo_ratings(graph, k=ELO_K, home_advantage=ELO_HOME_ADVANTAGE, passes=ELO_PASSES):
+    home, away, margin = played_games(graph)
+    score = (np.sign(margin) + 1) / 2  # 1 home win, 0.5 tie, 0 away win
+    rounds = game_rounds(graph.num_teams, home, away)
+    order = np.argsort(rounds, kind="stable")
+    starts = np.searchsorted(rounds[order], np.arange(rounds.max() + 2 if len(rounds) else 1))
+
+    ratings = np.full(graph.num_teams, float(ELO_START))
+    for _ in range(passes):
+        for start, end in zip(starts[:-1], starts[1:]):
+            games = order[start:end]
+            expected = 1 / (1 + 10 ** ((ratings[away[games]] - ratings[home[games]] - home_advantage) / 400))
+            change = k * (score[games] - expected)
+            ratings[home[games]] += change
+            ratings[away[games]] -= change
+    return ratings
+
+RATING_SYSTEMS = {
+    "massey": massey_ratings,
+    "colley": colley_ratings,
+    "elo": elo_ratings
+}
+
+
+#######################################################
+#                                                     #
+#                 Rating-Based SoS                    #
+#                                                     #
+#######################################################
+# Each scorer has the same signature as calculate_strength_of_schedule, so it can stand in for
+# any engine's SoS stage (see engine_with_sos)
+
+# Function to set SoS Points from a per-team raw value (normalized so the best team gets
+# MAX_SOS_POINTS), including the FBS independents' SoS-based conference points
+def add_sos_points(team_scores, sos_values):
+    max_sos = sos_values.max() if len(sos_values) else 1
+    if max_sos == 0:
+        max_sos = 1  # Avoid division by zero
+    sos_values = (sos_values / max_sos) * MAX_SOS_POINTS
+
+    for team in team_scores:
+        team_id = team['Team ID']
+        sos_points = float(sos_values[team_id]) if team_id < len(sos_values) else 0
+        team['SoS Points'] = sos_points
+
+        # Adjust conference points if the team is in FBS Independents
+        if team["Conference"] in FBS_INDEPENDENT:
+            team['Conference Points'] = (sos_points / MAX_SOS_POINTS) * MAX_FBS_IND_CON_POINTS
+            team['Total Points'] += team['Conference Points']
+
+        team['Total Points'] += team['SoS Points']
+
+    return team_scores
+
+# Function to shift ratings so the weakest team with a game sits at 0 (teams without games stay at 0)
+def rating_strength(graph, ratings):
+    has_games = np.asarray(graph.opponents.sum(axis=1)).ravel() > 0
+    if not has_games.any():
+        return np.zeros(graph.num_teams)
+    return np.where(has_games, ratings - ratings[has_games].min(), 0)
+
+# Function to build a scorer whose SoS is the sum of the opponents' ratings over every scheduled
+# game (like the points-based SoS), or with `replace` the team's own rating
+def rating_sos_scorer(system, replace=False):
+    def calculate_strength_of_schedule_rating(season, team_scores):
+        graph = season.graph
+        strength = rating_strength(graph, RATING_SYSTEMS[system](graph))
+        return add_sos_points(team_scores, strength if replace else graph.opponents @ strength)
+    return calculate_strength_of_schedule_rating
+
+
+#######################################################
+#                                                     #
+#                    Iterative SoS                    #
+#                                                     #
+#######################################################
+# The one-pass SoS sums opponents' Total Points before SoS, so an opponent's own schedule never
+# counts. Here a team's strength is its pre-SoS Total Points plus the SoS it earns from its
+# opponents' current strength, repeated until the strengths stop changing (a power iteration,
+# like PageRank). Each step is damped by MAX_SOS_POINTS / strength, so it converges geometrically
+
+# Function to iterate the SoS share (opponents' strength / the best schedule's) to its fixed point.
+# `weights` is the points a full share is worth per team (SoS plus FBS independents' conference points);
+# `start` warm-starts from an earlier strength vector. Returns (share, strength, iterations)
+def iterative_sos(opponents, base, weights, start=None, tolerance=ITERATIVE_SOS_TOLERANCE,
+                  max_iterations=ITERATIVE_SOS_MAX_ITERATIONS):
+    strength = base if start is None else start
+    for iteration in range(1, max_iterations + 1):
+        sos = opponents @ strength
+        max_sos = sos.max() if len(sos) else 1
+        share = sos / (max_sos or 1)  # Avoid division by zero
+        updated = base + weights * share
+        if np.abs(updated - strength).max(initial=0) <= tolerance:
+            return share, updated, iteration
+        strength = updated
+    raise RuntimeError(f"Iterative SoS did not converge in {max_iterations} iterations")
+
+# Iterative SoS stage for one run. `strengths` (by team name) warm-starts it, e.g. from last
+# week's converged strengths; the converged ones are left in .strengths afterwards
+class IterativeSoS:
+    def __init__(self, strengths=None):
+        self.strengths = dict(strengths or {})
+        self.iterations = 0
+
+    def __call__(self, season, team_scores):
+        graph = season.graph
+        base = graph.team_vector(team_scores, 'Total Points')
+        weights = np.full(graph.num_teams, float(MAX_SOS_POINTS))
+        for team in team_scores:
+            if team["Conference"] in FBS_INDEPENDENT and team["Team ID"] < graph.num_teams:
+                weights[team["Team ID"]] += MAX_FBS_IND_CON_POINTS
+        names = season.teams.names[:graph.num_teams]
+        start = None
+        if self.strengths:
+            start = np.array([self.strengths.get(name, value) for name, value in zip(names, base.tolist())])
+
+        share, strength, self.iterations = iterative_sos(graph.opponents, base, weights, start)
+        self.strengths = dict(zip(names, strength.tolist()))
+        return add_sos_points(team_scores, share)
+
+# Factories for the SoS scorers, so every run gets its own scorer and no state (such as the
+# iterative SoS's strengths) carries over between seasons or runs. "schedule" keeps the
+# engine's own points-based SoS
+SOS_SCORERS = {"schedule": None, "iterative": IterativeSoS}
+for name in RATING_SYSTEMS:
+    SOS_SCORERS[name] = partial(rating_sos_scorer, name)
+    SOS_SCORERS[f"{name}-rating"] = partial(rating_sos_scorer, name, replace=True)
+DEFAULT_SOS = "schedule"
+
+# Function to swap an engine's SoS stage for a new scorer from SOS_SCORERS; the other stages are unchanged
+def engine_with_sos(engine, sos=DEFAULT_SOS):
+    engine = ENGINES[engine] if isinstance(engine, str) else engine
+    if SOS_SCORERS[sos] is None:
+        return engine
+    return ScoringEngine(engine.score_teams, SOS_SCORERS[sos](), engine.best_win, engine.lowest_loss)
+
+
+#######################################################
+#                                                     #
+#                   Rating Tables                     #
+#                                                     #
+#######################################################
+# Function to rate every team with a record and sort best first
+def rate_teams(season, system="massey"):
+    ratings = RATING_SYSTEMS[system](season.graph)
+    rows = [
+        {
+            "Team": season.teams.labels[team_id],
+            "Team ID": team_id,
+            "Conference": team.get("conference"),
+            "Rating": float(ratings[team_id]) if team_id < len(ratings) else np.nan
+        }
+        for team, team_id in zip(season.records, season.record_ids)
+    ]
+    return pd.DataFrame(rows).sort_values(by="Rating", ascending=False)
+
+
+# Main
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rate teams with the Massey, Colley or Elo system")
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--system", choices=RATING_SYSTEMS, default="massey")
+    parser.add_argument("--fetch", choices=FETCH_BACKENDS, default="async", help="How the API data is loaded")
+    parser.add_argument("--fixture", metavar="DIR", help="Replay a recorded fixture directory instead of calling the API")
+    parser.add_argument("--snapshot", metavar="DIR", help="Load the season from a columnar snapshot directory")
+    parser.add_argument("--top", type=int, default=25, help="Number of teams to print")
+    args = parser.parse_args()
+
+    try:
+        if args.snapshot:
+            season = load_snapshot(args.year, args.snapshot)
+        else:
+            season = load_season_data(args.year, fixture_backend(args.fixture) if args.fixture else args.fetch)
+        start = time.perf_counter()
+        RATING_SYSTEMS[args.system](season.graph)
+        elapsed = time.perf_counter() - start
+
+        rated = rate_teams(season, args.system).head(args.top)
+        print(f"Top {args.top} Teams by {args.system.capitalize()} Rating ({elapsed * 1000:.1f} ms to solve):")
+        write_lines(sys.stdout, format_rows(
+            f"%2d. %-{TEAM_WIDTH}s | Conference: %-{CONFERENCE_WIDTH}s | Rating: %.3f",
+            range(1, len(rated) + 1), text_values(rated, "Team"), text_values(rated, "Conference"),
+            column_values(rated, "Rating")
+        ))
+    except Exception as e:
+        print(f"An error occurred: {e}")
@@ -0,0 +1,176 @@
+import html
+import os
+import sys
+from contextlib import nullcontext
+
+import numpy as np
+import pandas as pd
+
+TEAM_WIDTH = 30
+CONFERENCE_WIDTH = 15
+REPORT_CHUNK_ROWS = 5000  # Rows rendered per write when streaming large (multi-season) tables
+
+# (label, points column, opponent column) for each field of a ranking line
+RANKING_FIELDS = [
+    ("Total", "Total Points", None),
+    ("Base Non-Result Points", "Base Non-Result Points", None),
+    ("Record", "Record Points", None),
+    ("Offense", "Offense Points", None),
+    ("Defense", "Defense Points", None),
+    ("Conference", "Conference Points", None),
+    ("SoS", "SoS Points", None),
+    ("Best Win", "Best Win Points", "Best Win Team"),
+    ("Lowest Loss", "Lowest Loss Points", "Lowest Loss Team")
+]
+SUMMARY_FIELDS = [RANKING_FIELDS[0], RANKING_FIELDS[6], RANKING_FIELDS[7], RANKING_FIELDS[8]]
+
+
+#######################################################
+#                                                     #
+#                  Column Formatting                  #
+#                                                     #
+#######################################################
+# Rows are formatted from whole columns with one printf-style template per line; no per-row
+# Series is ever built (DataFrame.iterrows builds one per row, which dominated report time)
+
+# Function to read a column as a list of Python values; a missing column counts as `default`
+def column_values(table, column, default=0):
+    if column not in table.columns:
+        return [default] * len(table)
+    return table[column].tolist()
+
+# Function to read a column as text the way an f-string would print it (NaN / None as "nan" / "None")
+def text_values(table, column, default=""):
+    return [str(value) for value in column_values(table, column, default)]
+
+# Function to format every row with `template`, taking one value per row from each column
+def format_rows(template, *columns):
+    return [template % values for values in zip(*columns)]
+
+# Function to build the "Team | Conference: ... | Total: ... | ..." lines of a ranking table, ranked from `start`.
+# `marks` is appended to each conference (e.g. " (C)" for auto bids); `end` closes every line
+def ranking_lines(table, fields=RANKING_FIELDS, marks=None, end=" | ", start=1):
+    conference = text_values(table, "Conference")
+    if marks is not None:
+        conference = [name + mark for name, mark in zip(conference, marks)]
+    template = f"%2d. %-{TEAM_WIDTH}s | Conference: %-{CONFERENCE_WIDTH}s"
+    columns = [range(start, start + len(table)), text_values(table, "Team"), conference]
+    for label, points_column, team_column in fields:
+        template += f" | {label}: %.2f"
+        columns.append(column_values(table, points_column))
+        if team_column:
+            template += " (%s)"
+            columns.append(text_values(table, team_column))
+    return format_rows(template + end, *columns)
+
+# Function to mark auto-bid teams with " (C)"
+def auto_bid_marks(final_teams):
+    if "Auto Bid" not in final_teams.columns:
+        return None
+    return np.where(final_teams["Auto Bid"].fillna(False).to_numpy(dtype=bool), " (C)", "").tolist()
+
+# Function to build the bracket: top 4 seeds get byes, 5-12 play highest vs lowest,
+# and seed i meets the winner of first-round match i in the quarterfinals
+def bracket_lines(final_teams):
+    teams = text_values(final_teams, "Team")
+    top_4 = teams[:4]
+    rest_8 = teams[4:]
+    lines = ["", "Tournament Bracket:", "Top 4 Teams (First-Round Byes):"]
+    lines += format_rows("%d. %s", range(1, len(top_4) + 1), top_4)
+    lines += ["", "First Round Matchups:"]
+    lines += format_rows("%s vs %s", rest_8[:4], rest_8[::-1][:4])
+    lines += ["", "Quarterfinal Matchups:"]
+    lines += format_rows("%s vs Winner of Match %d", top_4, range(1, len(top_4) + 1))
+    return lines
+
+# Function to build the full text report: ranking table, final 12 and bracket
+def results_lines(rankings, final_teams=None, conference_champs=()):
+    lines = ["Top 25 Teams Based on Overall Rankings:"]
+    lines += ranking_lines(rankings)
+    if final_teams is None:
+        return lines
+    lines += [
+        "",
+        "Final 12 Teams:",
+        "Conference champions & Best Power of 5 conference champion get auto bids: " + ", ".join(conference_champs)
+    ]
+    lines += ranking_lines(final_teams, marks=auto_bid_marks(final_teams))
+    return lines + bracket_lines(final_teams)
+
+
+#######################################################
+#                                                     #
+#                  Streaming Writers                  #
+#                                                     #
+#######################################################
+# Each writer takes an open text file and writes the table REPORT_CHUNK_ROWS rows at a time
+
+# Function to split a table into row chunks
+def chunks(table, chunk_rows=REPORT_CHUNK_ROWS):
+    for start in range(0, len(table), chunk_rows):
+        yield table.iloc[start:start + chunk_rows]
+
+# Function to write lines to a file in one call
+def write_lines(f, lines):
+    if lines:
+        f.write("\n".join(lines) + "\n")
+
+# Text: one ranking section per season when the table has a "Year" column
+def stream_text(table, f, chunk_rows=REPORT_CHUNK_ROWS):
+    seasons = table.groupby("Year", sort=False) if "Year" in table.columns else [(None, table)]
+    for year, season in seasons:
+        if year is not None:
+            write_lines(f, [f"{year} Season Rankings:"])
+        for start, chunk in enumerate(chunks(season, chunk_rows)):
+            write_lines(f, ranking_lines(chunk, start=start * chunk_rows + 1))
+        if year is not None:
+            write_lines(f, [""])
+
+def stream_csv(table, f, chunk_rows=REPORT_CHUNK_ROWS):
+    for number, chunk in enumerate(chunks(table, chunk_rows)):
+        chunk.to_csv(f, header=number == 0, index=False)
+
+# JSON: one array of records, identical to DataFrame.to_json(orient="records", indent=2)
+def stream_json(table, f, chunk_rows=REPORT_CHUNK_ROWS):
+    f.write("[")
+    for number, chunk in enumerate(chunks(table, chunk_rows)):
+        records = chunk.to_json(orient="records", indent=2)[1:-1].strip("\n")
+        f.write((",\n" if number else "\n") + records)
+    f.write("\n]\n" if len(table) else "]\n")
+
+# Function to format one column of a chunk as HTML cell text (numbers to 2 decimals, blanks for missing)
+def html_cells(chunk, column):
+    values = chunk[column]
+    missing = values.isna().tolist()
+    if pd.api.types.is_float_dtype(values):
+        return ["" if blank else "%.2f" % value for value, blank in zip(values.tolist(), missing)]
+    return ["" if blank else html.escape(str(value)) for value, blank in zip(values.tolist(), missing)]
+
+def stream_html(table, f, chunk_rows=REPORT_CHUNK_ROWS):
+    header = "".join(f"<th>{html.escape(str(column))}</th>" for column in table.columns)
+    write_lines(f, ["<table>", f"<thead><tr>{header}</tr></thead>", "<tbody>"])
+    template = "<tr>" + "<td>%s</td>" * len(table.columns) + "</tr>"
+    for chunk in chunks(table, chunk_rows):
+        write_lines(f, format_rows(template, *(html_cells(chunk, column) for column in chunk.columns)))
+    write_lines(f, ["</tbody>", "</table>"])
+
+REPORT_WRITERS = {
+    "text": stream_text,
+    "csv": stream_csv,
+    "html": stream_html,
+    "json": stream_json
+}
+REPORT_EXTENSIONS = {".txt": "text", ".csv": "csv", ".html": "html", ".json": "json"}
+
+# Function to open `path` for writing, or use stdout when no path is given
+def open_report(path=None):
+    return open(path, "w", newline="") if path else nullcontext(sys.stdout)
+
+# Function to stream a ranking table (one season or a multi-season batch) to a file or stdout;
+# the format defaults to the file extension
+def write_report(table, path=None, file_format=None, chunk_rows=REPORT_CHUNK_ROWS):
+    if file_format is None:
+        file_format = REPORT_EXTENSIONS.get(os.path.splitext(path or "")[1].lower(), "text")
+    with open_report(path) as f:
+        REPORT_WRITERS[file_format](table, f, chunk_rows)
+    return path
@@ -0,0 +1,510 @@
+import argparse
+import heapq
+import time
+from collections import deque
+from itertools import product, starmap
+from multiprocessing import Pool
+
+import numpy as np
+import scipy.sparse as sp
+
+from .config import (
+    CONFERENCE_CHAMP_BONUS, CONFERENCE_CHAMPS, FBS_INDEPENDENT, MAX_BEST_WIN, MAX_FBS_IND_CON_POINTS,
+    MAX_LOWEST_LOSS, MAX_RECORD_POINTS, MAX_SOS_POINTS
+)
+from .engines import POOL_PROCESSES
+from .fetch import FETCH_BACKENDS, fixture_backend
+from .scoring import calculate_conference_points, calculate_defense_points, calculate_offense_points
+from .season import load_season_data
+from .snapshot import load_snapshot
+
+PLAYOFF_SPOTS = 12
+RANKED_TEAMS = 50  # rank_teams keeps the top 50 and auto bids are taken from that list
+SPLIT_GAMES = 6  # Games fixed up front to split the search into 2^6 independent subtrees
+PATHS_KEPT = 10  # Largest "makes it if ..." paths reported
+GAMES_SHOWN = 15  # Games with the biggest swing reported
+MAX_NODES = 1_000_000  # Search budget; outcomes still undecided when it runs out are reported as too close to call
+
+UNDECIDED, HOME_WIN, AWAY_WIN = -1, 0, 1
+
+
+#######################################################
+#                                                     #
+#                   Interval Bounds                   #
+#                                                     #
+#######################################################
+# Function to bound c * d for c in [c_lo, c_hi] and d in [d_lo, d_hi] (unbounded on 0 * inf)
+def product_bounds(c_lo, c_hi, d_lo, d_hi):
+    if 0 < c_lo <= c_hi < np.inf:
+        # Shared positive normalizer (the usual case): the extremes come from d's own ends
+        return np.minimum(c_lo * d_lo, c_hi * d_lo), np.maximum(c_lo * d_hi, c_hi * d_hi)
+    with np.errstate(invalid="ignore"):
+        corners = np.stack(np.broadcast_arrays(c_lo * d_lo, c_lo * d_hi, c_hi * d_lo, c_hi * d_hi))
+    lo = corners.min(axis=0)
+    hi = corners.max(axis=0)
+    unbounded = np.isnan(lo) | np.isnan(hi)
+    return np.where(unbounded, -np.inf, lo), np.where(unbounded, np.inf, hi)
+
+# Function to bound 1 / b for b in [b_lo, b_hi] (unbounded if b can be 0; 1 / inf is 0)
+def inverse_bounds(b_lo, b_hi):
+    with np.errstate(divide="ignore"):
+        lo, hi = 1 / np.asarray(b_hi, dtype=float), 1 / np.asarray(b_lo, dtype=float)
+    unbounded = (b_lo <= 0) & (b_hi >= 0)
+    return np.where(unbounded, -np.inf, lo), np.where(unbounded, np.inf, hi)
+
+# Function to take a per-team max (or min) of edge values, grouped by a precomputed edge order
+def grouped_extreme(reduce, values, order, starts, owners, size, empty):
+    out = np.full(size, empty)
+    if len(starts):
+        out[owners] = reduce.reduceat(values[order], starts)
+    return out
+
+# Function to precompute the grouping of edges by one endpoint (sort order, segment starts, owners)
+def edge_groups(endpoint):
+    order = np.argsort(endpoint, kind="stable")
+    owners, starts = np.unique(endpoint[order], return_index=True)
+    return order, starts, owners
+
+
+# Interval bounds on each team's score components. The three normalized categories share one
+# normalizer across the country, so comparing two teams factors it out instead of bounding each
+# team on its own: Total = pre + sos * sos_scale + best * best_scale - loss * lowest.
+class ScenarioBounds:
+    def __init__(self, pre, sos, sos_scale, best, best_scale, loss, lowest, champ_sure, champ_possible, open_titles, ranked):
+        self.pre = pre
+        self.terms = [(sos_scale, sos, 1), (best_scale, best, 1), (lowest, loss, -1)]
+        self.champ_sure = champ_sure
+        self.champ_possible = champ_possible
+        self.open_titles = open_titles
+        self.ranked = ranked
+        self.compared = {}
+
+    # Function to combine the components (given as lo/hi pairs) into lo/hi totals
+    def combine(self, pre, components):
+        total_lo, total_hi = pre
+        for (scale, _, sign), component in zip(self.terms, components):
+            term_lo, term_hi = product_bounds(*scale, *component)
+            if sign > 0:
+                total_lo, total_hi = total_lo + term_lo, total_hi + term_hi
+            else:
+                total_lo, total_hi = total_lo - term_hi, total_hi - term_lo
+        return total_lo, total_hi
+
+    # Function to bound every team's Total Points
+    def totals(self):
+        return self.combine(self.pre, [component for _, component, _ in self.terms])
+
+    # Function to bound Total Points of every team minus that of `team_id`
+    def versus(self, team_id):
+        if team_id not in self.compared:
+            difference = lambda pair: (pair[0] - pair[1][team_id], pair[1] - pair[0][team_id])
+            self.compared[team_id] = self.combine(
+                difference(self.pre), [difference(component) for _, component, _ in self.terms]
+            )
+        return self.compared[team_id]
+
+    # Function to give the lowest rank `team_id` can finish at
+    def rank_hi(self, team_id):
+        _, above_hi = self.versus(team_id)
+        return int((self.ranked & (above_hi >= 0)).sum()) + (0 if self.ranked[team_id] else 1)
+
+
+#######################################################
+#                                                     #
+#                   Scenario Model                    #
+#                                                     #
+#######################################################
+# The season's ranking with the remaining games left open. For a partial assignment of results
+# it bounds every team's final Total Points; with every game decided the bounds are exact.
+class ScenarioModel:
+    def __init__(self, season, conference_champs=CONFERENCE_CHAMPS, title_games=(), reopen_week=None):
+        teams = season.teams
+        games = list(season.schedules)
+        for home_team, away_team in title_games:
+            games.append({"home_team": home_team, "away_team": away_team, "notes": "Championship"})
+        home = np.array([teams.add(game.get("home_team")) for game in games], dtype=np.int64)
+        away = np.array([teams.add(game.get("away_team")) for game in games], dtype=np.int64)
+        size = len(teams)
+        self.names = teams.names
+
+        # Records and the fixed part of Base Non-Result Points (offense, defense, conference)
+        self.has_record = np.zeros(size, dtype=bool)
+        self.conference = np.full(size, None, dtype=object)
+        wins, losses, ties = np.zeros(size), np.zeros(size), np.zeros(size)
+        self.base_fixed = np.zeros(size)
+        for team, team_id in zip(season.records, season.record_ids):
+            total = team.get("total", {})
+            self.has_record[team_id] = True
+            self.conference[team_id] = team.get("conference")
+            wins[team_id] = total.get("wins", 0)
+            losses[team_id] = total.get("losses", 0)
+            ties[team_id] = total.get("ties", 0)
+            self.base_fixed[team_id] = (
+                calculate_offense_points(team_id, season.stats)
+                - calculate_defense_points(team_id, season.stats)
+                + calculate_conference_points(team.get("conference"))
+            )
+        self.independent = np.isin(self.conference, FBS_INDEPENDENT)
+        self.sos_weight = MAX_SOS_POINTS + self.independent * MAX_FBS_IND_CON_POINTS
+
+        # Unscored games are open; --reopen-week also reopens played games from that week on,
+        # taking their results back out of the records
+        home_points = np.array([game.get("home_points") for game in games], dtype=float)
+        away_points = np.array([game.get("away_points") for game in games], dtype=float)
+        played = ~(np.isnan(home_points) | np.isnan(away_points))
+        if reopen_week is not None:
+            week = np.array([game.get("week") or 0 for game in games], dtype=float)
+            reopened = played & (week >= reopen_week) & np.array(
+                [game.get("season_type", "regular") == "regular" for game in games], dtype=bool
+            )
+            tied = reopened & (home_points == away_points)
+            home_won = reopened & (home_points > away_points)
+            away_won = reopened & (home_points < away_points)
+            for won, winner, loser in ((home_won, home, away), (away_won, away, home)):
+                wins -= np.bincount(winner[won], minlength=size)
+                losses -= np.bincount(loser[won], minlength=size)
+            ties -= np.bincount(home[tied], minlength=size) + np.bincount(away[tied], minlength=size)
+            played &= ~reopened
+        open_games = np.flatnonzero(~played)
+        self.open_home = home[open_games]
+        self.open_away = away[open_games]
+        self.num_open = len(open_games)
+        self.open_games = [games[index] for index in open_games]
+        self.wins = wins
+        self.games_total = (
+            wins + losses + ties
+            + np.bincount(self.open_home, minlength=size) + np.bincount(self.open_away, minlength=size)
+        )
+
+        # Every scheduled game counts towards SoS, played or not
+        self.opponents = sp.coo_matrix((np.ones(len(home)), (home, away)), shape=(size, size)).tocsr()
+        self.opponents = (self.opponents + self.opponents.T).tocsr()
+        self.in_graph = np.diff(self.opponents.indptr) > 0
+
+        # Win edges: played games (ties go to the away team) plus both directions of every open game
+        home_won = home_points > away_points
+        played_winners = np.where(home_won, home, away)[played]
+        played_losers = np.where(home_won, away, home)[played]
+        self.edge_winner = np.concatenate([played_winners, self.open_home, self.open_away])
+        self.edge_loser = np.concatenate([played_losers, self.open_away, self.open_home])
+        self.played_edges = np.ones(len(played_winners), dtype=bool)
+        self.by_winner = edge_groups(self.edge_winner)
+        self.by_loser = edge_groups(self.edge_loser)
+
+        # Conference champions; a title game's winner replaces the listed champion of its conference
+        self.title_game = np.array([
+            "Championship" in (game.get("notes") or "") for game in self.open_games
+        ], dtype=bool)
+        title_conferences = {self.conference[team_id] for team_id in self.open_home[self.title_game]}
+        self.champs = np.zeros(size, dtype=bool)
+        for team_id in teams.ids_for(conference_champs):
+            if team_id < size and self.conference[team_id] not in title_conferences:
+                self.champs[team_id] = True
+        self.num_champs = int(self.champs.sum() + self.title_game.sum())
+        self.size = size
+
+    # Function to bound every team's score components for an assignment of the open games
+    def bounds(self, results):
+        size = self.size
+        undecided = results == UNDECIDED
+        home_won = results == HOME_WIN
+        away_won = results == AWAY_WIN
+        count = lambda teams, weights: np.bincount(teams, weights=weights, minlength=size)
+        wins = self.wins + count(self.open_home, home_won) + count(self.open_away, away_won)
+        still_open = count(self.open_home, undecided) + count(self.open_away, undecided)
+
+        # Record points: every open game lost / won
+        with np.errstate(divide="ignore", invalid="ignore"):
+            share_lo = np.where(self.games_total > 0, wins / self.games_total, 0)
+            share_hi = np.where(self.games_total > 0, (wins + still_open) / self.games_total, 0)
+        base_lo = share_lo * MAX_RECORD_POINTS + self.base_fixed
+        base_hi = share_hi * MAX_RECORD_POINTS + self.base_fixed
+
+        # Champion bonus, open while a title game is undecided
+        champ_sure = self.champs.copy()
+        champ_possible = self.champs.copy()
+        open_titles = []
+        for game in np.flatnonzero(self.title_game):
+            teams = (self.open_home[game], self.open_away[game])
+            if results[game] == UNDECIDED:
+                champ_possible[list(teams)] = True
+                open_titles.append(teams)
+            else:
+                champ_sure[teams[results[game]]] = champ_possible[teams[results[game]]] = True
+        champ_sure &= self.has_record
+        champ_possible &= self.has_record
+        pre_lo = np.where(self.has_record, base_lo + champ_sure * CONFERENCE_CHAMP_BONUS, 0)
+        pre_hi = np.where(self.has_record, base_hi + champ_possible * CONFERENCE_CHAMP_BONUS, 0)
+
+        # SoS: opponents' pre-result totals over every scheduled game, divided by the best
+        # (independents also get it as conference points)
+        sos_lo = self.opponents @ pre_lo
+        sos_hi = self.opponents @ pre_hi
+        max_lo, max_hi = sos_lo[self.in_graph].max(), sos_hi[self.in_graph].max()
+        if max_lo == max_hi == 0:
+            max_lo = max_hi = 1  # Avoid division by zero
+        sos = (sos_lo * self.sos_weight, sos_hi * self.sos_weight)
+
+        # Which win edges certainly / possibly happen
+        sure = np.concatenate([self.played_edges, home_won, away_won])
+        possible = sure | np.concatenate([self.played_edges, undecided, undecided])
+
+        # Best Win: the best Base Non-Result Points among the teams beaten, divided by the best
+        win_lo = np.where(self.has_record, base_lo, 0)[self.edge_loser]
+        win_hi = np.where(self.has_record, base_hi, 0)[self.edge_loser]
+        best_lo = np.maximum(grouped_extreme(np.maximum, np.where(sure, win_lo, -np.inf), *self.by_winner, size, -np.inf), 0)
+        best_hi = np.maximum(grouped_extreme(np.maximum, np.where(possible, win_hi, -np.inf), *self.by_winner, size, -np.inf), 0)
+        best = (best_lo * MAX_BEST_WIN, best_hi * MAX_BEST_WIN)
+
+        # Lowest Loss: the country's lowest such value divided by the worst Base Non-Result Points
+        # among the teams lost to (1 / inf = 0 for losses to teams without a record)
+        loss_lo = np.where(self.has_record, base_lo, np.inf)[self.edge_winner]
+        loss_hi = np.where(self.has_record, base_hi, np.inf)[self.edge_winner]
+        lowest_lo = grouped_extreme(np.minimum, np.where(possible, loss_lo, np.inf), *self.by_loser, size, np.inf)
+        lowest_hi = grouped_extreme(np.minimum, np.where(sure, loss_hi, np.inf), *self.by_loser, size, np.inf)
+        has_loss = np.bincount(self.edge_loser, weights=sure, minlength=size) > 0
+        may_lose = np.bincount(self.edge_loser, weights=possible, minlength=size) > 0
+        inverse_lo, inverse_hi = inverse_bounds(lowest_lo, lowest_hi)
+        inverse_lo = np.where(may_lose, np.where(has_loss, inverse_lo, np.minimum(inverse_lo, 0)), 0)
+        inverse_hi = np.where(may_lose, np.where(has_loss, inverse_hi, np.maximum(inverse_hi, 0)), 0)
+        loss = (inverse_lo * MAX_LOWEST_LOSS, inverse_hi * MAX_LOWEST_LOSS)
+        lowest = (
+            lowest_lo[may_lose].min() if may_lose.any() else np.inf,
+            lowest_hi[has_loss].min() if has_loss.any() else np.inf
+        )
+
+        return ScenarioBounds(
+            (pre_lo, pre_hi), sos, inverse_bounds(max_lo, max_hi), best, inverse_bounds(best_lo.max(), best_hi.max()),
+            loss, lowest, champ_sure, champ_possible, open_titles, self.has_record
+        )
+
+    # Function to decide whether `team_id` makes the field in every (True) or no (False)
+    # completion of the assignment, or None when it depends on the open games
+    def decide(self, team_id, bounds):
+        others = self.has_record.copy()
+        others[team_id] = False
+        above_lo, above_hi = bounds.versus(team_id)
+        possibly_above = others & (above_hi >= 0)
+        surely_above = others & (above_lo > 0)
+        if surely_above.sum() >= RANKED_TEAMS:
+            return False
+
+        # Field: every champion in the top 50, then the best other teams
+        champ_sure, champ_possible = bounds.champ_sure, bounds.champ_possible
+        if not champ_possible[team_id]:
+            ahead = (surely_above & ~champ_possible).sum()
+            if ahead + champ_sure.sum() >= PLAYOFF_SPOTS:
+                champs_in = sum(bounds.rank_hi(champ) <= RANKED_TEAMS for champ in np.flatnonzero(champ_sure))
+                if ahead + champs_in >= PLAYOFF_SPOTS:
+                    return False
+        if possibly_above.sum() < RANKED_TEAMS:
+            if champ_sure[team_id]:
+                return True
+            total_lo, total_hi = bounds.totals()
+            ranked_lo = np.sort(total_lo[self.has_record])
+            could_be_top = lambda team: len(ranked_lo) - np.searchsorted(ranked_lo, total_hi[team], side="right") < RANKED_TEAMS
+            champ_slots = sum(could_be_top(champ) for champ in np.flatnonzero(champ_sure))
+            champ_slots += sum(could_be_top(home) or could_be_top(away) for home, away in bounds.open_titles)
+            if (possibly_above & ~champ_sure).sum() + champ_slots < PLAYOFF_SPOTS:
+                return True
+        return None
+
+    # Function to select the field exactly once every game is decided (as populate_con_champs_and_top_teams)
+    def makes_field(self, team_id, totals, champs):
+        ranked = np.flatnonzero(self.has_record)
+        top = ranked[np.argsort(-totals[ranked], kind="stable")][:RANKED_TEAMS]
+        auto_bids = top[champs[top]]
+        at_large = top[~champs[top]][:PLAYOFF_SPOTS - len(auto_bids)]
+        return bool(np.isin(team_id, auto_bids) or np.isin(team_id, at_large))
+
+    # Function to pick the open game to branch on next: the team's own games, then title games,
+    # then games of teams that may finish either side of it, then games of their opponents (whose
+    # records feed their SoS, Best Win and Lowest Loss), widest first
+    def branch_order(self, team_id, results, bounds):
+        above_lo, above_hi = bounds.versus(team_id)
+        contested = self.has_record & (above_hi >= 0) & (above_lo <= 0)
+        contested[team_id] = True
+        linked = self.opponents @ contested.astype(float)
+        width = np.minimum(above_hi - above_lo, 1e6)
+        home, away = self.open_home, self.open_away
+        priority = (
+            8.0 * ((home == team_id) | (away == team_id)) + 4.0 * self.title_game
+            + 2.0 * (contested[home].astype(float) + contested[away]) + linked[home] + linked[away]
+        )
+        width = width[home] + width[away]
+        priority = np.where(results == UNDECIDED, priority + width / (1 + width.max()), -np.inf)
+        return int(np.argmax(priority))
+
+    # Function to describe an assignment as "Winner over Loser" lines
+    def describe(self, results):
+        lines = []
+        for game in np.flatnonzero(results != UNDECIDED):
+            teams = (self.names[self.open_home[game]], self.names[self.open_away[game]])
+            lines.append(f"{teams[results[game]]} over {teams[1 - results[game]]}")
+        return lines
+
+
+#######################################################
+#                                                     #
+#                 Branch-And-Bound Search             #
+#                                                     #
+#######################################################
+# Scenario counts for one team: how many completions put it in the field, broken down by game
+class ScenarioCounts:
+    def __init__(self, num_open):
+        self.made = 0
+        self.missed = 0
+        self.unresolved = 0
+        self.made_by_result = np.zeros((num_open, 2), dtype=object)
+        self.paths = []  # Heap of (scenarios, tie-break, results) for the largest "in" subtrees
+        self.nodes = 0
+
+    def add(self, decision, results):
+        undecided = results == UNDECIDED
+        scenarios = 2 ** int(undecided.sum())
+        if not decision:
+            self.missed += scenarios
+            return
+        self.made += scenarios
+        decided = np.flatnonzero(~undecided)
+        self.made_by_result[decided, results[decided]] += scenarios
+        self.made_by_result[undecided] += scenarios // 2
+        entry = (scenarios, tuple(results.tolist()))
+        if len(self.paths) < PATHS_KEPT:
+            heapq.heappush(self.paths, entry)
+        elif entry[0] > self.paths[0][0]:
+            heapq.heapreplace(self.paths, entry)
+
+    def skip(self, results):
+        self.unresolved += 2 ** int((results == UNDECIDED).sum())
+
+    def merge(self, other):
+        self.made += other.made
+        self.missed += other.missed
+        self.unresolved += other.unresolved
+        self.made_by_result += other.made_by_result
+        self.nodes += other.nodes
+        for entry in other.paths:
+            if len(self.paths) < PATHS_KEPT:
+                heapq.heappush(self.paths, entry)
+            elif entry[0] > self.paths[0][0]:
+                heapq.heapreplace(self.paths, entry)
+        return self
+
+# Function to count every completion of `results` in which the team makes the field. Subtrees
+# are expanded breadth-first, so a node budget is spent on the largest undecided subtrees.
+def search(model, team_id, results, counts, max_nodes=None):
+    queue = deque([results])
+    while queue:
+        results = queue.popleft()
+        if max_nodes is not None and counts.nodes >= max_nodes:
+            counts.skip(results)
+            continue
+        counts.nodes += 1
+        bounds = model.bounds(results)
+        if not (results == UNDECIDED).any():
+            counts.add(model.makes_field(team_id, bounds.totals()[0], bounds.champ_sure), results)
+            continue
+        decision = model.decide(team_id, bounds)
+        if decision is not None:
+            counts.add(decision, results)
+            continue
+        game = model.branch_order(team_id, results, bounds)
+        for result in (HOME_WIN, AWAY_WIN):
+            child = results.copy()
+            child[game] = result
+            queue.append(child)
+    return counts
+
+# Worker state: the model is sent to each process once
+worker_model = None
+
+def init_worker(model):
+    global worker_model
+    worker_model = model
+
+def search_subtree(team_id, results, max_nodes):
+    return search(worker_model, team_id, results, ScenarioCounts(worker_model.num_open), max_nodes)
+
+# Function to enumerate the open games for one team; the first few branching games are fixed up
+# front and each of the 2^SPLIT_GAMES subtrees is searched in its own process
+def enumerate_scenarios(model, team_id, processes=POOL_PROCESSES, split_games=SPLIT_GAMES, max_nodes=MAX_NODES):
+    results = np.full(model.num_open, UNDECIDED, dtype=np.int8)
+    split = []
+    for _ in range(min(split_games, model.num_open)):
+        game = model.branch_order(team_id, results, model.bounds(results))
+        split.append(game)
+        results[game] = HOME_WIN  # Placeholder so the next pick is a different game
+    prefixes = []
+    for assignment in product((HOME_WIN, AWAY_WIN), repeat=len(split)):
+        prefix = np.full(model.num_open, UNDECIDED, dtype=np.int8)
+        prefix[split] = assignment
+        prefixes.append(prefix)
+
+    subtree_nodes = max(max_nodes // len(prefixes), 1) if max_nodes else None
+    tasks = [(team_id, prefix, subtree_nodes) for prefix in prefixes]
+    counts = ScenarioCounts(model.num_open)
+    if processes > 1 and len(prefixes) > 1:
+        with Pool(processes=processes, initializer=init_worker, initargs=(model,)) as pool:
+            subtrees = pool.starmap(search_subtree, tasks)
+    else:
+        init_worker(model)
+        subtrees = list(starmap(search_subtree, tasks))
+    for subtree in subtrees:
+        counts.merge(subtree)
+    return counts
+
+def print_scenarios(model, team_name, counts, elapsed):
+    total = counts.made + counts.missed + counts.unresolved
+    print(f"{team_name}: {model.num_open} open games, {total:,} possible outcomes")
+    print(f"Makes the 12 in {counts.made:,} ({counts.made / total:.2%}) and misses in {counts.missed:,} ({counts.missed / total:.2%})")
+    if counts.unresolved:
+        print(f"Too close to call within {counts.nodes:,} nodes: {counts.unresolved:,} ({counts.unresolved / total:.2%})")
+
+    if counts.made:
+        print("\nGames that matter (share of the outcomes that put it in, by winner):")
+        shares = counts.made_by_result / counts.made
+        swing = np.abs(shares[:, HOME_WIN].astype(float) - shares[:, AWAY_WIN].astype(float))
+        for game in np.argsort(-swing, kind="stable")[:GAMES_SHOWN]:
+            if swing[game] < 0.005:
+                break
+            home, away = model.names[model.open_home[game]], model.names[model.open_away[game]]
+            print(f"  {home} {shares[game, HOME_WIN]:.1%} / {away} {shares[game, AWAY_WIN]:.1%}")
+
+        print("\nLargest paths in (every other result open):")
+        for scenarios, results in sorted(counts.paths, reverse=True):
+            print(f"  {scenarios:,} outcomes: " + (", ".join(model.describe(np.array(results))) or "any results"))
+    print(f"\nSearched {counts.nodes:,} nodes in {elapsed:.1f} s")
+
+
+# Main
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count the outcomes of the remaining games that put a team in the 12")
+    parser.add_argument("team", help="Team to check, e.g. \"Miami\"")
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--fetch", choices=FETCH_BACKENDS, default="async", help="How the API data is loaded")
+    parser.add_argument("--fixture", metavar="DIR", help="Replay a recorded fixture directory instead of calling the API")
+    parser.add_argument("--snapshot", metavar="DIR", help="Load the season from a columnar snapshot directory")
+    parser.add_argument("--reopen-week", type=int, default=None,
+                        help="Treat regular-season games from this week on as not yet played")
+    parser.add_argument("--title-game", nargs=2, action="append", default=[], metavar=("HOME", "AWAY"),
+                        help="Add a conference championship game; the winner replaces that conference's listed champion")
+    parser.add_argument("--processes", type=int, default=POOL_PROCESSES)
+    parser.add_argument("--max-nodes", type=int, default=MAX_NODES,
+                        help="Search budget; 0 searches until every outcome is decided")
+    args = parser.parse_args()
+
+    try:
+        if args.snapshot:
+            season = load_snapshot(args.year, args.snapshot)
+        else:
+            season = load_season_data(args.year, fixture_backend(args.fixture) if args.fixture else args.fetch)
+        team_id = season.teams.get(args.team)
+        if team_id is None:
+            raise ValueError(f"Unknown team: {args.team}")
+        model = ScenarioModel(season, CONFERENCE_CHAMPS, args.title_game, args.reopen_week)
+        started = time.perf_counter()
+        counts = enumerate_scenarios(model, team_id, args.processes, max_nodes=args.max_nodes or None)
+        print_scenarios(model, season.teams.names[team_id], counts, time.perf_counter() - started)
+    except Exception as e:
+        print(f"An error occurred: {e}")
@@ -0,0 +1,203 @@
+from .config import (
+    CONFERENCE_CHAMP_BONUS, CONFERENCE_POINTS, FBS_INDEPENDENT, MAX_BEST_WIN, MAX_DEFENSE_POINTS,
+    MAX_FBS_IND_CON_POINTS, MAX_LOWEST_LOSS, MAX_OFFENSE_POINTS, MAX_RECORD_POINTS, MAX_SOS_POINTS
+)
+from .teams import display_label
+
+
+#######################################################
+#                                                     #
+#                   Calculate Data                    #
+#                                                     #
+#######################################################
+# Function to calculate points based on Record
+def calculate_record_points(team):
+    wins = team.get("total", {}).get("wins", 0)
+    losses = team.get("total", {}).get("losses", 0)
+    ties = team.get("total", {}).get("ties", 0)
+    games = wins + losses + ties
+
+    # Points calculation for Record
+    if games > 0:
+        points = (wins / games) * MAX_RECORD_POINTS
+    else:
+        points = 0
+    return points
+
+# Function to calculate points based on Offense
+def calculate_offense_points(team_id, season_stats):
+    offense_overall = season_stats.offense.get(team_id)
+    if offense_overall is not None:
+        # Normalize offense overall to MAX_OFFENSE_POINTS
+        points = (offense_overall / season_stats.max_offense) * MAX_OFFENSE_POINTS
+    else:
+        points = 0
+    return points
+
+# Function to calculate points based on Defense
+def calculate_defense_points(team_id, season_stats):
+    defense_overall = season_stats.defense.get(team_id)
+    if defense_overall is not None:
+        # Normalize defense overall to MAX_DEFENSE_POINTS
+        points = (defense_overall / season_stats.max_defense) * MAX_DEFENSE_POINTS
+
+    else:
+        points = 0
+    return points
+
+# Function to calculate points based on Conference ranking
+def calculate_conference_points(conference):
+    return CONFERENCE_POINTS.get(conference, 0)  # Default to 0 if the conference is not listed
+
+# Function to compute Strength of Schedule
+def calculate_strength_of_schedule(season, team_scores):
+    # Convert team scores to a dictionary for quick lookup
+    team_scores_dict = {
+        team['Team ID']: team['Total Points']
+        for team in team_scores
+    }
+    
+    # Games are compiled once per run into team ID pairs and shared through the season context
+    graph = season.graph
+    
+    # Dictionary to store SoS values
+    sos_values = {}
+    
+    for home_team, away_team in zip(graph.home.tolist(), graph.away.tolist()):
+        # Ensure teams are initialized in the sos_values dictionary
+        if home_team not in sos_values:
+            sos_values[home_team] = 0
+        if away_team not in sos_values:
+            sos_values[away_team] = 0
+        
+        # Add opponent scores
+        sos_values[home_team] += team_scores_dict.get(away_team, 0)
+        sos_values[away_team] += team_scores_dict.get(home_team, 0)
+    
+    # Normalize SoS values
+    max_sos = max(sos_values.values()) if sos_values else 1  # Avoid division by zero
+    for team in sos_values:
+        sos_values[team] = (sos_values[team] / max_sos) * MAX_SOS_POINTS
+
+    # Update team scores with SoS and Best Win
+    for team in team_scores:
+        sos_points = sos_values.get(team['Team ID'], 0)
+
+        team['SoS Points'] = sos_points
+
+        # Adjust conference points if the team is in FBS Independents
+        if team["Conference"] in FBS_INDEPENDENT:
+            team['Conference Points'] = (sos_points / MAX_SOS_POINTS) * MAX_FBS_IND_CON_POINTS
+            team['Total Points'] += team['Conference Points']
+
+        team['Total Points'] += team['SoS Points']  # Add SoS to total points
+
+    return team_scores
+
+# Function to calculate points based on Best Win
+def calculate_best_win(season, team_scores):
+    # Convert team scores to a dictionary for quick lookup
+    team_scores_dict = {
+        team['Team ID']: team['Base Non-Result Points']
+        for team in team_scores
+    }
+    
+    # Completed games are compiled once per run into winner -> loser team ID pairs
+    graph = season.graph
+    
+    # Dictionary to store best win values
+    best_win_values = {}
+    best_win_teams = {}
+    
+    for winner, loser in zip(graph.winners.tolist(), graph.losers.tolist()):
+        # Calculate the difference in Base Non-Result Points
+        if winner not in best_win_values:
+            best_win_values[winner] = 0
+        if team_scores_dict.get(loser, 0) > best_win_values[winner]:
+            best_win_values[winner] = team_scores_dict.get(loser, 0)
+            best_win_teams[winner] = loser
+    
+    # Normalize Best Win values
+    max_best_win = max(best_win_values.values()) if best_win_values else 1  # Avoid division by zero
+    for team in best_win_values:
+        best_win_values[team] = (best_win_values[team] / max_best_win) * MAX_BEST_WIN
+
+    # Update team scores with Best Win points
+    for team in team_scores:
+        team_id = team['Team ID']
+        team['Best Win Points'] = best_win_values.get(team_id, 0)
+        team['Best Win Team'] = season.teams.names[best_win_teams[team_id]] if team_id in best_win_teams else ""
+        team['Total Points'] += team['Best Win Points']
+
+    return team_scores
+
+# Function to calculate points based on Lowest Loss
+def calculate_lowest_loss(season, team_scores):
+    # Convert team scores to a dictionary for quick lookup
+    team_scores_dict = {
+        team['Team ID']: team['Base Non-Result Points']
+        for team in team_scores
+    }
+    
+    # Completed games are compiled once per run into winner -> loser team ID pairs
+    graph = season.graph
+    
+    # Dictionary to store lowest loss values
+    lowest_loss_values = {}
+    lowest_loss_teams = {}
+    
+    for winner, loser in zip(graph.winners.tolist(), graph.losers.tolist()):
+        # Calculate the lowest Base Non-Result Points for losses
+        if loser not in lowest_loss_values:
+            lowest_loss_values[loser] = float('inf')  # Initialize with a high value
+        
+        if team_scores_dict.get(winner, float('inf')) < lowest_loss_values[loser]:
+            lowest_loss_values[loser] = team_scores_dict.get(winner, float('inf'))
+            lowest_loss_teams[loser] = winner
+    
+    # Normalize Lowest Loss values (inversely since lower points are better)
+    min_lowest_loss = min(lowest_loss_values.values()) if lowest_loss_values else 1  # Avoid division by zero
+    for team in lowest_loss_values:
+        lowest_loss_values[team] = (min_lowest_loss / lowest_loss_values[team]) * MAX_LOWEST_LOSS
+
+    # Update team scores with Lowest Loss points
+    for team in team_scores:
+        team_id = team['Team ID']
+        team['Lowest Loss Points'] = lowest_loss_values.get(team_id, 0)
+        team['Lowest Loss Team'] = season.teams.names[lowest_loss_teams[team_id]] if team_id in lowest_loss_teams else ""
+        team['Total Points'] -= team['Lowest Loss Points']
+
+    return team_scores
+
+# Function to add the champion bonus to each conference champion (`champ_ids` from TeamRegistry.ids_for)
+def add_points_for_conference_champs(champ_ids, team_scores):
+    for team in team_scores:
+        if team["Team ID"] in champ_ids:
+            team["Total Points"] += CONFERENCE_CHAMP_BONUS  # Add points
+            team["Conference Champ Bonus"] = CONFERENCE_CHAMP_BONUS  # Add an indicator for the bonus
+        else:
+            team["Conference Champ Bonus"] = 0  # No bonus for non-champs
+    return team_scores
+
+# Function to score one team's record, offense, defense and conference points
+def calculate_team_scores(team, season_stats, team_id):
+    conference = team.get("conference")
+    record_points = calculate_record_points(team)
+    offense_points = calculate_offense_points(team_id, season_stats)
+    defense_points = calculate_defense_points(team_id, season_stats)
+    conference_points = calculate_conference_points(conference)
+    total_points = record_points + offense_points - defense_points + conference_points
+
+    total = team.get("total", {})
+
+    return {
+        "Team": display_label(team["team"], total.get("wins", 0), total.get("losses", 0), total.get("ties", 0)),
+        "Team ID": team_id,
+        "Conference": conference,
+        "Record Points": record_points,
+        "Offense Points": offense_points,
+        "Defense Points": defense_points,
+        "Conference Points": conference_points,
+        "Total Points": total_points,
+        "Base Non-Result Points": total_points
+    }
@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from .fetch import FETCH_BACKENDS, parse_team_defense, parse_team_offense
+from .teams import TeamRegistry, display_label
+from .trace import get_tracer
+
+
+#######################################################
+#                                                     #
+#                 Season Data Context                 #
+#                                                     #
+#######################################################
+# Holds every API payload a ranking run needs so each endpoint is only fetched once.
+# Teams are registered in game order first, so IDs below graph.num_teams are the teams with games.
+class SeasonData:
+    def __init__(self, year, records, offense_data, defense_data, schedules):
+        self.year = year
+        self.records = records
+        self.offense_data = offense_data
+        self.defense_data = defense_data
+        self.schedules = schedules
+        self.teams = TeamRegistry()
+        self.graph = SeasonGraph(schedules, self.teams)
+        self.record_ids = [self.teams.add(team["team"]) for team in records]
+        self.stats = SeasonStats(offense_data, defense_data, self.teams)
+
+        # Display labels for every team with a record
+        for team_id, team in zip(self.record_ids, records):
+            total = team.get("total", {})
+            self.teams.set_label(team_id, display_label(
+                team["team"], total.get("wins", 0), total.get("losses", 0), total.get("ties", 0)
+            ))
+
+    # Function to lay out each team's record as columns (team_id, team, conference, wins, losses, ties)
+    def record_columns(self):
+        totals = [team.get("total", {}) for team in self.records]
+        return pd.DataFrame({
+            "team_id": self.record_ids,
+            "team": [team["team"] for team in self.records],
+            "conference": [team.get("conference") for team in self.records],
+            "wins": [total.get("wins", 0) for total in totals],
+            "losses": [total.get("losses", 0) for total in totals],
+            "ties": [total.get("ties", 0) for total in totals]
+        })
+
+# Prebuilt team ID -> stat lookups and normalization constants, computed once per season
+class SeasonStats:
+    def __init__(self, offense_data, defense_data, teams):
+        self.offense = index_overall(offense_data, teams)
+        self.defense = index_overall(defense_data, teams)
+        self.max_offense = max((o.get("overall", 1) for o in offense_data), default=1)  # Avoid division by zero
+        self.max_defense = max((d.get("overall", 1) for d in defense_data), default=1)
+
+# Function to map each team ID to its overall rating (first entry wins, like a linear scan)
+def index_overall(stat_data, teams):
+    index = {}
+    for item in stat_data:
+        index.setdefault(teams.add(item["team"]), item.get("overall", 0))
+    return index
+
+# Season's games compiled once into integer team IDs and edge arrays
+class SeasonGraph:
+    def __init__(self, schedules, teams):
+        home, away, home_points, away_points = [], [], [], []
+        for game in schedules:
+            home.append(teams.add(game.get("home_team")))
+            away.append(teams.add(game.get("away_team")))
+            home_points.append(game.get("home_points"))
+            away_points.append(game.get("away_points"))
+        self.compile(len(teams), home, away, home_points, away_points)
+
+    # Function to build the graph straight from team ID columns (e.g. a dictionary-encoded snapshot)
+    @classmethod
+    def from_team_ids(cls, num_teams, home, away, home_points, away_points):
+        graph = cls.__new__(cls)
+        graph.compile(num_teams, home, away, home_points, away_points)
+        return graph
+
+    def compile(self, num_teams, home, away, home_points, away_points):
+        self.num_teams = num_teams
+        self.home = np.asarray(home, dtype=np.int64)
+        self.away = np.asarray(away, dtype=np.int64)
+        self.home_points = np.asarray(home_points, dtype=float)  # None -> nan for unplayed games
+        self.away_points = np.asarray(away_points, dtype=float)
+
+        # Symmetric opponent matrix: entry (i, j) counts the games between teams i and j
+        games = sp.coo_matrix(
+            (np.ones(len(self.home)), (self.home, self.away)),
+            shape=(num_teams, num_teams)
+        ).tocsr()
+        self.opponents = (games + games.T).tocsr()
+
+        # Winner/loser edge arrays for completed games (ties go to the away team, as before)
+        played = ~(np.isnan(self.home_points) | np.isnan(self.away_points))
+        home_won = self.home_points > self.away_points
+        self.winners = np.where(home_won, self.home, self.away)[played]
+        self.losers = np.where(home_won, self.away, self.home)[played]
+
+    # Function to scatter one team_scores column onto the graph's team IDs (teams without games are skipped)
+    def team_vector(self, team_scores, column, default=0.0):
+        vector = np.full(self.num_teams, default, dtype=float)
+        for team in team_scores:
+            if team["Team ID"] < self.num_teams:
+                vector[team["Team ID"]] = team[column]
+        return vector
+
+# Function to fetch records, offense, defense and games for a season in one pass
+# `fetch` is a backend name from FETCH_BACKENDS or any callable year -> raw payloads
+def load_season_data(year, fetch="async"):
+    fetch = FETCH_BACKENDS[fetch] if isinstance(fetch, str) else fetch
+    tracer = get_tracer()
+    with tracer.stage("fetch"):
+        records, offense, defense, schedules = fetch(year)
+    with tracer.stage("parse"):
+        return SeasonData(year, records, parse_team_offense(offense), parse_team_defense(defense), schedules)
@@ -0,0 +1,143 @@
+import argparse
+import os
+import sys
+from multiprocessing import Pool
+
+import numpy as np
+import pandas as pd
+
+from .bracket import populate_con_champs_and_top_teams
+from .config import CONFERENCE_CHAMPS
+from .engines import rank_teams
+from .report import TEAM_WIDTH, column_values, format_rows, text_values, write_lines
+from .season import load_season_data
+
+NUM_PLAYOFF_TEAMS = 12
+NUM_BYES = 4
+
+# Logistic scale for turning a Total Points gap into a win probability
+# (a 10 point edge is roughly a 73% favourite)
+WIN_PROBABILITY_SCALE = 10.0
+
+DEFAULT_SIMULATIONS = 1_000_000
+DEFAULT_BATCH_SIZE = 100_000
+
+ROUND_COLUMNS = ["Quarterfinal", "Semifinal", "Championship", "Title"]
+
+
+#######################################################
+#                                                     #
+#                  Win Probabilities                  #
+#                                                     #
+#######################################################
+# Function to build P[i, j] = probability that seed i beats seed j
+def win_probability_matrix(total_points, scale=WIN_PROBABILITY_SCALE):
+    points = np.asarray(total_points, dtype=float)
+    return 1.0 / (1.0 + np.exp(-(points[:, None] - points[None, :]) / scale))
+
+
+#######################################################
+#                                                     #
+#                 Bracket Simulation                  #
+#                                                     #
+#######################################################
+# Function to play one round of games for a whole batch of brackets at once
+def play_games(prob_matrix, team_a, team_b, rng):
+    a_wins = rng.random(len(team_a)) < prob_matrix[team_a, team_b]
+    return np.where(a_wins, team_a, team_b)
+
+# Function to simulate a batch of brackets and count how far each seed gets
+# Seeds are 0-indexed: 0-3 have byes, first round is 5v12, 6v11, 7v10, 8v9 and
+# seed i meets the winner of first-round match i, as in print_bracket
+def simulate_brackets(prob_matrix, num_sims, rng):
+    seeds = [np.full(num_sims, seed, dtype=np.int64) for seed in range(NUM_PLAYOFF_TEAMS)]
+
+    first_round = [
+        play_games(prob_matrix, seeds[NUM_BYES + i], seeds[NUM_PLAYOFF_TEAMS - 1 - i], rng)
+        for i in range(4)
+    ]
+    quarterfinals = [play_games(prob_matrix, seeds[i], first_round[i], rng) for i in range(4)]
+    semifinals = [
+        play_games(prob_matrix, quarterfinals[0], quarterfinals[3], rng),
+        play_games(prob_matrix, quarterfinals[1], quarterfinals[2], rng)
+    ]
+    champion = play_games(prob_matrix, semifinals[0], semifinals[1], rng)
+
+    # Teams reaching each round: byes + first-round winners, QF winners, SF winners, champion
+    reached = [
+        seeds[:NUM_BYES] + first_round,
+        quarterfinals,
+        semifinals,
+        [champion]
+    ]
+    counts = np.zeros((NUM_PLAYOFF_TEAMS, len(reached)), dtype=np.int64)
+    for round_index, teams in enumerate(reached):
+        counts[:, round_index] = np.bincount(np.concatenate(teams), minlength=NUM_PLAYOFF_TEAMS)
+    return counts
+
+# Worker entry point: each batch gets its own independent RNG stream
+def simulate_batch(task):
+    prob_matrix, num_sims, seed_sequence = task
+    return simulate_brackets(prob_matrix, num_sims, np.random.default_rng(seed_sequence))
+
+# Function to run the Monte Carlo simulation over a process pool
+def simulate_playoffs(final_teams_df, num_sims=DEFAULT_SIMULATIONS, workers=None, seed=None,
+                      batch_size=DEFAULT_BATCH_SIZE, scale=WIN_PROBABILITY_SCALE):
+    if len(final_teams_df) != NUM_PLAYOFF_TEAMS:
+        raise ValueError(f"Expected {NUM_PLAYOFF_TEAMS} playoff teams, got {len(final_teams_df)}")
+
+    teams = final_teams_df.reset_index(drop=True)
+    prob_matrix = win_probability_matrix(teams["Total Points"], scale)
+
+    # Split the work into fixed-size batches; seeding per batch keeps results
+    # reproducible no matter how many workers run them
+    batch_sizes = [batch_size] * (num_sims // batch_size)
+    if num_sims % batch_size:
+        batch_sizes.append(num_sims % batch_size)
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(batch_sizes))
+    tasks = [(prob_matrix, size, seq) for size, seq in zip(batch_sizes, seed_sequences)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) == 1:
+        batch_counts = [simulate_batch(task) for task in tasks]
+    else:
+        with Pool(processes=min(workers, len(tasks))) as pool:
+            batch_counts = pool.map(simulate_batch, tasks)
+    counts = np.sum(batch_counts, axis=0)
+
+    results = pd.DataFrame(counts / num_sims, columns=ROUND_COLUMNS)
+    results.insert(0, "Seed", np.arange(1, NUM_PLAYOFF_TEAMS + 1))
+    results.insert(1, "Team", teams["Team"])
+    results.insert(2, "Total Points", teams["Total Points"])
+    return results
+
+# Print title, final-four and advance probabilities per team
+def print_simulation(results, num_sims):
+    print(f"\nPlayoff Simulation ({num_sims:,} brackets):")
+    ordered = results.sort_values(by="Title", ascending=False)
+    write_lines(sys.stdout, format_rows(
+        f"%2d. %-{TEAM_WIDTH}s | Quarterfinal: %6.2f%% | Final Four: %6.2f%% | Title Game: %6.2f%% | Title: %6.2f%%",
+        column_values(ordered, "Seed"), text_values(ordered, "Team"),
+        *((ordered[column] * 100).tolist() for column in ["Quarterfinal", "Semifinal", "Championship", "Title"])
+    ))
+
+
+# Main
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo simulation of the 12-team playoff")
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--sims", type=int, default=DEFAULT_SIMULATIONS)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        season = load_season_data(args.year)
+        top_teams = rank_teams(args.year, season=season)
+        final_12_teams = populate_con_champs_and_top_teams(
+            season.teams.ids_for(CONFERENCE_CHAMPS), top_teams.to_dict("records")
+        )
+        results = simulate_playoffs(final_12_teams, args.sims, args.workers, args.seed)
+        print_simulation(results, args.sims)
+    except Exception as e:
+        print(f"An error occurred: {e}")
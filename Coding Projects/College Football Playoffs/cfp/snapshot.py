@@ -0,0 +1,242 @@
+import argparse
+import os
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+from .fetch import FETCH_BACKENDS
+from .season import SeasonData, SeasonGraph, SeasonStats
+from .teams import TeamRegistry, display_labels
+from .trace import get_tracer
+
+SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "snapshots")
+SNAPSHOT_TABLES = ["teams", "records", "offense", "defense", "games"]
+
+# Columns holding team names (stored as IDs into the season's team table) and conference names
+TEAM_COLUMNS = {"records": ["team"], "offense": ["team"], "defense": ["team"], "games": ["home_team", "away_team"]}
+CONFERENCE_COLUMNS = {
+    "records": ["conference"], "offense": ["conference"], "defense": ["conference"],
+    "games": ["home_conference", "away_conference"]
+}
+
+# Arrow IPC files are memory-mapped with no decoding; Parquet is smaller on disk
+SNAPSHOT_FORMATS = {
+    "arrow": (".arrow", lambda table, path: feather.write_feather(table, path, compression="uncompressed")),
+    "parquet": (".parquet", lambda table, path: pq.write_table(table, path))
+}
+
+
+#######################################################
+#                                                     #
+#                   Export Snapshots                  #
+#                                                     #
+#######################################################
+# Function to turn a raw API payload (list of JSON objects) into a typed table; nested objects become struct columns
+def payload_table(payload):
+    if not payload:
+        return pa.table({})
+    return pa.Table.from_struct_array(pa.array(payload))
+
+# Function to order games by week (regular season first); ties keep the API order
+def sort_games(games):
+    if games.num_rows == 0 or "week" not in games.column_names:
+        return games
+    week = games["week"].to_numpy(zero_copy_only=False).astype(float)
+    postseason = np.zeros(games.num_rows, dtype=bool)
+    if "season_type" in games.column_names:
+        postseason = pc.fill_null(pc.not_equal(games["season_type"], "regular"), False).to_numpy()
+    return games.take(np.lexsort((np.nan_to_num(week, nan=np.inf), postseason)))
+
+# Function to build the season's team registry the same way SeasonData does: teams in game
+# order first (so IDs below the graph size are the teams with games), then records / PPA teams
+def team_registry(tables):
+    names = []
+    games = tables["games"]
+    if {"home_team", "away_team"} <= set(games.column_names):
+        names = [name for pair in zip(games["home_team"].to_pylist(), games["away_team"].to_pylist()) for name in pair]
+    for name in ["records", "offense", "defense"]:
+        if "team" in tables[name].column_names:
+            names.extend(tables[name]["team"].to_pylist())
+    return TeamRegistry.from_names(name for name in names if name is not None)
+
+# Function to replace a column of team names with dictionary-encoded team IDs
+def encode_teams(table, column, teams):
+    team_ids = pa.array([teams.get(name) for name in table[column].to_pylist()], pa.int32())
+    encoded = pa.DictionaryArray.from_arrays(team_ids, pa.array(teams.names, pa.string()))
+    return table.set_column(table.schema.get_field_index(column), column, encoded)
+
+# Function to convert one season's raw payloads into snapshot tables
+def season_tables(payloads):
+    tables = dict(zip(["records", "offense", "defense", "games"], (payload_table(payload) for payload in payloads)))
+    tables["games"] = sort_games(tables["games"])
+    teams = team_registry(tables)
+    for name, table in tables.items():
+        for column in TEAM_COLUMNS[name]:
+            if column in table.column_names:
+                table = encode_teams(table, column, teams)
+        for column in CONFERENCE_COLUMNS[name]:
+            if column in table.column_names:
+                table = table.set_column(
+                    table.schema.get_field_index(column), column, table[column].dictionary_encode()
+                )
+        tables[name] = table
+    tables["teams"] = pa.table({
+        "team_id": pa.array(range(len(teams)), pa.int32()),
+        "team": pa.array(teams.names, pa.string())
+    })
+    return tables
+
+# Function to write a season snapshot directory (one file per table)
+def write_snapshot(path, payloads, file_format="arrow"):
+    extension, write = SNAPSHOT_FORMATS[file_format]
+    os.makedirs(path, exist_ok=True)
+    for name, table in season_tables(payloads).items():
+        write(table, os.path.join(path, name + extension))
+    return path
+
+# Function to fetch seasons and store them as snapshots under `directory/<year>`
+def export_seasons(years, directory=SNAPSHOT_DIR, file_format="arrow", fetch="async"):
+    fetch = FETCH_BACKENDS[fetch] if isinstance(fetch, str) else fetch
+    return [write_snapshot(os.path.join(directory, str(year)), fetch(year), file_format) for year in years]
+
+
+#######################################################
+#                                                     #
+#                    Load Snapshots                   #
+#                                                     #
+#######################################################
+# Function to read one snapshot table, memory-mapped, optionally only some columns
+def read_table(path, name, columns=None):
+    if os.path.exists(os.path.join(path, name + ".arrow")):
+        return feather.read_table(os.path.join(path, name + ".arrow"), columns=columns, memory_map=True)
+    return pq.read_table(os.path.join(path, name + ".parquet"), columns=columns, memory_map=True)
+
+# Function to read a dictionary-encoded (team or conference) column back as plain strings
+def string_column(table, column):
+    return table[column].cast(pa.string()).to_numpy(zero_copy_only=False)
+
+# Function to read a dictionary-encoded team column as its team IDs (no string decoding)
+def team_ids(table, column):
+    return table[column].combine_chunks().indices.to_numpy(zero_copy_only=False)
+
+# Function to read a numeric struct field (e.g. total.wins) with missing values as `default`
+def struct_field(table, column, field, default=0):
+    if column not in table.column_names or field not in [f.name for f in table.schema.field(column).type]:
+        return np.full(table.num_rows, default)
+    return pc.fill_null(pc.struct_field(table[column], field), default).to_numpy()
+
+# Season backed by snapshot tables: the vectorized engine reads columns directly, while
+# `records` / `schedules` (used by the dict-based engines) are only built when first accessed
+class SnapshotSeason(SeasonData):
+    def __init__(self, year, tables):
+        self.year = year
+        self.tables = tables
+        self.teams = TeamRegistry.from_names(tables["teams"]["team"].to_pylist())
+        self.record_ids = team_ids(tables["records"], "team")
+        self.offense_data = self.parsed_ppa("offense")
+        self.defense_data = self.parsed_ppa("defense")
+        self.stats = SeasonStats(self.offense_data, self.defense_data, self.teams)
+
+        # Display labels for every team with a record
+        record_columns = self.record_columns()
+        labels = display_labels(
+            record_columns["team"], record_columns["wins"], record_columns["losses"], record_columns["ties"]
+        )
+        for team_id, label in zip(self.record_ids.tolist(), labels):
+            self.teams.set_label(team_id, label)
+
+        # Game team columns are already registry IDs, with the teams that played numbered first
+        games = tables["games"]
+        if games.num_rows:
+            home = team_ids(games, "home_team")
+            away = team_ids(games, "away_team")
+            num_teams = int(max(home.max(), away.max())) + 1
+            points = [
+                games[column].to_numpy(zero_copy_only=False).astype(float) if column in games.column_names
+                else np.full(games.num_rows, np.nan)
+                for column in ("home_points", "away_points")
+            ]
+        else:
+            home = away = np.zeros(0, dtype=np.int32)
+            num_teams = 0
+            points = [np.zeros(0), np.zeros(0)]
+        self.graph = SeasonGraph.from_team_ids(num_teams, home, away, *points)
+
+    # Function to rebuild the parsed PPA list (team, conference, overall) from its columns,
+    # matching parse_team_offense / parse_team_defense
+    def parsed_ppa(self, name):
+        table = self.tables[name]
+        conferences = (
+            table["conference"].cast(pa.string()).fill_null("").to_pylist() if "conference" in table.column_names
+            else [""] * table.num_rows
+        )
+        return [
+            {"team": team, "conference": conference, "overall": float(overall)}
+            for team, conference, overall in zip(
+                string_column(table, "team"), conferences, struct_field(table, name, "overall", default=0.0).tolist()
+            )
+        ] if table.num_rows else []
+
+    @cached_property
+    def records(self):
+        return self.tables["records"].to_pylist()
+
+    @cached_property
+    def schedules(self):
+        return self.tables["games"].to_pylist()
+
+    def record_columns(self):
+        table = self.tables["records"]
+        columns = {
+            "team_id": self.record_ids,
+            "team": string_column(table, "team"),
+            "conference": (
+                string_column(table, "conference") if "conference" in table.column_names
+                else np.full(table.num_rows, None)
+            )
+        }
+        for field in ("wins", "losses", "ties"):
+            columns[field] = struct_field(table, "total", field)
+        return pd.DataFrame(columns)
+
+# Function to load one season snapshot
+def load_snapshot(year, directory=SNAPSHOT_DIR):
+    path = os.path.join(directory, str(year))
+    tracer = get_tracer()
+    with tracer.stage("fetch"):
+        tables = {name: read_table(path, name) for name in SNAPSHOT_TABLES}
+    with tracer.stage("parse"):
+        return SnapshotSeason(year, tables)
+
+# Function to read some columns of one table across many seasons (adds a "year" column)
+def read_seasons(name, columns=None, years=None, directory=SNAPSHOT_DIR):
+    if years is None:
+        years = sorted(int(entry) for entry in os.listdir(directory) if entry.isdigit())
+    frames = []
+    for year in years:
+        table = read_table(os.path.join(directory, str(year)), name, columns)
+        frames.append(table.append_column("year", pa.array(np.full(table.num_rows, year, dtype=np.int16))))
+    return pa.concat_tables(frames, promote_options="permissive").to_pandas()
+
+
+# Main
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export fetched seasons as columnar snapshots")
+    parser.add_argument("--start", type=int, default=2024, help="First season to export")
+    parser.add_argument("--end", type=int, default=None, help="Last season to export (inclusive, default: --start)")
+    parser.add_argument("--format", choices=SNAPSHOT_FORMATS, default="arrow", help="arrow (memory-mapped) or parquet")
+    parser.add_argument("--fetch", choices=FETCH_BACKENDS, default="async", help="How the API data is loaded")
+    parser.add_argument("--directory", default=SNAPSHOT_DIR, help="Where snapshots are written")
+    args = parser.parse_args()
+
+    try:
+        years = range(args.start, (args.end or args.start) + 1)
+        for path in export_seasons(years, args.directory, args.format, args.fetch):
+            print(f"Snapshot saved to: {os.path.abspath(path)}")
+    except Exception as e:
+        print(f"An error occurred: {e}")
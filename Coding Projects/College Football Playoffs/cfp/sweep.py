@@ -0,0 +1,272 @@
+import argparse
+import itertools
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from . import config
+from .config import CONFERENCE_CHAMPS, CONFERENCE_POINTS, FBS_INDEPENDENT
+from .fetch import FETCH_BACKENDS, fixture_backend
+from .report import TEAM_WIDTH, column_values, format_rows, text_values, write_lines
+from .season import load_season_data
+from .vectorized import team_components
+
+NUM_PLAYOFF_TEAMS = 12
+SEED_COLUMNS = [f"Seed {seed}" for seed in range(1, NUM_PLAYOFF_TEAMS + 1)]
+DEFAULT_SAMPLES = 5000
+DEFAULT_SPREAD = 0.5  # Random settings vary each weight by up to +/-50%
+CHUNK_SIZE = 500  # Settings scored per pass; bounds the (games x settings) working set
+
+# Every tunable constant of the formula; conference points are swept per conference
+CATEGORY_WEIGHTS = [
+    "MAX_RECORD_POINTS", "MAX_OFFENSE_POINTS", "MAX_DEFENSE_POINTS", "MAX_SOS_POINTS",
+    "MAX_BEST_WIN", "MAX_LOWEST_LOSS", "MAX_FBS_IND_CON_POINTS", "CONFERENCE_CHAMP_BONUS"
+]
+WEIGHT_NAMES = CATEGORY_WEIGHTS + list(CONFERENCE_POINTS)
+
+
+#######################################################
+#                                                     #
+#                   Weight Settings                   #
+#                                                     #
+#######################################################
+# Function to read the current constants as one weight vector
+def default_weights():
+    weights = {name: getattr(config, name) for name in CATEGORY_WEIGHTS}
+    weights.update(CONFERENCE_POINTS)
+    return weights
+
+# Function to build every combination of the varied weights (others stay at their defaults)
+# `vary` maps a weight name to the values to try
+def weight_grid(vary):
+    for name in vary:
+        if name not in WEIGHT_NAMES:
+            raise ValueError(f"Unknown weight '{name}', expected one of: {', '.join(WEIGHT_NAMES)}")
+    base = default_weights()
+    settings = [dict(base, **dict(zip(vary, values))) for values in itertools.product(*vary.values())]
+    return pd.DataFrame(settings, columns=WEIGHT_NAMES)
+
+# Function to draw random settings, scaling every default weight by a factor in [1 - spread, 1 + spread]
+def sample_weights(samples=DEFAULT_SAMPLES, spread=DEFAULT_SPREAD, seed=None):
+    rng = np.random.default_rng(seed)
+    base = np.array([default_weights()[name] for name in WEIGHT_NAMES], dtype=float)
+    factors = rng.uniform(1 - spread, 1 + spread, size=(samples, len(base)))
+    return pd.DataFrame(base * factors, columns=WEIGHT_NAMES)
+
+# Function to parse "NAME=LOW:HIGH:STEP" or "NAME=A,B,C" into the values to try
+def parse_vary(text):
+    name, _, values = text.partition("=")
+    if ":" in values:
+        low, high, step = (float(value) for value in values.split(":"))
+        return name, list(np.arange(low, high + step / 2, step))
+    return name, [float(value) for value in values.split(",")]
+
+
+#######################################################
+#                                                     #
+#                Precomputed Components               #
+#                                                     #
+#######################################################
+# Everything about a season that does not depend on the weights, computed once.
+# Team rows follow season.records; game edges use the season's team IDs (which also
+# cover FCS opponents, so normalization sees the same teams as rank_teams).
+class SweepComponents:
+    def __init__(self, season, conference_champs=CONFERENCE_CHAMPS):
+        teams = team_components(season)
+        graph = season.graph
+        self.labels = teams["label"].to_numpy()
+
+        # Base Non-Result Points = components @ [record, offense, defense, conference points...]
+        conferences = list(CONFERENCE_POINTS)
+        conference_index = {conference: column for column, conference in enumerate(conferences)}
+        conference_onehot = np.zeros((len(teams), len(conferences)))
+        for row, conference in enumerate(teams["conference"]):
+            if conference in conference_index:
+                conference_onehot[row, conference_index[conference]] = 1
+        self.base = np.column_stack([teams["win_share"], teams["offense"], -teams["defense"], conference_onehot])
+        self.base_weights = ["MAX_RECORD_POINTS", "MAX_OFFENSE_POINTS", "MAX_DEFENSE_POINTS"] + conferences
+
+        self.champs = teams["team_id"].isin(season.teams.ids_for(conference_champs)).to_numpy()
+        self.fbs_independent = teams["conference"].isin(FBS_INDEPENDENT).to_numpy()
+
+        # Map team rows onto the graph (IDs below graph.num_teams); later rows win, like rank_teams' lookups
+        self.graph_ids = teams["team_id"].to_numpy()
+        self.in_graph = self.graph_ids < graph.num_teams
+        rows_by_graph_id = {graph_id: row for row, graph_id in enumerate(self.graph_ids) if graph_id < graph.num_teams}
+        self.ranked = np.zeros(graph.num_teams, dtype=bool)
+        self.ranked[list(rows_by_graph_id)] = True
+
+        # SoS for every graph team = opponents @ (graph <- team row) @ Total Points
+        self.to_graph = sp.csr_matrix(
+            (np.ones(len(rows_by_graph_id)), (list(rows_by_graph_id), list(rows_by_graph_id.values()))),
+            shape=(graph.num_teams, len(teams))
+        )
+        self.sos = (graph.opponents @ self.to_graph).tocsr()
+
+        # Result edges grouped by team so the grouped max/min is one reduceat per category
+        self.wins = EdgeGroups(graph.winners, graph.losers, graph.num_teams)
+        self.losses = EdgeGroups(graph.losers, graph.winners, graph.num_teams)
+
+# Game edges sorted by `teams`, with the start offset of each team's block
+class EdgeGroups:
+    def __init__(self, teams, opponents, num_teams):
+        order = np.argsort(teams, kind="stable")
+        self.teams, self.starts = np.unique(teams[order], return_index=True)
+        self.opponents = opponents[order]
+        self.mask = np.zeros(num_teams, dtype=bool)
+        self.mask[self.teams] = True
+
+
+#######################################################
+#                                                     #
+#                  Evaluate Settings                  #
+#                                                     #
+#######################################################
+# Function to score every team under every setting at once; returns a (teams x settings) matrix
+def sweep_total_points(components, weights):
+    weights = weights[WEIGHT_NAMES]
+    row = lambda name: weights[name].to_numpy(dtype=float)
+
+    # One matrix multiply for the base points of every team under every setting
+    base_points = components.base @ weights[components.base_weights].to_numpy(dtype=float).T
+    total_points = base_points + np.outer(components.champs, row("CONFERENCE_CHAMP_BONUS"))
+
+    # Strength of Schedule: sparse opponents matrix times every settings' totals
+    sos_values = components.sos @ total_points
+    max_sos = sos_values.max(axis=0) if len(sos_values) else np.ones(len(weights))
+    max_sos[max_sos == 0] = 1  # Avoid division by zero
+    sos_share = np.zeros_like(total_points)
+    sos_share[components.in_graph] = (sos_values / max_sos)[components.graph_ids[components.in_graph]]
+    total_points += sos_share * row("MAX_SOS_POINTS")
+    total_points += sos_share * components.fbs_independent[:, None] * row("MAX_FBS_IND_CON_POINTS")
+
+    # Best Win: grouped max of beaten opponents' base points (never below 0)
+    graph_points = components.to_graph @ base_points
+    wins = components.wins
+    best_win_values = np.zeros_like(graph_points)
+    if len(wins.teams):
+        best_win_values[wins.teams] = np.maximum(
+            np.maximum.reduceat(graph_points[wins.opponents], wins.starts, axis=0), 0
+        )
+    max_best_win = best_win_values[wins.mask].max(axis=0) if wins.mask.any() else np.ones(len(weights))
+    max_best_win[max_best_win == 0] = 1  # Avoid division by zero
+    best_win_share = np.where(wins.mask[:, None], best_win_values / max_best_win, 0)
+
+    # Lowest Loss: grouped min of the base points of teams that beat you (unranked teams never count)
+    graph_points[~components.ranked] = float("inf")
+    losses = components.losses
+    lowest_loss_values = np.full_like(graph_points, float("inf"))
+    if len(losses.teams):
+        lowest_loss_values[losses.teams] = np.minimum.reduceat(graph_points[losses.opponents], losses.starts, axis=0)
+    min_lowest_loss = lowest_loss_values[losses.mask].min(axis=0) if losses.mask.any() else np.ones(len(weights))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lowest_loss_share = np.where(losses.mask[:, None], min_lowest_loss / lowest_loss_values, 0)
+
+    result_share = np.zeros_like(total_points)
+    result_share[components.in_graph] = (
+        best_win_share * row("MAX_BEST_WIN") - lowest_loss_share * row("MAX_LOWEST_LOSS")
+    )[components.graph_ids[components.in_graph]]
+    return total_points + result_share
+
+# Function to pick the playoff field for every setting: champions in the top `top_n` get
+# auto bids, the best remaining teams fill the rest, seeded by total points.
+# Returns a (settings x 12) array of team rows (-1 when a field has fewer than 12 teams)
+def select_playoff_seeds(components, total_points, top_n=50, num_spots=NUM_PLAYOFF_TEAMS):
+    # Partition out each setting's top `top_n` teams, then sort only those (ties keep row order)
+    total_points = np.ascontiguousarray(total_points.T)
+    top_n = min(top_n, total_points.shape[1])
+    candidates = np.sort(np.argpartition(-total_points, top_n - 1, axis=1)[:, :top_n], axis=1)
+    ranking = np.argsort(-np.take_along_axis(total_points, candidates, axis=1), axis=1, kind="stable")
+    order = np.take_along_axis(candidates, ranking, axis=1).T
+    champ = components.champs[order]
+    open_spots = num_spots - champ.sum(axis=0)
+    selected = champ | (~champ & (np.cumsum(~champ, axis=0) <= open_spots))
+
+    # The selected rows are already in total-points order, so their order is the seeding
+    positions = np.argsort(~selected, axis=0, kind="stable")[:num_spots]
+    seeds = np.take_along_axis(order, positions, axis=0)
+    seeds[~np.take_along_axis(selected, positions, axis=0)] = -1
+    return seeds.T
+
+# Function to run a sweep; returns one row per setting with its weights and seeded field
+def run_sweep(season, weights, conference_champs=CONFERENCE_CHAMPS, top_n=50):
+    components = SweepComponents(season, conference_champs)
+    seeds = np.vstack([
+        select_playoff_seeds(components, sweep_total_points(components, weights.iloc[start:start + CHUNK_SIZE]), top_n)
+        for start in range(0, len(weights), CHUNK_SIZE)
+    ])
+    baseline = select_playoff_seeds(
+        components, sweep_total_points(components, pd.DataFrame([default_weights()])), top_n
+    )[0]
+
+    labels = np.append(components.labels, "")  # Row -1 (empty seed) maps to ""
+    results = weights[WEIGHT_NAMES].reset_index(drop=True)
+    for column, seed in enumerate(SEED_COLUMNS):
+        results[seed] = labels[seeds[:, column]]
+    results["Field Changes"] = [len(set(baseline) - set(field)) for field in seeds]
+    results["Seed Changes"] = (seeds != baseline).sum(axis=1)
+    return results, labels[baseline]
+
+# Function to summarize how often each team makes the field and where it is seeded
+def playoff_frequency(results):
+    seeds = results[SEED_COLUMNS].melt(var_name="Seed", value_name="Team")
+    seeds = seeds[seeds["Team"] != ""]
+    seeds["Seed"] = seeds["Seed"].str.removeprefix("Seed ").astype(int)
+    summary = seeds.groupby("Team")["Seed"].agg(["count", "mean", "min", "max"])
+    summary["count"] = summary["count"] / len(results)
+    summary.columns = ["Playoff Share", "Average Seed", "Best Seed", "Worst Seed"]
+    return summary.sort_values(by=["Playoff Share", "Average Seed"], ascending=[False, True])
+
+# Print the sweep summary
+def print_sweep(results, baseline, elapsed):
+    print(f"Evaluated {len(results):,} weight settings in {elapsed:.2f}s")
+    print(f"Same field as the current weights: {(results['Field Changes'] == 0).mean():.1%}")
+    print(f"Same bracket as the current weights: {(results['Seed Changes'] == 0).mean():.1%}")
+
+    print("\nCurrent Field:")
+    for seed, team in enumerate(baseline, start=1):
+        print(f"{seed:2}. {team}")
+
+    print("\nPlayoff Share by Team:")
+    frequency = playoff_frequency(results).reset_index()
+    write_lines(sys.stdout, format_rows(
+        f"%-{TEAM_WIDTH}s | In Field: %6.2f%% | Average Seed: %5.2f | Seeds: %.0f-%.0f",
+        text_values(frequency, "Team"), (frequency["Playoff Share"] * 100).tolist(),
+        *(column_values(frequency, column) for column in ["Average Seed", "Best Seed", "Worst Seed"])
+    ))
+
+
+# Main
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep the ranking weights and report how the playoff field changes")
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--fetch", choices=FETCH_BACKENDS, default="async", help="How the API data is loaded")
+    parser.add_argument("--fixture", metavar="DIR", help="Replay a recorded fixture directory instead of calling the API")
+    parser.add_argument("--vary", action="append", default=[], metavar="NAME=LOW:HIGH:STEP",
+                        help="Grid over one weight (repeatable); NAME=A,B,C also works")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES, help="Random settings when no --vary is given")
+    parser.add_argument("--spread", type=float, default=DEFAULT_SPREAD, help="Random settings scale each weight by 1 +/- spread")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default=None, help="Also write every setting and its field to this CSV file")
+    args = parser.parse_args()
+
+    try:
+        season = load_season_data(args.year, fixture_backend(args.fixture) if args.fixture else args.fetch)
+        if args.vary:
+            weights = weight_grid(dict(parse_vary(text) for text in args.vary))
+        else:
+            weights = sample_weights(args.samples, args.spread, args.seed)
+
+        start = time.perf_counter()
+        results, baseline = run_sweep(season, weights)
+        print_sweep(results, baseline, time.perf_counter() - start)
+
+        if args.output:
+            results.to_csv(args.output, index=False)
+            print(f"\nResults saved to: {os.path.abspath(args.output)}")
+    except Exception as e:
+        print(f"An error occurred: {e}")
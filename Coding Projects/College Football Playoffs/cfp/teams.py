@@ -0,0 +1,59 @@
+from .config import TEAM_ALIASES
+
+
+#######################################################
+#                                                     #
+#                    Team Registry                    #
+#                                                     #
+#######################################################
+# Function to build the "Team (W-L[-T])" display label
+def display_label(name, wins, losses, ties):
+    record_str = f"{wins}-{losses}-{ties}" if ties > 0 else f"{wins}-{losses}"
+    return f"{name} ({record_str})"
+
+# Function to build display labels for whole columns of records at once
+def display_labels(names, wins, losses, ties):
+    record_str = wins.astype(str) + "-" + losses.astype(str)
+    record_str = record_str.where(ties <= 0, record_str + "-" + ties.astype(str))
+    return names + " (" + record_str + ")"
+
+# One integer ID per team for a season. Every spelling of a team (see TEAM_ALIASES) maps to the
+# same ID; the name is kept as first seen in the API data and the display label separately.
+class TeamRegistry:
+    def __init__(self, aliases=TEAM_ALIASES):
+        self.aliases = aliases
+        self.names = []
+        self.labels = []
+        self.ids = {}
+
+    # Function to get a team's ID, registering it if it is new
+    def add(self, name):
+        key = self.aliases.get(name, name)
+        team_id = self.ids.get(key)
+        if team_id is None:
+            team_id = len(self.names)
+            self.ids[key] = team_id
+            self.names.append(name)
+            self.labels.append(name)
+        return team_id
+
+    # Function to look up a team's ID by any of its spellings (None if not registered)
+    def get(self, name):
+        return self.ids.get(self.aliases.get(name, name))
+
+    # Function to resolve names (e.g. CONFERENCE_CHAMPS) to the IDs of teams in this season
+    def ids_for(self, names):
+        return {team_id for team_id in map(self.get, names) if team_id is not None}
+
+    def set_label(self, team_id, label):
+        self.labels[team_id] = label
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def from_names(cls, names, aliases=TEAM_ALIASES):
+        registry = cls(aliases)
+        for name in names:
+            registry.add(name)
+        return registry
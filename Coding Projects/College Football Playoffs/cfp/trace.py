@@ -0,0 +1,220 @@
+import json
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+METRIC_PREFIX = "cfp"
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]  # Seconds, for the request latency histogram
+
+
+#######################################################
+#                                                     #
+#                       Tracers                       #
+#                                                     #
+#######################################################
+# The pipeline reports to whichever tracer is installed (see set_tracer). The default tracer
+# does nothing, so an untraced run pays one no-op call per hook. A custom tracer overrides the
+# hooks it cares about: stage, request, cache, gauge and error
+class NullTracer:
+    # Context manager around one pipeline stage (fetch, parse, score, sos, ...)
+    def stage(self, name):
+        return nullcontext()
+
+    # One HTTP attempt: endpoint path, status code (or "error"), seconds and response body bytes
+    def request(self, endpoint, status, seconds, size=0):
+        pass
+
+    # One cache lookup: "hit" (fresh), "expired" (revalidated with the API), "miss" or "stale_fallback"
+    def cache(self, endpoint, result):
+        pass
+
+    # A point-in-time value such as the number of teams or games
+    def gauge(self, name, value):
+        pass
+
+    # An exception that ended the run (or the stage it escaped from)
+    def error(self, error, stage=None):
+        pass
+
+# Records every hook in memory; thread-safe so the batch fetch threads can share it
+class Tracer(NullTracer):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.stages = defaultdict(lambda: {"calls": 0, "seconds": 0.0})
+        self.requests = defaultdict(
+            lambda: {"count": 0, "seconds": 0.0, "max_seconds": 0.0, "bytes": 0, "statuses": defaultdict(int),
+                     "buckets": [0] * len(LATENCY_BUCKETS)}
+        )
+        self.cache_results = defaultdict(lambda: defaultdict(int))
+        self.gauges = {}
+        self.errors = []
+
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.error(e, name)
+            raise
+        finally:
+            with self.lock:
+                self.stages[name]["calls"] += 1
+                self.stages[name]["seconds"] += time.perf_counter() - started
+
+    def request(self, endpoint, status, seconds, size=0):
+        with self.lock:
+            stats = self.requests[endpoint]
+            stats["count"] += 1
+            stats["seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+            stats["bytes"] += size
+            stats["statuses"][str(status)] += 1
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    stats["buckets"][i] += 1
+
+    def cache(self, endpoint, result):
+        with self.lock:
+            self.cache_results[endpoint][result] += 1
+
+    def gauge(self, name, value):
+        with self.lock:
+            self.gauges[name] = value
+
+    def error(self, error, stage=None):
+        with self.lock:
+            # An error escaping nested stages is reported once, by the innermost stage
+            if not any(recorded["exception"] is error for recorded in self.errors):
+                self.errors.append({"stage": stage, "type": type(error).__name__, "message": str(error), "exception": error})
+
+    # Function to summarize everything recorded as plain JSON-ready data
+    def summary(self):
+        with self.lock:
+            return {
+                "elapsed_seconds": time.perf_counter() - self.started,
+                "stages": {name: dict(stats) for name, stats in self.stages.items()},
+                "requests": {
+                    endpoint: {
+                        "count": stats["count"],
+                        "seconds": stats["seconds"],
+                        "mean_seconds": stats["seconds"] / stats["count"],
+                        "max_seconds": stats["max_seconds"],
+                        "bytes": stats["bytes"],
+                        "statuses": dict(stats["statuses"]),
+                        "latency_buckets": dict(zip(map(str, LATENCY_BUCKETS), stats["buckets"]))  # Requests at or under each bound
+                    }
+                    for endpoint, stats in self.requests.items()
+                },
+                "cache": {endpoint: dict(results) for endpoint, results in self.cache_results.items()},
+                "gauges": dict(self.gauges),
+                "errors": [{key: value for key, value in e.items() if key != "exception"} for e in self.errors]
+            }
+
+
+#######################################################
+#                                                     #
+#                   Active Tracer                     #
+#                                                     #
+#######################################################
+NULL_TRACER = NullTracer()
+active_tracer = NULL_TRACER
+
+def get_tracer():
+    return active_tracer
+
+# Function to install a tracer for the whole process; returns the previous one
+def set_tracer(tracer):
+    global active_tracer
+    previous, active_tracer = active_tracer, tracer or NULL_TRACER
+    return previous
+
+# Function to trace one block of code: `with tracing(Tracer()) as tracer: ...` (None traces nothing)
+@contextmanager
+def tracing(tracer):
+    previous = set_tracer(tracer)
+    try:
+        yield active_tracer
+    finally:
+        set_tracer(previous)
+
+
+#######################################################
+#                                                     #
+#                   Trace Exporters                   #
+#                                                     #
+#######################################################
+def trace_json(tracer):
+    return json.dumps(tracer.summary(), indent=2)
+
+# Function to escape a Prometheus label value
+def label_value(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+# Function to format one Prometheus sample line
+def sample(name, value, **labels):
+    label_text = ",".join(f'{key}="{label_value(label)}"' for key, label in labels.items())
+    return f"{METRIC_PREFIX}_{name}{{{label_text}}} {value}" if labels else f"{METRIC_PREFIX}_{name} {value}"
+
+# Function to render the trace in the Prometheus text exposition format
+def trace_prometheus(tracer):
+    summary = tracer.summary()
+    lines = []
+
+    def metric(name, metric_type, help_text, samples):
+        lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {METRIC_PREFIX}_{name} {metric_type}")
+        lines.extend(samples)
+
+    metric("run_seconds", "gauge", "Wall time of the traced run", [sample("run_seconds", summary["elapsed_seconds"])])
+    metric("stage_seconds_total", "counter", "Wall time spent in each pipeline stage", [
+        sample("stage_seconds_total", stats["seconds"], stage=name) for name, stats in summary["stages"].items()
+    ])
+    metric("stage_calls_total", "counter", "Times each pipeline stage ran", [
+        sample("stage_calls_total", stats["calls"], stage=name) for name, stats in summary["stages"].items()
+    ])
+    metric("api_requests_total", "counter", "HTTP requests to the API by endpoint and status", [
+        sample("api_requests_total", count, endpoint=endpoint, status=status)
+        for endpoint, stats in summary["requests"].items() for status, count in stats["statuses"].items()
+    ])
+    histogram = []
+    for endpoint, stats in summary["requests"].items():
+        for bound, count in stats["latency_buckets"].items():
+            histogram.append(sample("api_request_duration_seconds_bucket", count, endpoint=endpoint, le=bound))
+        histogram.append(sample("api_request_duration_seconds_bucket", stats["count"], endpoint=endpoint, le="+Inf"))
+        histogram.append(sample("api_request_duration_seconds_sum", stats["seconds"], endpoint=endpoint))
+        histogram.append(sample("api_request_duration_seconds_count", stats["count"], endpoint=endpoint))
+    metric("api_request_duration_seconds", "histogram", "HTTP request latency by endpoint", histogram)
+    metric("api_response_bytes_total", "counter", "Response body bytes downloaded by endpoint", [
+        sample("api_response_bytes_total", stats["bytes"], endpoint=endpoint) for endpoint, stats in summary["requests"].items()
+    ])
+    metric("cache_lookups_total", "counter", "Response cache lookups by endpoint and result", [
+        sample("cache_lookups_total", count, endpoint=endpoint, result=result)
+        for endpoint, results in summary["cache"].items() for result, count in results.items()
+    ])
+    for name, value in summary["gauges"].items():
+        metric(name, "gauge", f"{name.replace('_', ' ').capitalize()} in the traced run", [sample(name, value)])
+    errors = defaultdict(int)
+    for error in summary["errors"]:
+        errors[(error["stage"] or "", error["type"])] += 1
+    metric("errors_total", "counter", "Exceptions that ended a stage or the run", [
+        sample("errors_total", count, stage=stage, type=error_type) for (stage, error_type), count in errors.items()
+    ])
+    return "\n".join(lines) + "\n"
+
+TRACE_FORMATS = {
+    "json": trace_json,
+    "prometheus": trace_prometheus
+}
+
+# Function to write the trace to a file, or stderr so it never mixes with the report on stdout
+def write_trace(tracer, file_format="json", path=None):
+    text = TRACE_FORMATS[file_format](tracer)
+    if path:
+        with open(path, "w") as f:
+            f.write(text)
+    else:
+        sys.stderr.write(text if text.endswith("\n") else text + "\n")
@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+
+from .config import (
+    CONFERENCE_POINTS, FBS_INDEPENDENT, MAX_BEST_WIN, MAX_DEFENSE_POINTS, MAX_FBS_IND_CON_POINTS,
+    MAX_LOWEST_LOSS, MAX_OFFENSE_POINTS, MAX_RECORD_POINTS, MAX_SOS_POINTS
+)
+
+
+#######################################################
+#                                                     #
+#                 Vectorized Scoring                  #
+#                                                     #
+#######################################################
+# Function to build each team's unweighted components (win share, offense/defense relative
+# to the best team) and its display label; the MAX_* weights are applied on top
+def team_components(season):
+    teams = season.record_columns()
+    if teams.empty:
+        return teams
+
+    games = (teams["wins"] + teams["losses"] + teams["ties"]).to_numpy(dtype=float)
+    teams["win_share"] = np.divide(
+        teams["wins"].to_numpy(dtype=float), games,
+        out=np.zeros(len(teams)), where=games > 0
+    )
+
+    # Join offense/defense ratings through the season's team IDs; teams without data score 0
+    stats = season.stats
+    teams["offense"] = (teams["team_id"].map(stats.offense) / stats.max_offense).fillna(0)
+    teams["defense"] = (teams["team_id"].map(stats.defense) / stats.max_defense).fillna(0)
+
+    # "Team (W-L[-T])" labels are kept in the season's team registry
+    labels = season.teams.labels
+    teams["label"] = [labels[team_id] for team_id in teams["team_id"]]
+    return teams
+
+# Columnar Team Scoring: every category is computed as a whole-column operation
+def calculate_team_scores_vectorized(season):
+    teams = team_components(season)
+    if teams.empty:
+        return []
+
+    record_points = teams["win_share"] * MAX_RECORD_POINTS
+    offense_points = teams["offense"] * MAX_OFFENSE_POINTS
+    defense_points = teams["defense"] * MAX_DEFENSE_POINTS
+    conference_points = teams["conference"].map(CONFERENCE_POINTS).fillna(0)
+    total_points = record_points + offense_points - defense_points + conference_points
+
+    scores = pd.DataFrame({
+        "Team": teams["label"],
+        "Team ID": teams["team_id"],
+        "Conference": teams["conference"],
+        "Record Points": record_points,
+        "Offense Points": offense_points,
+        "Defense Points": defense_points,
+        "Conference Points": conference_points,
+        "Total Points": total_points,
+        "Base Non-Result Points": total_points
+    })
+    return scores.to_dict("records")
+
+# Function to compute Strength of Schedule as a sparse matrix-vector product
+def calculate_strength_of_schedule_sparse(season, team_scores):
+    graph = season.graph
+
+    # Each team's SoS is the sum of its opponents' total points, one entry per game played
+    sos_values = graph.opponents @ graph.team_vector(team_scores, 'Total Points')
+
+    # Normalize SoS values
+    max_sos = sos_values.max() if len(sos_values) else 1
+    if max_sos == 0:
+        max_sos = 1  # Avoid division by zero
+    sos_values = (sos_values / max_sos) * MAX_SOS_POINTS
+
+    for team in team_scores:
+        team_id = team['Team ID']
+        sos_points = float(sos_values[team_id]) if team_id < graph.num_teams else 0
+
+        team['SoS Points'] = sos_points
+
+        # Adjust conference points if the team is in FBS Independents
+        if team["Conference"] in FBS_INDEPENDENT:
+            team['Conference Points'] = (sos_points / MAX_SOS_POINTS) * MAX_FBS_IND_CON_POINTS
+            team['Total Points'] += team['Conference Points']
+
+        team['Total Points'] += team['SoS Points']
+
+    return team_scores
+
+# Function to find, per team, the first edge that reaches its grouped max/min value
+def first_edge_per_team(teams, opponents, values, best, keep):
+    mask = (values == best[teams]) & keep
+    team_ids, first = np.unique(teams[mask], return_index=True)
+    return dict(zip(team_ids.tolist(), opponents[mask][first].tolist()))
+
+# Function to calculate Best Win points as a grouped max over winner -> loser edges
+def calculate_best_win_sparse(season, team_scores):
+    graph = season.graph
+    base_points = graph.team_vector(team_scores, 'Base Non-Result Points')
+
+    # Best beaten opponent per winner (a win only counts when the loser has positive points)
+    loser_points = base_points[graph.losers]
+    best_win_values = np.zeros(graph.num_teams)
+    np.maximum.at(best_win_values, graph.winners, loser_points)
+    best_win_teams = first_edge_per_team(graph.winners, graph.losers, loser_points, best_win_values, loser_points > 0)
+    has_win = np.zeros(graph.num_teams, dtype=bool)
+    has_win[graph.winners] = True
+
+    # Normalize Best Win values
+    max_best_win = best_win_values[has_win].max() if has_win.any() else 1
+    if max_best_win == 0:
+        max_best_win = 1  # Avoid division by zero
+    best_win_values = (best_win_values / max_best_win) * MAX_BEST_WIN
+
+    for team in team_scores:
+        team_id = team['Team ID']
+        if team_id < graph.num_teams and has_win[team_id]:
+            team['Best Win Points'] = float(best_win_values[team_id])
+            team['Best Win Team'] = season.teams.names[best_win_teams[team_id]] if team_id in best_win_teams else ""
+        else:
+            team['Best Win Points'] = 0
+            team['Best Win Team'] = ""
+        team['Total Points'] += team['Best Win Points']
+
+    return team_scores
+
+# Function to calculate Lowest Loss points as a grouped min over loser -> winner edges
+def calculate_lowest_loss_sparse(season, team_scores):
+    graph = season.graph
+    # Unranked opponents count as infinitely strong so they never become the lowest loss
+    base_points = graph.team_vector(team_scores, 'Base Non-Result Points', default=float('inf'))
+
+    winner_points = base_points[graph.winners]
+    lowest_loss_values = np.full(graph.num_teams, float('inf'))
+    np.minimum.at(lowest_loss_values, graph.losers, winner_points)
+    lowest_loss_teams = first_edge_per_team(graph.losers, graph.winners, winner_points, lowest_loss_values, np.isfinite(winner_points))
+    has_loss = np.zeros(graph.num_teams, dtype=bool)
+    has_loss[graph.losers] = True
+
+    # Normalize Lowest Loss values (inversely since lower points are better)
+    min_lowest_loss = lowest_loss_values[has_loss].min() if has_loss.any() else 1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lowest_loss_values = (min_lowest_loss / lowest_loss_values) * MAX_LOWEST_LOSS
+
+    for team in team_scores:
+        team_id = team['Team ID']
+        if team_id < graph.num_teams and has_loss[team_id]:
+            team['Lowest Loss Points'] = float(lowest_loss_values[team_id])
+            team['Lowest Loss Team'] = season.teams.names[lowest_loss_teams[team_id]] if team_id in lowest_loss_teams else ""
+        else:
+            team['Lowest Loss Points'] = 0
+            team['Lowest Loss Team'] = ""
+        team['Total Points'] -= team['Lowest Loss Points']
+
+    return team_scores
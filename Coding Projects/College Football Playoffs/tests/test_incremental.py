@@ -0,0 +1,115 @@
+import random
+
+import numpy as np
+import pytest
+
+from cfp.engines import rank_teams
+from cfp.incremental import IncrementalRanker
+from cfp.season import SeasonData
+
+CONFERENCES = ["SEC", "Big Ten", "ACC", "Big 12", "FBS Independents"]
+ALIASED = "San José State"  # The games feed spells it "San Jose State" (see TEAM_ALIASES)
+
+def build_games(names, seed=7, weeks=10):
+    rng = random.Random(seed)
+    games = []
+    for week in range(1, weeks + 1):
+        order = names[:]
+        rng.shuffle(order)
+        for home_team, away_team in zip(order[::2], order[1::2]):
+            games.append({
+                "id": len(games),
+                "week": week,
+                "home_team": home_team,
+                "away_team": away_team,
+                "home_points": rng.randint(0, 45),
+                "away_points": rng.randint(0, 45)
+            })
+    return games
+
+def feed_spelling(games):
+    """The same games with the aliased team under its games-feed spelling"""
+    renamed = []
+    for game in games:
+        game = dict(game)
+        for side in ("home_team", "away_team"):
+            if game[side] == ALIASED:
+                game[side] = "San Jose State"
+        renamed.append(game)
+    return renamed
+
+def build_season(games, names):
+    rng = random.Random(11)
+    totals = {name: {"wins": 0, "losses": 0, "ties": 0} for name in names}
+    for game in games:
+        home = "San José State" if game["home_team"] == "San Jose State" else game["home_team"]
+        away = "San José State" if game["away_team"] == "San Jose State" else game["away_team"]
+        if game["home_points"] > game["away_points"]:
+            totals[home]["wins"] += 1
+            totals[away]["losses"] += 1
+        elif game["home_points"] < game["away_points"]:
+            totals[away]["wins"] += 1
+            totals[home]["losses"] += 1
+        else:
+            totals[home]["ties"] += 1
+            totals[away]["ties"] += 1
+    records = [
+        {"team": name, "conference": CONFERENCES[i % len(CONFERENCES)], "total": totals[name]}
+        for i, name in enumerate(names)
+    ]
+    offense = [{"team": name, "overall": rng.uniform(0.1, 1.0)} for name in names]
+    defense = [{"team": name, "overall": rng.uniform(0.1, 1.0)} for name in names]
+    return SeasonData(2024, records, offense, defense, games)
+
+def total_points(df):
+    return df.set_index("Team ID").sort_index()[["Total Points", "SoS Points", "Best Win Points", "Lowest Loss Points"]]
+
+@pytest.fixture
+def names():
+    return [ALIASED] + [f"Team {i}" for i in range(1, 16)]
+
+def test_aliased_games_match_rank_teams(names):
+    season = build_season(feed_spelling(build_games(names)), names)
+    champs = [ALIASED, "Team 3"]
+
+    expected = rank_teams(season.year, season=season, conference_champs=champs, top_n=None)
+    ranker = IncrementalRanker(season, champs)
+    actual = ranker.rankings(top_n=None)
+
+    assert len(ranker.teams) == len(names)
+    np.testing.assert_allclose(total_points(actual).to_numpy(), total_points(expected).to_numpy(), rtol=1e-12)
+
+def test_aliased_score_correction_matches_rank_teams(names):
+    games = build_games(names)
+    played = [game for game in games if ALIASED in (game["home_team"], game["away_team"])]
+    corrected = dict(played[-1], home_points=played[-1]["away_points"] + 7)
+    final_games = [corrected if game["id"] == corrected["id"] else game for game in games]
+
+    ranker = IncrementalRanker(build_season(games, names), [ALIASED])
+    affected = ranker.apply_games(feed_spelling([corrected]))
+
+    season = build_season(final_games, names)
+    expected = rank_teams(season.year, season=season, conference_champs=[ALIASED], top_n=None)
+    assert season.teams.get(ALIASED) in affected
+    np.testing.assert_allclose(
+        total_points(ranker.rankings(top_n=None)).to_numpy(), total_points(expected).to_numpy(), rtol=1e-12
+    )
+
+def test_live_update_retries_games_after_a_failed_apply(names, monkeypatch):
+    from cfp.live import LiveRankings
+
+    games = build_games(names)
+    live = LiveRankings(IncrementalRanker(build_season(games, names)), top_n=None)
+    corrected = dict(games[0], home_points=games[0]["home_points"] + 50)
+
+    def fail(changed):
+        raise RuntimeError("feed hiccup")
+    monkeypatch.setattr(live.ranker, "apply_games", fail)
+    with pytest.raises(RuntimeError):
+        live.update([corrected])
+
+    monkeypatch.undo()
+    event = live.update([corrected])
+    assert event is not None
+    assert [(game["id"], game["home_points"]) for game in event["games"]] == [(corrected["id"], corrected["home_points"])]
+    assert live.update([corrected]) is None
@@ -5,11 +5,15 @@ from ta.momentum import RSIIndicator, StochasticOscillator, ROCIndicator
 from ta.trend import MACD, EMAIndicator, ADXIndicator
 from ta.volatility import BollingerBands, AverageTrueRange
 from ta.volume import OnBalanceVolumeIndicator, ForceIndexIndicator
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import os
 from dotenv import load_dotenv
 import time
+import sqlite3
+import threading
 import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from multiprocessing import Pool, cpu_count
 from tqdm import tqdm
 
@@ -29,6 +33,36 @@ if not all([API_KEY, API_SECRET, BASE_URL]):
     print("ALPACA_API_BASE_URL=https://paper-api.alpaca.markets")
     exit(1)
 
+# Alpaca data API rate limit, shared by every request this process makes (the free plan allows
+# 200 requests per minute); BURST requests may go out back to back before the limit applies
+RATE_LIMIT_PER_MINUTE = int(os.getenv('ALPACA_RATE_LIMIT', 200))
+RATE_LIMIT_BURST = 10
+
+# alpaca_trade_api retries a 429 itself with fixed 3-second sleeps (APCA_RETRY_MAX times) before
+# the error reaches download_bars; turn that off so 429s go straight to the rate limiter. Read
+# when each REST client is created
+os.environ.setdefault('APCA_RETRY_MAX', '0')
+
+# Multi-symbol bar requests are sized to fit in one page of Alpaca's paginated response,
+# and capped so the symbol list stays a reasonable URL length
+BARS_PER_PAGE = 10000
+MAX_SYMBOLS_PER_REQUEST = 200
+TRADING_DAYS_PER_YEAR = 252
+
+# Local bar store: daily bars already downloaded are served from disk, and each run only
+# fetches the days since the last stored bar. Bars are split-adjusted, so a split restates
+# every earlier bar; the last SPLIT_REPULL_DAYS days are pulled again on every update and if
+# they no longer match what is stored (a split or a data correction), the symbol's whole
+# history is downloaded again
+BAR_STORE_PATH = os.getenv('BAR_STORE_PATH', 'bars.db')
+BAR_ADJUSTMENT = 'split'
+SPLIT_REPULL_DAYS = 5
+BAR_COLUMNS = ['open', 'high', 'low', 'close', 'volume', 'trade_count', 'vwap']
+
+# Parallel buy scan: bar downloads are I/O-bound and run on threads, indicators and
+# backtests are CPU-bound and run on a process pool (one worker per core by default)
+SCAN_FETCH_THREADS = 8
+
 # Create API connection - one per process
 def get_api():
     return tradeapi.REST(API_KEY, API_SECRET, BASE_URL, api_version='v2')
@@ -45,36 +79,213 @@ def get_sp500_tickers():
     tables = pd.read_html(url)
     return tables[0]['Symbol'].tolist()
 
-def fetch_historical_data(api_instance, ticker, start_date, end_date, max_retries=3):
+class RateLimiter:
+    """Token bucket that paces API requests instead of sleeping a fixed time after a 429"""
+    
+    def __init__(self, rate_per_minute=RATE_LIMIT_PER_MINUTE, burst=RATE_LIMIT_BURST):
+        self.rate = rate_per_minute / 60
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def acquire(self):
+        """Block until one request may be made"""
+        while True:
+            with self.lock:
+                self.refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+    
+    def throttle(self):
+        """Empty the bucket after a 429 so every caller waits for it to refill"""
+        with self.lock:
+            self.refill()
+            self.tokens = 0
+
+# One limiter per process, shared by its fetch threads
+rate_limiter = RateLimiter()
+
+def is_rate_limited(error):
+    """Whether an API error is a 429 (APIError carries the status; the message alone may not say so)"""
+    return getattr(error, 'status_code', None) == 429 or "Too Many Requests" in str(error) or "429" in str(error)
+
+def download_bars(api_instance, tickers, start, end, max_retries=3):
+    """Download daily bars for a list of tickers in one multi-symbol request; raises once retries run out"""
     for attempt in range(max_retries):
+        # Wait for the rate limiter rather than sleeping a fixed time
+        rate_limiter.acquire()
         try:
-            end_date = end_date - timedelta(days=1)
-            start_str = start_date.strftime('%Y-%m-%d')
-            end_str = end_date.strftime('%Y-%m-%d')
-            
-            # Add delay between API calls to respect rate limits
-            if attempt > 0:
-                time.sleep(1)  # Only sleep on retries
-            
-            bars = api_instance.get_bars(
-                ticker,
+            return api_instance.get_bars(
+                list(tickers),
                 tradeapi.TimeFrame.Day,
-                start=start_str,
-                end=end_str,
-                adjustment='raw'
+                start=start.strftime('%Y-%m-%d'),
+                end=end.strftime('%Y-%m-%d'),
+                adjustment=BAR_ADJUSTMENT
             ).df
-            
-            if len(bars) > 0:
-                return bars.copy()
-            else:
-                return None
-                
         except Exception as e:
-            if "Too Many Requests" in str(e) or "429" in str(e):
-                if attempt < max_retries - 1:
-                    time.sleep(2)  # Wait longer for rate limits
-                    continue
-            return None
+            if is_rate_limited(e) and attempt < max_retries - 1:
+                rate_limiter.throttle()
+                continue
+            raise
+
+def split_bars(bars):
+    """Split a multi-symbol response into per-ticker frames shaped like a single-ticker request"""
+    if len(bars) == 0:
+        return {}
+    return {symbol: symbol_bars.drop(columns='symbol') for symbol, symbol_bars in bars.groupby('symbol', sort=False)}
+
+def bar_timestamp(day):
+    """Key that sorts before every bar of `day` (bars are stored under their ISO UTC timestamp)"""
+    return day.strftime('%Y-%m-%dT00:00:00Z')
+
+class BarStore:
+    """Daily bars on disk in one SQLite table, plus the date range already downloaded per symbol"""
+    
+    def __init__(self, path=BAR_STORE_PATH):
+        self.path = path
+        with self.connect() as db:
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS bars (symbol TEXT, timestamp TEXT, '
+                + ', '.join(f'{column} REAL' for column in BAR_COLUMNS)
+                + ', PRIMARY KEY (symbol, timestamp))'
+            )
+            db.execute('CREATE TABLE IF NOT EXISTS coverage (symbol TEXT PRIMARY KEY, first_day TEXT, last_day TEXT)')
+    
+    @contextmanager
+    def connect(self):
+        # A connection per call keeps the store safe to share between fetch threads
+        db = sqlite3.connect(self.path, timeout=30)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+    
+    def coverage(self):
+        """{symbol: (first day, last day)} of every range downloaded so far"""
+        with self.connect() as db:
+            rows = db.execute('SELECT symbol, first_day, last_day FROM coverage').fetchall()
+        return {symbol: (date.fromisoformat(first), date.fromisoformat(last)) for symbol, first, last in rows}
+    
+    def load(self, ticker, start, end):
+        """Stored bars of one ticker from start to end (inclusive), indexed like an API response"""
+        with self.connect() as db:
+            bars = pd.read_sql_query(
+                f'SELECT timestamp, {", ".join(BAR_COLUMNS)} FROM bars '
+                'WHERE symbol = ? AND timestamp >= ? AND timestamp < ? ORDER BY timestamp',
+                db,
+                params=(ticker, bar_timestamp(start), bar_timestamp(end + timedelta(days=1)))
+            )
+        bars.index = pd.DatetimeIndex(bars.pop('timestamp'), name='timestamp')
+        return bars.dropna(axis=1, how='all')  # Feeds without trade_count / vwap never had them
+    
+    def changed(self, ticker, bars):
+        """Whether freshly downloaded bars disagree with the stored closes on the same days"""
+        if len(bars) == 0:
+            return False
+        stored = self.load(ticker, bars.index.min().date(), bars.index.max().date())
+        common = stored.index.intersection(bars.index)
+        return not np.allclose(stored.loc[common, 'close'], bars.loc[common, 'close'], rtol=1e-9)
+    
+    def save(self, ticker, bars, start, end, replace=False):
+        """Store the bars downloaded for start..end; `replace` drops the ticker's older history first"""
+        rows = []
+        if len(bars) > 0:
+            values = bars.reindex(columns=BAR_COLUMNS).astype(float)
+            timestamps = bars.index.tz_convert('UTC').strftime('%Y-%m-%dT%H:%M:%SZ')
+            rows = [(ticker, timestamp, *row) for timestamp, row in zip(timestamps, values.itertuples(index=False))]
+        
+        with self.connect() as db:
+            covered = db.execute('SELECT first_day, last_day FROM coverage WHERE symbol = ?', (ticker,)).fetchone()
+            if replace:
+                db.execute('DELETE FROM bars WHERE symbol = ?', (ticker,))
+            elif covered:
+                start = min(start, date.fromisoformat(covered[0]))
+                end = max(end, date.fromisoformat(covered[1]))
+            db.executemany(f'INSERT OR REPLACE INTO bars VALUES ({", ".join("?" * (len(BAR_COLUMNS) + 2))})', rows)
+            db.execute('INSERT OR REPLACE INTO coverage VALUES (?, ?, ?)', (ticker, start.isoformat(), end.isoformat()))
+
+# One store per process, opened on first use; fetch threads share it
+bar_store = None
+bar_store_lock = threading.Lock()
+
+def get_bar_store():
+    """The process's bar store, created (with its tables) the first time it is needed"""
+    global bar_store
+    with bar_store_lock:
+        if bar_store is None:
+            bar_store = BarStore()
+        return bar_store
+
+def bar_range(start_date, end_date):
+    """First and last day of bars to analyze (the last day is the one before end_date)"""
+    return pd.Timestamp(start_date).date(), (pd.Timestamp(end_date) - timedelta(days=1)).date()
+
+def symbols_per_request(start_date, end_date):
+    """Number of symbols whose daily bars over the date range fit in one response page"""
+    trading_days = (end_date - start_date).days * TRADING_DAYS_PER_YEAR // 365 + 5  # Slack for holidays
+    return max(1, min(MAX_SYMBOLS_PER_REQUEST, BARS_PER_PAGE // trading_days))
+
+def plan_downloads(tickers, start, end):
+    """List the requests that bring the store up to date: (fetch start, fetch end, replace, tickers).
+    Tickers sharing a date range are batched into multi-symbol requests"""
+    coverage = get_bar_store().coverage()
+    groups = {}
+    for ticker in tickers:
+        covered = coverage.get(ticker)
+        if covered is None or start < covered[0]:
+            key = (start, end, True)  # Nothing usable on disk: download the whole range
+        elif end > covered[1]:
+            key = (max(start, covered[1] - timedelta(days=SPLIT_REPULL_DAYS)), end, False)
+        else:
+            continue  # Already up to date
+        groups.setdefault(key, []).append(ticker)
+    
+    downloads = []
+    for (fetch_start, fetch_end, replace), group in groups.items():
+        size = symbols_per_request(fetch_start, fetch_end)
+        downloads += [(fetch_start, fetch_end, replace, group[i:i + size]) for i in range(0, len(group), size)]
+    return downloads
+
+def store_download(api_instance, download, start, end, max_retries=3):
+    """Run one planned download and append it to the store"""
+    fetch_start, fetch_end, replace, tickers = download
+    store = get_bar_store()
+    frames = split_bars(download_bars(api_instance, tickers, fetch_start, fetch_end, max_retries))
+    for ticker in tickers:
+        bars = frames.get(ticker, pd.DataFrame())
+        if not replace and store.changed(ticker, bars):
+            # Stored history no longer matches the API: pull the whole range again
+            bars = split_bars(download_bars(api_instance, [ticker], start, end, max_retries)).get(ticker, pd.DataFrame())
+            store.save(ticker, bars, start, end, replace=True)
+        else:
+            store.save(ticker, bars, fetch_start, fetch_end, replace)
+
+def load_bars(ticker, start, end):
+    """Stored bars for a ticker, or None if there are none"""
+    bars = get_bar_store().load(ticker, start, end)
+    return bars if len(bars) > 0 else None
+
+def fetch_historical_data(api_instance, ticker, start_date, end_date, max_retries=3):
+    """Bars for one ticker, served from the bar store after downloading only what it is missing"""
+    try:
+        start, end = bar_range(start_date, end_date)
+        for download in plan_downloads([ticker], start, end):
+            store_download(api_instance, download, start, end, max_retries)
+        return load_bars(ticker, start, end)
+    except Exception as e:
+        print(f"Error fetching data for {ticker}: {e}")
+        return None
 
 def calculate_technical_indicators(df):
     """Calculate all technical indicators used in both buy and sell analysis"""
@@ -132,193 +343,301 @@ def calculate_technical_indicators(df):
         print(f"Error in indicator calculation: {e}")
         return None
 
-def calculate_buy_signals(df):
-    """Calculate buy signals using the original logic"""
-    df_with_indicators = calculate_technical_indicators(df)
-    if df_with_indicators is None:
-        return None, None, {}, None
+def bar_panel(frames, column):
+    """Stack one column of every ticker's bars into a (bar x ticker) array. Row i holds each ticker's
+    i-th bar (the same date for tickers with a full history); shorter histories are padded with NaN"""
+    panel = np.full((max(len(df) for df in frames), len(frames)), np.nan)
+    for j, df in enumerate(frames):
+        panel[:len(df), j] = df[column].to_numpy(dtype=float)
+    return panel
+
+def rolling_panel(values, window, reduce, **kwargs):
+    """Apply `reduce` over the trailing `window` rows of every column (NaN until the window is full)"""
+    out = np.full_like(values, np.nan)
+    if len(values) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+        out[window - 1:] = reduce(windows, axis=-1, **kwargs)
+    return out
+
+def ewm_panel(values, alpha, min_periods):
+    """pandas ewm(alpha=alpha, min_periods=min_periods, adjust=False).mean() down every column at once"""
+    out = np.full_like(values, np.nan)
+    weighted = np.full(values.shape[1], np.nan)
+    observations = np.zeros(values.shape[1])
+    for i, row in enumerate(values):
+        valid = ~np.isnan(row)
+        observations += valid
+        updated = ((1 - alpha) * weighted + alpha * row) / ((1 - alpha) + alpha)
+        weighted = np.where(np.isnan(weighted), row, np.where(valid, updated, weighted))
+        out[i] = np.where(observations >= min_periods, weighted, np.nan)
+    return out
+
+def ema_panel(values, window):
+    """ta EMAIndicator: span-based EWM that starts once `window` values are in"""
+    return ewm_panel(values, 2 / (window + 1), window)
+
+def rsi_panel(close, window=14):
+    """ta RSIIndicator: Wilder-smoothed average gains over average losses"""
+    diff = np.diff(close, axis=0, prepend=np.nan)
+    up = np.where(diff > 0, diff, 0.0)
+    down = np.where(diff < 0, -diff, 0.0)
+    ema_up = ewm_panel(up, 1 / window, window)
+    ema_down = ewm_panel(down, 1 / window, window)
+    return np.where(ema_down == 0, 100, 100 - 100 / (1 + ema_up / ema_down))
+
+def wilder_sums_panel(values, window):
+    """ta ADXIndicator's running sums: the first `window` values, then sum - sum / window + next value"""
+    sums = np.full((len(values) - window + 1, values.shape[1]), np.nan)
+    sums[0] = values[1:window + 1].sum(axis=0)
+    for i in range(1, len(sums) - 1):
+        sums[i] = sums[i - 1] - sums[i - 1] / window + values[window + i]
+    return sums
+
+def adx_panel(high, low, close, window=14):
+    """ta ADXIndicator.adx, including its zero-filled warm-up rows"""
+    close_shift = np.roll(close, 1, axis=0)
+    close_shift[0] = np.nan
+    true_range = wilder_sums_panel(np.maximum(high, close_shift) - np.minimum(low, close_shift), window)
     
-    try:
-        # Get latest values and statistical context
-        latest = df_with_indicators.iloc[-1]
-        recent = df_with_indicators.iloc[-5:]  # Last week of trading
+    diff_up = np.diff(high, axis=0, prepend=np.nan)
+    diff_down = -np.diff(low, axis=0, prepend=np.nan)
+    plus = wilder_sums_panel(np.abs(((diff_up > diff_down) & (diff_up > 0)) * diff_up), window)
+    minus = wilder_sums_panel(np.abs(((diff_down > diff_up) & (diff_down > 0)) * diff_down), window)
+    
+    plus_di = np.where(true_range != 0, 100 * plus / true_range, 0)
+    minus_di = np.where(true_range != 0, 100 * minus / true_range, 0)
+    di_sum = plus_di + minus_di
+    directional_index = np.where(di_sum != 0, 100 * np.abs((plus_di - minus_di) / di_sum), 0)
+    
+    adx = np.zeros((len(close), close.shape[1]))
+    if len(true_range) > window:
+        # Row i of the running sums lines up with bar i + window - 1
+        adx[2 * window - 1] = directional_index[:window].mean(axis=0)
+        for i in range(window + 1, len(true_range)):
+            adx[i + window - 1] = (adx[i + window - 2] * (window - 1) + directional_index[i - 1]) / window
+    return adx
+
+def calculate_panel_indicators(frames):
+    """Calculate calculate_technical_indicators' columns for many tickers at once; returns {ticker: frame or None}.
+    Every indicator runs once over (bar x ticker) arrays instead of once per ticker"""
+    results = {ticker: None for ticker in frames}
+    usable = {ticker: df for ticker, df in frames.items() if df is not None and len(df) >= 30}
+    if not usable:
+        return results
+    
+    tickers = list(usable)
+    bars = list(usable.values())
+    close, high, low, volume = (bar_panel(bars, column) for column in ('close', 'high', 'low', 'volume'))
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Verify data quality
+        valid = (np.nanmin(high, axis=0) > 0) & (np.nanmin(low, axis=0) > 0) & (np.nanmin(close, axis=0) > 0)
+        valid &= ~(high < low).any(axis=0)
+        
+        indicators = {}
+        
+        # Price volatility and trend metrics
+        previous_close = np.roll(close, 1, axis=0)
+        previous_close[0] = np.nan
+        indicators['Daily_Return'] = close / previous_close - 1
+        indicators['Volatility_20d'] = rolling_panel(indicators['Daily_Return'], 20, np.std, ddof=1) * np.sqrt(252)  # Annualized
+        indicators['Price_Range'] = (high - low) / close  # Daily price range as percentage
         
         # Volume analysis
-        recent_volume_trend = recent['Volume_Ratio'].mean()
-        volume_consistency = (recent['Volume_Ratio'] > 1.2).sum() >= 3  # High volume in 3 of last 5 days
-        
-        # Volatility context
-        current_volatility = latest['Volatility_20d']
-        avg_volatility = df_with_indicators['Volatility_20d'].mean()
-        volatility_ratio = current_volatility / avg_volatility
-        
-        # Price trend strength
-        price_trend = (latest['close'] / df_with_indicators['close'].iloc[-5] - 1) * 100  # 5-day price trend
-        trend_consistency = (df_with_indicators['Daily_Return'].iloc[-5:] > 0).sum() >= 3  # Positive returns in 3 of last 5 days
-        
-        # Calculate metrics
-        signal_metrics = {
-            'RSI': latest['RSI'],
-            'MACD_diff': latest['MACD_diff'],
-            'BB_position': (latest['close'] - latest['BB_lower']) / (latest['BB_upper'] - latest['BB_lower']),
-            'BB_width': latest['BB_width'],
-            'Stoch_k': latest['Stoch_k'],
-            'ADX': latest['ADX'],
-            'Volume_trend': (latest['Volume_MA5'] / latest['Volume_MA20'] - 1) * 100,
-            'Volatility': current_volatility,
-            'Price_trend': price_trend,
-            'EMA_alignment': bool((latest['EMA20'] > latest['EMA50']) and (latest['close'] > latest['EMA20']))
-        }
+        indicators['Volume_MA5'] = rolling_panel(volume, 5, np.mean)
+        indicators['Volume_MA20'] = rolling_panel(volume, 20, np.mean)
+        indicators['Volume_Ratio'] = volume / indicators['Volume_MA20']
+        indicators['Volume_Trend'] = indicators['Volume_MA5'] / indicators['Volume_MA20']
         
-        # Enhanced signal conditions
-        oversold = bool(latest['RSI'] < 40)  # More generous RSI threshold for oversold
-        momentum_shift = bool(latest['MACD_diff'] > 0.05)  # More achievable momentum requirement
-        volume_confirmation = bool(recent_volume_trend > 1.2 and volume_consistency)  # Reasonable volume threshold
-        trend_strength = bool(latest['ADX'] > 20)  # Standard trend strength
-        price_support = bool(latest['close'] < latest['BB_lower'] * 1.05)  # More realistic support level
-        volatility_favorable = bool(0.6 < volatility_ratio < 2.0)  # More accommodating volatility range
-        
-        # Calculate probability with statistical context
-        probability = 0
-        
-        # Price action (30 points max)
-        probability += 15 if price_support else (10 if latest['close'] < latest['BB_lower'] * 1.08 else 0)
-        probability += 15 if trend_consistency and price_trend > 0 else (10 if price_trend > -2 else 0)
-        
-        # Momentum (25 points max)
-        probability += 15 if latest['RSI'] < 40 else (10 if latest['RSI'] < 45 else 0)
-        probability += 10 if latest['MACD_diff'] > 0.05 else (5 if latest['MACD_diff'] > -0.02 else 0)
-        
-        # Volume (25 points max)
-        probability += 15 if recent_volume_trend > 1.2 and volume_consistency else (10 if recent_volume_trend > 1.0 else 0)
-        probability += 10 if signal_metrics['Volume_trend'] > 5 else (5 if signal_metrics['Volume_trend'] > 0 else 0)
-        
-        # Technical strength (20 points max)
-        probability += 10 if latest['ADX'] > 20 else (5 if latest['ADX'] > 15 else 0)
-        probability += 10 if signal_metrics['EMA_alignment'] else (5 if latest['close'] > latest['EMA50'] else 0)
-        
-        # Final signal - more balanced criteria
-        signal = bool(
-            probability >= 65 and  # More achievable probability threshold
-            (
-                (oversold and (momentum_shift or price_support)) or  # Need oversold + one confirmation
-                (trend_strength and (volume_confirmation or volatility_favorable)) or  # Need trend + one confirmation
-                (price_support and volume_confirmation) or  # Classic support bounce setup
-                (momentum_shift and trend_strength and volatility_favorable)  # Strong technical setup
-            )
-        )
+        # Technical indicators
+        indicators['RSI'] = rsi_panel(close)
+        indicators['MACD'] = ema_panel(close, 12) - ema_panel(close, 26)
+        indicators['MACD_signal'] = ema_panel(indicators['MACD'], 9)
+        indicators['MACD_diff'] = indicators['MACD'] - indicators['MACD_signal']
         
-        return signal, probability, signal_metrics, latest['close']
+        bb_middle = rolling_panel(close, 20, np.mean)
+        bb_deviation = rolling_panel(close, 20, np.std, ddof=0)
+        indicators['BB_upper'] = bb_middle + 2 * bb_deviation
+        indicators['BB_lower'] = bb_middle - 2 * bb_deviation
+        indicators['BB_middle'] = bb_middle
+        indicators['BB_width'] = (indicators['BB_upper'] - indicators['BB_lower']) / bb_middle
         
+        lowest = rolling_panel(low, 14, np.min)
+        highest = rolling_panel(high, 14, np.max)
+        indicators['Stoch_k'] = 100 * (close - lowest) / (highest - lowest)
+        indicators['ADX'] = adx_panel(high, low, close)
+        indicators['EMA20'] = ema_panel(close, 20)
+        indicators['EMA50'] = ema_panel(close, 50)
+    
+    # Split the panel back into one frame per ticker (one 2-D block each)
+    names = list(indicators)
+    stacked = np.stack([indicators[name] for name in names], axis=-1)
+    for j, (ticker, df) in enumerate(zip(tickers, bars)):
+        if valid[j]:
+            columns = pd.DataFrame(stacked[:len(df), j], index=df.index, columns=names)
+            results[ticker] = pd.concat([df, columns], axis=1)
+    return results
+
+def signal_metrics(df, signal_type):
+    """Metrics reported alongside a signal, read from the last bar"""
+    latest = df.iloc[-1]
+    return {
+        'RSI': latest['RSI'],
+        'MACD_diff': latest['MACD_diff'],
+        'BB_position': (latest['close'] - latest['BB_lower']) / (latest['BB_upper'] - latest['BB_lower']),
+        'BB_width': latest['BB_width'],
+        'Stoch_k': latest['Stoch_k'],
+        'ADX': latest['ADX'],
+        'Volume_trend': (latest['Volume_MA5'] / latest['Volume_MA20'] - 1) * 100,
+        'Volatility': latest['Volatility_20d'],
+        'Price_trend': (latest['close'] / df['close'].iloc[-5] - 1) * 100,  # 5-day price trend
+        'EMA_alignment': bool(ema_alignment(df, signal_type).iloc[-1])
+    }
+
+def latest_signal(df, signal_type):
+    """Signal, probability, metrics and close of the last bar, from the same rules the backtest uses"""
+    signal, probability = SIGNAL_SERIES[signal_type](df)
+    return bool(signal.iloc[-1]), int(probability.iloc[-1]), signal_metrics(df, signal_type), df['close'].iloc[-1]
+
+def calculate_buy_signals(df, df_with_indicators=None):
+    """Calculate buy signals for the latest bar (indicators are calculated unless given)"""
+    if df_with_indicators is None:
+        df_with_indicators = calculate_technical_indicators(df)
+    if df_with_indicators is None:
+        return None, None, {}, None
+    
+    try:
+        return latest_signal(df_with_indicators, 'buy')
     except Exception as e:
         print(f"Error in buy signal calculation: {e}")
         return None, None, {}, None
 
 def calculate_sell_signals(df):
-    """Calculate sell signals using inverted logic for overbought/weakening conditions"""
+    """Calculate sell signals for the latest bar using inverted logic for overbought/weakening conditions"""
     df_with_indicators = calculate_technical_indicators(df)
     if df_with_indicators is None:
         return None, None, {}, None
     
     try:
-        # Get latest values and statistical context
-        latest = df_with_indicators.iloc[-1]
-        recent = df_with_indicators.iloc[-5:]  # Last week of trading
-        
-        # Volume analysis
-        recent_volume_trend = recent['Volume_Ratio'].mean()
-        volume_confirmation = (recent['Volume_Ratio'] > 1.2).sum() >= 3  # High volume in 3 of last 5 days
-        
-        # Volatility context
-        current_volatility = latest['Volatility_20d']
-        avg_volatility = df_with_indicators['Volatility_20d'].mean()
-        volatility_ratio = current_volatility / avg_volatility
-        
-        # Price trend strength (for sells, we look for weakness)
-        price_trend = (latest['close'] / df_with_indicators['close'].iloc[-5] - 1) * 100  # 5-day price trend
-        trend_weakness = (df_with_indicators['Daily_Return'].iloc[-5:] < 0).sum() >= 3  # Negative returns in 3 of last 5 days
-        
-        # Calculate metrics
-        signal_metrics = {
-            'RSI': latest['RSI'],
-            'MACD_diff': latest['MACD_diff'],
-            'BB_position': (latest['close'] - latest['BB_lower']) / (latest['BB_upper'] - latest['BB_lower']),
-            'BB_width': latest['BB_width'],
-            'Stoch_k': latest['Stoch_k'],
-            'ADX': latest['ADX'],
-            'Volume_trend': (latest['Volume_MA5'] / latest['Volume_MA20'] - 1) * 100,
-            'Volatility': current_volatility,
-            'Price_trend': price_trend,
-            'EMA_alignment': bool((latest['EMA20'] < latest['EMA50']) and (latest['close'] < latest['EMA20']))
-        }
-        
-        # Sell signal conditions (opposite of buy signals)
-        overbought = bool(latest['RSI'] > 70)  # Overbought condition
-        severe_overbought = bool(latest['RSI'] > 80)  # Severely overbought
-        momentum_declining = bool(latest['MACD_diff'] < -0.05)  # Declining momentum
-        weak_momentum = bool(latest['MACD_diff'] < 0)  # Weak momentum
-        volume_selling = bool(recent_volume_trend > 1.2 and volume_confirmation)  # High volume (could be selling)
-        trend_strong = bool(latest['ADX'] > 20)  # Strong trend (good for breakouts either way)
-        price_resistance = bool(latest['close'] > latest['BB_upper'] * 0.95)  # Near resistance
-        volatility_high = bool(volatility_ratio > 1.5)  # High volatility might indicate uncertainty
-        
-        # Calculate sell probability 
-        probability = 0
-        
-        # Price action weakness (30 points max)
-        probability += 20 if price_resistance else (10 if latest['close'] > latest['BB_upper'] * 0.97 else 0)
-        probability += 15 if trend_weakness and price_trend < 0 else (10 if price_trend < -1 else 0)
-        
-        # Momentum weakness (25 points max)
-        probability += 20 if severe_overbought else (15 if overbought else (10 if latest['RSI'] > 60 else 0))
-        probability += 10 if momentum_declining else (5 if weak_momentum else 0)
-        
-        # Volume concerns (25 points max)
-        probability += 15 if volume_selling and trend_weakness else (10 if volume_selling else 0)
-        probability += 10 if signal_metrics['Volume_trend'] > 10 else (5 if signal_metrics['Volume_trend'] > 5 else 0)
-        
-        # Technical weakness (20 points max)
-        probability += 10 if trend_strong and momentum_declining else (5 if trend_strong else 0)
-        probability += 10 if signal_metrics['EMA_alignment'] else (5 if latest['close'] < latest['EMA20'] else 0)
-        
-        # Final sell signal
-        sell_signal = bool(
-            probability >= 60 and  # Sell threshold (slightly lower than buy)
-            (
-                (overbought and (momentum_declining or price_resistance)) or  # Overbought + confirmation
-                (trend_strong and volume_selling and trend_weakness) or  # Strong selling pressure
-                (price_resistance and volume_selling) or  # Resistance rejection with volume
-                (severe_overbought and volatility_high)  # Extreme overbought with volatility
-            )
-        )
-        
-        return sell_signal, probability, signal_metrics, latest['close']
-        
+        return latest_signal(df_with_indicators, 'sell')
     except Exception as e:
         print(f"Error in sell signal calculation: {e}")
         return None, None, {}, None
 
-def backtest_signal(df, signal_type='buy'):
-    """Backtest signals with appropriate logic for buy or sell"""
+def signal_context(df):
+    """Calculate the rolling context each bar's signal sees, looking back from that bar only"""
+    daily_return = df['Daily_Return']
+    volume_ratio = df['Volume_Ratio']
+    return {
+        'recent_volume_trend': volume_ratio.rolling(5, min_periods=1).mean(),  # Last week of trading
+        'volume_consistency': (volume_ratio > 1.2).rolling(5, min_periods=1).sum() >= 3,
+        'volatility_ratio': df['Volatility_20d'] / df['Volatility_20d'].expanding().mean(),  # Against the history so far
+        'price_trend': (df['close'] / df['close'].shift(4) - 1) * 100,  # 5-day price trend
+        'up_days': (daily_return > 0).rolling(5, min_periods=1).sum(),
+        'down_days': (daily_return < 0).rolling(5, min_periods=1).sum(),
+        'volume_trend': (df['Volume_MA5'] / df['Volume_MA20'] - 1) * 100
+    }
+
+def ema_alignment(df, signal_type):
+    """Whether EMA20 and price are both on the signal's side of EMA50 / EMA20 at every bar"""
+    if signal_type == 'buy':
+        return (df['EMA20'] > df['EMA50']) & (df['close'] > df['EMA20'])
+    return (df['EMA20'] < df['EMA50']) & (df['close'] < df['EMA20'])
+
+def buy_signal_series(df):
+    """Evaluate the buy probability and signal at every bar at once (enhanced signal conditions)"""
+    ctx = signal_context(df)
+    close = df['close']
+    rsi = df['RSI']
+    macd_diff = df['MACD_diff']
+    adx = df['ADX']
+    
+    oversold = rsi < 40
+    momentum_shift = macd_diff > 0.05
+    volume_confirmation = (ctx['recent_volume_trend'] > 1.2) & ctx['volume_consistency']
+    trend_strength = adx > 20
+    price_support = close < df['BB_lower'] * 1.05
+    volatility_favorable = (ctx['volatility_ratio'] > 0.6) & (ctx['volatility_ratio'] < 2.0)
+    trend_consistency = ctx['up_days'] >= 3
+    
+    probability = (
+        np.select([price_support, close < df['BB_lower'] * 1.08], [15, 10], 0) +
+        np.select([trend_consistency & (ctx['price_trend'] > 0), ctx['price_trend'] > -2], [15, 10], 0) +
+        np.select([oversold, rsi < 45], [15, 10], 0) +
+        np.select([momentum_shift, macd_diff > -0.02], [10, 5], 0) +
+        np.select([volume_confirmation, ctx['recent_volume_trend'] > 1.0], [15, 10], 0) +
+        np.select([ctx['volume_trend'] > 5, ctx['volume_trend'] > 0], [10, 5], 0) +
+        np.select([trend_strength, adx > 15], [10, 5], 0) +
+        np.select([ema_alignment(df, 'buy'), close > df['EMA50']], [10, 5], 0)
+    )
+    probability = pd.Series(probability, index=df.index)
+    
+    signal = (probability >= 65) & (
+        (oversold & (momentum_shift | price_support)) |
+        (trend_strength & (volume_confirmation | volatility_favorable)) |
+        (price_support & volume_confirmation) |
+        (momentum_shift & trend_strength & volatility_favorable)
+    )
+    return signal, probability
+
+def sell_signal_series(df):
+    """Evaluate the sell probability and signal at every bar at once (opposite of the buy conditions)"""
+    ctx = signal_context(df)
+    close = df['close']
+    rsi = df['RSI']
+    macd_diff = df['MACD_diff']
+    
+    overbought = rsi > 70
+    severe_overbought = rsi > 80
+    momentum_declining = macd_diff < -0.05
+    weak_momentum = macd_diff < 0
+    volume_selling = (ctx['recent_volume_trend'] > 1.2) & ctx['volume_consistency']
+    trend_strong = df['ADX'] > 20
+    price_resistance = close > df['BB_upper'] * 0.95
+    volatility_high = ctx['volatility_ratio'] > 1.5
+    trend_weakness = ctx['down_days'] >= 3
+    
+    probability = (
+        np.select([price_resistance, close > df['BB_upper'] * 0.97], [20, 10], 0) +
+        np.select([trend_weakness & (ctx['price_trend'] < 0), ctx['price_trend'] < -1], [15, 10], 0) +
+        np.select([severe_overbought, overbought, rsi > 60], [20, 15, 10], 0) +
+        np.select([momentum_declining, weak_momentum], [10, 5], 0) +
+        np.select([volume_selling & trend_weakness, volume_selling], [15, 10], 0) +
+        np.select([ctx['volume_trend'] > 10, ctx['volume_trend'] > 5], [10, 5], 0) +
+        np.select([trend_strong & momentum_declining, trend_strong], [10, 5], 0) +
+        np.select([ema_alignment(df, 'sell'), close < df['EMA20']], [10, 5], 0)
+    )
+    probability = pd.Series(probability, index=df.index)
+    
+    signal = (probability >= 60) & (
+        (overbought & (momentum_declining | price_resistance)) |
+        (trend_strong & volume_selling & trend_weakness) |
+        (price_resistance & volume_selling) |
+        (severe_overbought & volatility_high)
+    )
+    return signal, probability
+
+SIGNAL_SERIES = {
+    'buy': buy_signal_series,
+    'sell': sell_signal_series
+}
+
+def backtest_signal(df, signal_type='buy', df_with_indicators=None):
+    """Backtest signals with appropriate logic for buy or sell (indicators are calculated unless given)"""
     if df is None or len(df) < 30:
         return False, 0, 0
     
     try:
-        # Calculate all indicators once
-        df_with_indicators = calculate_technical_indicators(df)
+        # Calculate all indicators once; every indicator only looks back, so each bar's signal
+        # is the one calculate_buy_signals / calculate_sell_signals reports on that day
+        if df_with_indicators is None:
+            df_with_indicators = calculate_technical_indicators(df)
         if df_with_indicators is None:
             return False, 0, 0
             
-        # Calculate signals for each point
-        signals = pd.Series(False, index=df_with_indicators.index)
-        
-        for i in range(30, len(df_with_indicators)):
-            historical_df = df_with_indicators.iloc[:i+1].copy()
-            if signal_type == 'buy':
-                signal, _, _, _ = calculate_buy_signals(historical_df)
-            else:  # sell
-                signal, _, _, _ = calculate_sell_signals(historical_df)
-            signals.iloc[i] = bool(signal) if signal is not None else False
+        # Evaluate the signal at every bar, skipping the first 30 bars of warm-up
+        signals, _ = SIGNAL_SERIES[signal_type](df_with_indicators)
+        signals.iloc[:30] = False
         
         # Assign signals and calculate returns
         df_with_indicators.loc[:, 'Signal'] = signals
@@ -360,12 +679,16 @@ def backtest_signal(df, signal_type='buy'):
 
 def analyze_stock_for_buy(ticker, start_date, end_date, api_instance):
     """Analyze a single stock for buy signals"""
+    df = fetch_historical_data(api_instance, ticker, start_date, end_date)
+    return analyze_bars_for_buy(ticker, df)
+
+def analyze_bars_for_buy(ticker, df, df_with_indicators=None):
+    """Analyze already-fetched bars (and optionally their indicators) of a single stock for buy signals"""
     try:
         # Initialize result with ticker
         result = {'Ticker': ticker}
         
-        # Fetch and analyze data
-        df = fetch_historical_data(api_instance, ticker, start_date, end_date)
+        # Analyze data
         if df is None or len(df) < 30:
             result.update({
                 'Data_Available': 'No',
@@ -373,7 +696,7 @@ def analyze_stock_for_buy(ticker, start_date, end_date, api_instance):
             })
             return result
 
-        signal, probability, metrics, close = calculate_buy_signals(df)
+        signal, probability, metrics, close = calculate_buy_signals(df, df_with_indicators)
         if signal is None:
             result.update({
                 'Data_Available': 'No',
@@ -381,7 +704,7 @@ def analyze_stock_for_buy(ticker, start_date, end_date, api_instance):
             })
             return result
             
-        backtest_success, win_rate, avg_return = backtest_signal(df, 'buy')
+        backtest_success, win_rate, avg_return = backtest_signal(df, 'buy', df_with_indicators)
         
         # Record ALL metrics
         result.update({
@@ -467,7 +790,93 @@ def analyze_stock_for_sell(ticker, start_date, end_date, api_instance):
             'Reason': str(e)
         }
 
-def run_buy_analysis():
+def analyze_buy_task(task):
+    """Pool worker: analyze one (ticker, bars) pair for buy signals"""
+    ticker, df = task
+    return analyze_bars_for_buy(ticker, df)
+
+def fetch_bars_threaded(tickers, start_date, end_date, threads=SCAN_FETCH_THREADS):
+    """Bring the bar store up to date in multi-symbol requests on a bounded thread pool,
+    yielding (ticker, bars) as each request finishes"""
+    local = threading.local()
+    start, end = bar_range(start_date, end_date)
+    downloads = plan_downloads(tickers, start, end)
+    
+    # Tickers already up to date come straight from disk
+    pending = {ticker for download in downloads for ticker in download[3]}
+    for ticker in tickers:
+        if ticker not in pending:
+            yield ticker, load_bars(ticker, start, end)
+    
+    def fetch(download):
+        # One API connection per thread
+        if not hasattr(local, 'api'):
+            local.api = get_api()
+        try:
+            store_download(local.api, download, start, end)
+        except Exception as e:
+            print(f"Error fetching data for {', '.join(download[3])}: {e}")
+            return {ticker: None for ticker in download[3]}
+        return {ticker: load_bars(ticker, start, end) for ticker in download[3]}
+    
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [executor.submit(fetch, download) for download in downloads]
+        for future in as_completed(futures):
+            yield from future.result().items()
+
+def print_strong_buy(result, write=print):
+    """Print a strong buy alert (>65% probability AND >60% win rate); returns whether it was one"""
+    if not (result.get('Signal_Active') == 'Yes' and 
+            result.get('Backtest_Support') == 'Yes' and
+            result.get('Signal_Probability', 0) > 65 and
+            result.get('Win_Rate', 0) > 60):
+        return False
+    
+    ticker = result['Ticker']
+    probability = result.get('Signal_Probability', 0)
+    win_rate = result.get('Win_Rate', 0)
+    price = result.get('Close', 0)
+    
+    write(f"\n📊 {ticker} Analysis:")
+    write(f"   Current Price: ${price:.2f}")
+    write(f"   Recommendation: STRONG BUY")
+    write(f"   Buy Probability: {probability:.1f}%")
+    write(f"   Historical Win Rate: {win_rate:.1f}%")
+    write(f"   RSI: {result.get('RSI', 'N/A')}")
+    write(f"   MACD: {result.get('MACD_Differential', 'N/A')}")
+    write(f"   ADX: {result.get('ADX', 'N/A')}")
+    write(f"   Volume Trend: {result.get('Volume_Trend', 'N/A')}%")
+    write(f"   🟢 STRONG BUY SIGNAL - Consider buying {ticker}")
+    return True
+
+def scan_serial(tickers, start_date, end_date):
+    """Analyze tickers one at a time, yielding each result"""
+    # Initialize API
+    api = tradeapi.REST(API_KEY, API_SECRET, BASE_URL, api_version='v2')
+    
+    for ticker in tickers:
+        yield analyze_stock_for_buy(ticker, start_date, end_date, api)
+
+def scan_parallel(tickers, start_date, end_date, processes=None, threads=SCAN_FETCH_THREADS):
+    """Fetch bars on a thread pool and analyze them on a process pool, yielding results as they finish"""
+    bars = fetch_bars_threaded(tickers, start_date, end_date, threads)
+    with Pool(processes or cpu_count(), initializer=init_worker) as pool:
+        yield from pool.imap_unordered(analyze_buy_task, bars)
+
+def scan_panel(tickers, start_date, end_date, threads=SCAN_FETCH_THREADS):
+    """Fetch every ticker's bars, calculate all indicators in one panel pass, then score each stock"""
+    bars = dict(fetch_bars_threaded(tickers, start_date, end_date, threads))
+    indicators = calculate_panel_indicators(bars)
+    for ticker in tickers:
+        yield analyze_bars_for_buy(ticker, bars[ticker], indicators[ticker])
+
+SCAN_MODES = {
+    'serial': scan_serial,
+    'parallel': scan_parallel,
+    'panel': scan_panel
+}
+
+def run_buy_analysis(mode='panel'):
     """Run the buy analysis for all S&P 500 stocks"""
     print("\n=== S&P 500 BUY Opportunities Analyzer ===")
     
@@ -479,46 +888,24 @@ def run_buy_analysis():
     start_date = end_date - timedelta(days=365)
     
     print(f"\nAnalyzing {len(tickers)} stocks for BUY opportunities...")
-
-    # Initialize API
-    api = tradeapi.REST(API_KEY, API_SECRET, BASE_URL, api_version='v2')
     
     # Store all results
     all_results = []
-    total = len(tickers)
     strong_buy_count = 0
+    scan = SCAN_MODES[mode]
     
-    for idx, ticker in enumerate(tickers, 1):
-        print(f"\rProgress: {ticker} ({idx}/{total})", end="", flush=True)
-        
-        result = analyze_stock_for_buy(ticker, start_date, end_date, api)
-        
-        # Check for strong buy signals (>65% probability AND >60% win rate)
-        if (result.get('Signal_Active') == 'Yes' and 
-            result.get('Backtest_Support') == 'Yes' and
-            result.get('Signal_Probability', 0) > 65 and
-            result.get('Win_Rate', 0) > 60):
+    with tqdm(total=len(tickers), desc="Scanning", unit="stock") as progress:
+        for result in scan(tickers, start_date, end_date):
+            progress.set_postfix_str(result['Ticker'])
+            progress.update()
             
-            strong_buy_count += 1
-            probability = result.get('Signal_Probability', 0)
-            win_rate = result.get('Win_Rate', 0)
-            price = result.get('Close', 0)
+            if print_strong_buy(result, tqdm.write):
+                strong_buy_count += 1
             
-            print(f"\n\n📊 {ticker} Analysis:")
-            print(f"   Current Price: ${price:.2f}")
-            print(f"   Recommendation: STRONG BUY")
-            print(f"   Buy Probability: {probability:.1f}%")
-            print(f"   Historical Win Rate: {win_rate:.1f}%")
-            print(f"   RSI: {result.get('RSI', 'N/A')}")
-            print(f"   MACD: {result.get('MACD_Differential', 'N/A')}")
-            print(f"   ADX: {result.get('ADX', 'N/A')}")
-            print(f"   Volume Trend: {result.get('Volume_Trend', 'N/A')}%")
-            print(f"   🟢 STRONG BUY SIGNAL - Consider buying {ticker}")
-        
-        all_results.append(result)
+            all_results.append(result)
     
     # Analysis complete
-    print(f"\n\n=== BUY Analysis Complete ===")
+    print(f"\n=== BUY Analysis Complete ===")
     print(f"Total stocks analyzed: {len(all_results)}")
     print(f"Strong BUY signals found: {strong_buy_count}")
     
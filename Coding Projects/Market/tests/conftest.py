@@ -0,0 +1,64 @@
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+RECORDED = Path(__file__).parent / 'recorded'
+
+# app.py exits at import without credentials; the tests never reach the trading API
+os.environ.setdefault('ALPACA_API_KEY', 'test-key')
+os.environ.setdefault('ALPACA_API_SECRET', 'test-secret')
+os.environ.setdefault('ALPACA_API_BASE_URL', 'https://paper-api.alpaca.markets')
+os.environ['APCA_RETRY_MAX'] = '0'  # As app.py sets by default, even if the shell sets it
+os.environ['BAR_STORE_PATH'] = os.path.join(tempfile.mkdtemp(), 'bars.db')
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+def recorded(name):
+    return (RECORDED / name).read_bytes()
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """Replays the recorded /v2/stocks/bars pages: a 429 first, then the page named by page_token"""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        server = self.server
+        with server.lock:
+            server.requests.append((url.path, query))
+            rate_limited = server.rate_limit_first
+            server.rate_limit_first = False
+
+        if rate_limited:
+            status, body = 429, recorded('rate_limited.json')
+        elif url.path != '/v2/stocks/bars':
+            status, body = 404, b'{"message": "not found"}'
+        elif 'page_token' in query:
+            status, body = 200, recorded('bars_page2.json')
+        else:
+            status, body = 200, recorded('bars_page1.json')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+@pytest.fixture
+def data_api(monkeypatch):
+    """Local data API serving the recorded pages through APCA_API_DATA_URL"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ReplayHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.rate_limit_first = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv('APCA_API_DATA_URL', f'http://127.0.0.1:{server.server_port}')
+    yield server
+    server.shutdown()
+    server.server_close()
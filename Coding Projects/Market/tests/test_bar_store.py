@@ -0,0 +1,69 @@
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+import app
+
+START = date(2024, 1, 1)
+SPLIT_DAY = date(2024, 3, 1)
+
+def history(end, split=None):
+    """Split-adjusted daily bars for AAPL up to `end`, as the API would return them"""
+    index = pd.bdate_range(START, end, tz='UTC', name='timestamp') + pd.Timedelta(hours=5)
+    close = pd.Series(range(100, 100 + len(index)), index=index, dtype=float)
+    volume = pd.Series(1e6, index=index)
+    if split:
+        # A 2-for-1 split restates every earlier bar
+        before = index < pd.Timestamp(split, tz='UTC')
+        close[before] /= 2
+        volume[before] *= 2
+    return pd.DataFrame({'open': close, 'high': close, 'low': close, 'close': close, 'volume': volume, 'symbol': 'AAPL'})
+
+class FakeApi:
+    """Serves get_bars from a fixed history and records each request"""
+
+    def __init__(self, bars):
+        self.bars = bars
+        self.requests = []
+
+    def get_bars(self, symbols, timeframe, start, end, adjustment):
+        self.requests.append((start, end, adjustment))
+        days = self.bars.index.tz_convert(None).normalize()
+        bars = self.bars[(days >= pd.Timestamp(start)) & (days <= pd.Timestamp(end))]
+        return type('Bars', (), {'df': bars[bars['symbol'].isin(symbols)]})()
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = app.BarStore(str(tmp_path / 'bars.db'))
+    monkeypatch.setattr(app, 'bar_store', store)
+    return store
+
+def update(api, end):
+    for download in app.plan_downloads(['AAPL'], START, end):
+        app.store_download(api, download, START, end)
+    return app.load_bars('AAPL', START, end)
+
+def test_update_appends_new_days(store):
+    first_end, end = SPLIT_DAY - timedelta(days=10), SPLIT_DAY + timedelta(days=10)
+    update(FakeApi(history(first_end)), first_end)
+
+    api = FakeApi(history(end))
+    bars = update(api, end)
+
+    assert len(api.requests) == 1
+    assert api.requests[0][0] == (first_end - timedelta(days=app.SPLIT_REPULL_DAYS)).strftime('%Y-%m-%d')
+    assert bars['close'].tolist() == history(end)['close'].tolist()
+
+def test_split_restates_overlap_and_repulls_history(store):
+    first_end, end = SPLIT_DAY - timedelta(days=10), SPLIT_DAY + timedelta(days=10)
+    update(FakeApi(history(first_end)), first_end)
+
+    api = FakeApi(history(end, split=SPLIT_DAY))
+    bars = update(api, end)
+
+    # The incremental pull sees restated closes and triggers a full re-pull
+    assert len(api.requests) == 2
+    assert api.requests[1][0] == START.strftime('%Y-%m-%d')
+    assert all(adjustment == app.BAR_ADJUSTMENT for _, _, adjustment in api.requests)
+    assert bars['close'].tolist() == history(end, split=SPLIT_DAY)['close'].tolist()
@@ -0,0 +1,112 @@
+import json
+import time
+from datetime import date
+
+import pandas as pd
+import pytest
+from alpaca_trade_api.rest import APIError
+
+import app
+from conftest import RECORDED
+
+SYMBOLS = ['AAPL', 'MSFT', 'NVDA']
+START = date(2024, 1, 2)
+END = date(2024, 1, 8)
+
+def recorded_closes(symbol):
+    pages = [json.loads((RECORDED / name).read_text()) for name in ('bars_page1.json', 'bars_page2.json')]
+    return [bar['c'] for page in pages for bar in page['bars'].get(symbol, [])]
+
+@pytest.fixture
+def fast_limiter(monkeypatch):
+    """Swap the module limiter for a fast one that counts throttles"""
+    limiter = app.RateLimiter(rate_per_minute=6000, burst=1)
+    limiter.throttles = 0
+    throttle = limiter.throttle
+    def counting_throttle():
+        limiter.throttles += 1
+        throttle()
+    limiter.throttle = counting_throttle
+    monkeypatch.setattr(app, 'rate_limiter', limiter)
+    return limiter
+
+def test_download_bars_retries_429_and_follows_pages(data_api, fast_limiter):
+    bars = app.download_bars(app.get_api(), SYMBOLS, START, END)
+
+    # One 429, then both pages of the retried request
+    assert len(data_api.requests) == 3
+    assert fast_limiter.throttles == 1
+    path, query = data_api.requests[-1]
+    assert path == '/v2/stocks/bars'
+    assert query['symbols'] == ','.join(SYMBOLS)
+    assert query['adjustment'] == app.BAR_ADJUSTMENT
+    assert 'page_token' in query
+
+    assert len(bars) == 15
+    assert sorted(bars['symbol'].unique()) == SYMBOLS
+    assert bars.index.name == 'timestamp'
+
+def test_rest_client_leaves_429_retries_to_the_rate_limiter():
+    assert app.get_api()._retry == 0
+
+def test_download_bars_raises_once_retries_run_out(data_api, fast_limiter):
+    with pytest.raises(APIError) as error:
+        app.download_bars(app.get_api(), SYMBOLS, START, END, max_retries=1)
+    assert app.is_rate_limited(error.value)
+    assert len(data_api.requests) == 1
+
+def test_split_bars_joins_symbols_across_pages(data_api, fast_limiter):
+    frames = app.split_bars(app.download_bars(app.get_api(), SYMBOLS, START, END))
+
+    assert sorted(frames) == SYMBOLS
+    for symbol, frame in frames.items():
+        assert 'symbol' not in frame.columns
+        assert frame['close'].tolist() == recorded_closes(symbol)
+        assert frame.index.is_monotonic_increasing
+    # MSFT straddles the page boundary
+    assert len(frames['MSFT']) == 5
+
+def test_split_bars_empty_response():
+    assert app.split_bars(pd.DataFrame()) == {}
+
+def test_symbols_per_request_fits_one_page():
+    one_year = app.symbols_per_request(date(2024, 1, 1), date(2025, 1, 1))
+    assert one_year * (app.TRADING_DAYS_PER_YEAR + 5) <= app.BARS_PER_PAGE
+    assert app.symbols_per_request(date(2024, 1, 1), date(2024, 1, 8)) == app.MAX_SYMBOLS_PER_REQUEST
+    assert app.symbols_per_request(date(1990, 1, 1), date(2025, 1, 1)) == 1
+
+def test_plan_downloads_chunks_by_symbols_per_request():
+    start, end = date(2023, 1, 1), date(2024, 12, 31)
+    size = app.symbols_per_request(start, end)
+    tickers = [f'T{i:03d}' for i in range(2 * size + 3)]
+
+    downloads = app.plan_downloads(tickers, start, end)
+
+    assert [len(chunk) for _, _, _, chunk in downloads] == [size, size, 3]
+    assert [ticker for _, _, _, chunk in downloads for ticker in chunk] == tickers
+    assert all(download[:3] == (start, end, True) for download in downloads)
+
+def test_rate_limiter_allows_burst_then_paces():
+    limiter = app.RateLimiter(rate_per_minute=600, burst=3)  # One token every 0.1 s
+    began = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    assert time.monotonic() - began < 0.05
+
+    limiter.acquire()
+    assert time.monotonic() - began >= 0.09
+
+def test_rate_limiter_throttle_empties_bucket():
+    limiter = app.RateLimiter(rate_per_minute=600, burst=3)
+    limiter.throttle()
+    assert limiter.tokens == 0
+
+    began = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - began >= 0.09
+
+def test_fetch_historical_data_reports_errors(data_api, fast_limiter, capsys):
+    bars = app.fetch_historical_data(app.get_api(), 'AAPL', START, END, max_retries=1)
+
+    assert bars is None
+    assert 'Error fetching data for AAPL' in capsys.readouterr().out
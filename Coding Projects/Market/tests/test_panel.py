@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import app
+
+LENGTHS = [250, 249, 200, 120, 75, 31]
+
+def synthetic_bars(n, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, n)))
+    high = close * (1 + rng.uniform(0, 0.03, n))
+    low = close * (1 - rng.uniform(0, 0.03, n))
+    index = pd.date_range('2024-01-01', periods=n, freq='B', tz='UTC', name='timestamp')
+    return pd.DataFrame({
+        'open': low + (high - low) * rng.uniform(0, 1, n),
+        'high': high,
+        'low': low,
+        'close': close,
+        'volume': rng.lognormal(14, 0.5, n)
+    }, index=index)
+
+@pytest.fixture(scope='module')
+def frames():
+    frames = {f'T{seed}': synthetic_bars(LENGTHS[seed % len(LENGTHS)], seed) for seed in range(30)}
+    frames['SHORT'] = synthetic_bars(20, 100)  # Under 30 bars
+    flat = synthetic_bars(120, 101)
+    flat[['open', 'high', 'low', 'close']] = 50.0  # high == low on every bar
+    frames['FLAT'] = flat
+    invalid = synthetic_bars(120, 102)
+    invalid.iloc[60, invalid.columns.get_loc('low')] = -1.0  # Invalid price
+    frames['INVALID'] = invalid
+    frames['NONE'] = None
+    return frames
+
+@pytest.fixture(scope='module')
+def panel(frames):
+    return app.calculate_panel_indicators(frames)
+
+def test_panel_matches_ta(frames, panel):
+    assert panel.keys() == frames.keys()
+    for ticker, df in frames.items():
+        expected = app.calculate_technical_indicators(df)
+        if expected is None:
+            assert panel[ticker] is None, ticker
+            continue
+        actual = panel[ticker]
+        assert list(actual.columns) == list(expected.columns), ticker
+        assert actual.index.equals(expected.index), ticker
+        for column in expected.columns:
+            np.testing.assert_allclose(
+                actual[column].to_numpy(dtype=float), expected[column].to_numpy(dtype=float),
+                rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=f'{ticker} {column}'
+            )
+
+def test_rejected_frames(panel):
+    assert panel['SHORT'] is None
+    assert panel['INVALID'] is None
+    assert panel['NONE'] is None
+    assert panel['FLAT'] is not None
+
+@pytest.mark.parametrize('signal_type', ['buy', 'sell'])
+def test_backtest_with_panel_indicators(frames, panel, signal_type):
+    for ticker, df in frames.items():
+        if panel[ticker] is None:
+            continue
+        expected = app.backtest_signal(df, signal_type)
+        assert app.backtest_signal(df, signal_type, panel[ticker].copy()) == expected, ticker